@@ -0,0 +1,4 @@
+"""Performance benchmarks for fastapi-voyager.
+
+Run a benchmark module directly, e.g. ``python -m benchmarks.render``.
+"""
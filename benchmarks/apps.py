@@ -0,0 +1,284 @@
+"""
+Synthetic web apps for end-to-end benchmarks.
+
+Unlike `benchmarks.synthetic`, which builds analyzed-graph objects directly, this module
+generates real pydantic models and registers them as routes of a FastAPI, Litestar or
+Django Ninja app, so `Voyager.analysis` runs the same introspection as on a user's app.
+
+The shape is configurable: routes and tags, schema count and depth, inheritance,
+``ensure_subset`` schemas, pydantic-resolve ``resolve_`` / ``post_`` methods, generic
+response wrappers and an ER diagram of entities with relationships.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import types
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from itertools import count
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+from pydantic_resolve import Entity, ErDiagram, Relationship, ensure_subset
+
+FRAMEWORKS = ('fastapi', 'litestar', 'django-ninja')
+
+MODULE_ROOT = 'voyager_bench'
+
+T = TypeVar('T')
+
+# every generated app gets its own module namespace, class ids never collide across apps
+_app_counter = count()
+
+
+@dataclass
+class AppShape:
+    """Size and features of a synthetic app."""
+    routes: int = 200
+    tags: int = 10
+    schemas: int = 400
+    depth: int = 4
+    fields: int = 8
+    modules: int = 20
+    # every n-th schema inherits from a shared base schema of its module, 0 disables
+    inherit_every: int = 5
+    # every n-th schema is an ``ensure_subset`` of a schema of the same level, 0 disables
+    subset_every: int = 7
+    # every n-th route returns a generic ``Page[T]`` of its schema, 0 disables
+    generic_every: int = 4
+    # entities of the ER diagram, each with one relationship
+    entities: int = 50
+    seed: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class SyntheticApp:
+    framework: str
+    shape: AppShape
+    app: Any
+    er_diagram: ErDiagram
+    # schema ids, the same as `SchemaNode.id`, of the schemas routes return
+    route_schemas: list[str]
+    module_prefix: str
+
+
+def _module(name: str) -> types.ModuleType:
+    # generated classes get a real module, so forward ref resolution and source lookups
+    # behave as they do for models defined in files
+    module = sys.modules.get(name)
+    if module is None:
+        module = types.ModuleType(name)
+        sys.modules[name] = module
+    return module
+
+
+def _define(
+    module: str,
+    name: str,
+    bases: tuple[type, ...],
+    annotations: dict,
+    namespace: dict | None = None,
+) -> type:
+    ns = {
+        '__module__': module,
+        '__qualname__': name,
+        '__annotations__': annotations,
+        **(namespace or {}),
+    }
+    kls = type(name, bases, ns)
+    setattr(_module(module), name, kls)
+    return kls
+
+
+def _resolve_method(name: str) -> Callable:
+    def resolve(self):
+        return []
+    resolve.__name__ = resolve.__qualname__ = f'resolve_{name}'
+    return resolve
+
+
+def _post_method(name: str) -> Callable:
+    def post(self):
+        return ''
+    post.__name__ = post.__qualname__ = f'post_{name}'
+    return post
+
+
+def build_models(shape: AppShape, root: str) -> list[list[type[BaseModel]]]:
+    """
+    Schemas of ``shape`` split into ``depth`` levels, level 0 is returned by routes.
+
+    Levels are built bottom up: object fields of a level reference random schemas of the
+    next level as ``list[X]`` or ``X | None``, the first object field has a ``resolve_``
+    method and the last scalar field a ``post_`` method.
+    """
+    rnd = random.Random(shape.seed)
+    depth = max(1, shape.depth)
+    level_size = max(1, shape.schemas // depth)
+
+    bases: dict[str, type[BaseModel]] = {}
+
+    def base_of(module: str) -> type[BaseModel]:
+        if module not in bases:
+            fields = {'id': int, 'created_at': str}
+            bases[module] = _define(module, 'BaseSchema', (BaseModel,), fields)
+        return bases[module]
+
+    levels: list[list[type[BaseModel]]] = [[] for _ in range(depth)]
+    i = 0
+    for level in reversed(range(depth)):
+        size = shape.schemas - level_size * (depth - 1) if level == depth - 1 else level_size
+        children = levels[level + 1] if level + 1 < depth else []
+        for _ in range(size):
+            module = f'{root}.domain{i % shape.modules}.schema'
+            name = f'Schema{i}'
+            siblings = levels[level]
+            if shape.subset_every and i % shape.subset_every == 0 and siblings:
+                parent = rnd.choice(siblings)
+                picked = list(parent.model_fields.items())[: max(1, len(parent.model_fields) // 2)]
+                kls = _define(module, name, (BaseModel,), {k: f.annotation for k, f in picked},
+                              {k: f.default for k, f in picked if not f.is_required()})
+                levels[level].append(ensure_subset(parent)(kls))
+                i += 1
+                continue
+
+            annotations: dict[str, Any] = {}
+            namespace: dict[str, Any] = {}
+            for j in range(shape.fields):
+                field = f'field_{j}'
+                if children and j % 3 == 0:
+                    target = rnd.choice(children)
+                    annotations[field] = list[target] if j % 2 == 0 else target | None
+                    namespace[field] = [] if j % 2 == 0 else None
+                    if j == 0:
+                        namespace[f'resolve_{field}'] = _resolve_method(field)
+                else:
+                    annotations[field] = int if j % 2 else str
+            post_field = f'field_{shape.fields - 1}'
+            if annotations.get(post_field) is str:
+                namespace[post_field] = ''
+                namespace[f'post_{post_field}'] = _post_method(post_field)
+
+            inherit = shape.inherit_every and i % shape.inherit_every == 0
+            bases_ = (base_of(module),) if inherit else (BaseModel,)
+            levels[level].append(_define(module, name, bases_, annotations, namespace))
+            i += 1
+    return levels
+
+
+def build_er_diagram(shape: AppShape, root: str) -> ErDiagram:
+    """``shape.entities`` entities, each with a relationship to the next one."""
+    n = max(1, shape.entities)
+    entities: list[type[BaseModel]] = []
+    for i in range(n):
+        module = f'{root}.entity{i % max(1, shape.modules // 4)}'
+        annotations = {'id': int, 'name': str, 'owner_id': int}
+        annotations.update({f'field_{j}': str for j in range(shape.fields)})
+        entities.append(_define(module, f'Entity{i}', (BaseModel,), annotations))
+
+    async def load_by_id(keys: list[int]) -> list:
+        return [None] * len(keys)
+
+    return ErDiagram(entities=[
+        Entity(kls=kls, relationships=[
+            Relationship(
+                fk='owner_id', target=entities[(i + 1) % n], name='owner', loader=load_by_id
+            ),
+        ])
+        for i, kls in enumerate(entities)
+    ])
+
+
+def _endpoint(module: str, name: str, response: Any) -> Callable:
+    def endpoint():
+        return None
+    endpoint.__name__ = endpoint.__qualname__ = name
+    endpoint.__module__ = module
+    endpoint.__annotations__ = {'return': response}
+    return endpoint
+
+
+def _routes(shape: AppShape, root: str, levels: list[list[type[BaseModel]]]):
+    """(path, tag, endpoint, response type, schema) of each route."""
+    module = _module(f'{root}.common').__name__
+
+    class Page(BaseModel, Generic[T]):
+        items: list[T]
+        total: int
+
+    Page.__module__ = module
+    sys.modules[module].Page = Page
+
+    top = levels[0]
+    for i in range(shape.routes):
+        schema = top[i % len(top)]
+        generic = shape.generic_every and i % shape.generic_every == 0
+        response: Any = Page[schema] if generic else schema
+        api_module = _module(f'{root}.api{i % shape.modules}').__name__
+        endpoint = _endpoint(api_module, f'route_{i}', response)
+        yield f'/r{i}', f't{i % max(1, shape.tags)}', endpoint, response, schema
+
+
+def _fastapi_app(routes) -> Any:
+    from fastapi import FastAPI
+
+    app = FastAPI()
+    for path, tag, endpoint, response, _ in routes:
+        app.add_api_route(path, endpoint, methods=['GET'], response_model=response, tags=[tag])
+    return app
+
+
+def _litestar_app(routes) -> Any:
+    from litestar import Litestar, get
+
+    return Litestar(route_handlers=[
+        get(path, tags=[tag], sync_to_thread=False)(endpoint)
+        for path, tag, endpoint, _, _ in routes
+    ])
+
+
+def _django_ninja_app(routes, namespace: str) -> Any:
+    import django
+    from django.conf import settings
+
+    if not settings.configured:
+        settings.configure(INSTALLED_APPS=['ninja'], SECRET_KEY='voyager-benchmark')
+        django.setup()
+    from ninja import NinjaAPI
+
+    api = NinjaAPI(urls_namespace=namespace)
+    for path, tag, endpoint, response, _ in routes:
+        api.get(path, response=response, tags=[tag])(endpoint)
+    return api
+
+
+def build_app(framework: str, shape: AppShape | None = None) -> SyntheticApp:
+    """A new synthetic app of ``framework``, see FRAMEWORKS."""
+    if framework not in FRAMEWORKS:
+        raise ValueError(
+            f'unsupported framework: {framework}, expected one of {", ".join(FRAMEWORKS)}'
+        )
+    shape = shape or AppShape()
+    root = f'{MODULE_ROOT}{next(_app_counter)}'
+    levels = build_models(shape, root)
+    routes = list(_routes(shape, root, levels))
+
+    if framework == 'fastapi':
+        app = _fastapi_app(routes)
+    elif framework == 'litestar':
+        app = _litestar_app(routes)
+    else:
+        app = _django_ninja_app(routes, namespace=root)
+
+    return SyntheticApp(
+        framework=framework,
+        shape=shape,
+        app=app,
+        er_diagram=build_er_diagram(shape, root),
+        route_schemas=[f'{s.__module__}.{s.__qualname__}' for *_, s in routes],
+        module_prefix=f'{root}.domain0',
+    )
@@ -0,0 +1,64 @@
+"""
+Benchmark filter_graph schema / schema_field searches with and without a prebuilt GraphIndex,
+and the per-request GraphView projection for a tag selection.
+
+    python -m benchmarks.filter [--schemas 12000] [--queries 50]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+from benchmarks.synthetic import build_graph
+from fastapi_voyager.filter import filter_graph
+from fastapi_voyager.graph import GraphIndex, GraphSnapshot, GraphView
+
+
+def bench(n_schemas: int, n_queries: int) -> dict:
+    tags, routes, nodes, links = build_graph(n_schemas=n_schemas, n_routes=n_schemas // 5)
+    node_set = {n.id: n for n in nodes}
+    graph = dict(tags=tags, routes=routes, nodes=nodes, links=links, node_set=node_set)
+
+    start = time.perf_counter()
+    index = GraphIndex(GraphSnapshot(**graph))
+    index.nodes_with_field('field_0')
+    build_seconds = time.perf_counter() - start
+
+    rnd = random.Random(0)
+    queries = [
+        (rnd.choice(nodes).id, rnd.choice([None, 'field_1', 'field_11'])) for _ in range(n_queries)
+    ]
+
+    result: dict = {
+        'schemas': n_schemas,
+        'links': len(links),
+        'queries': n_queries,
+        'index_build_seconds': round(build_seconds, 4),
+    }
+    for mode, prebuilt in (('rebuild_per_call', None), ('prebuilt_index', index)):
+        start = time.perf_counter()
+        for schema, field in queries:
+            filter_graph(schema=schema, schema_field=field, index=prebuilt, **graph)
+        result[f'{mode}_ms_per_query'] = round((time.perf_counter() - start) * 1000 / n_queries, 3)
+
+    tag_names = [t.name for t in tags]
+    start = time.perf_counter()
+    for _ in range(n_queries):
+        GraphView(index, include_tags=rnd.sample(tag_names, max(1, len(tag_names) // 4)))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    result['tag_view_ms_per_projection'] = round(elapsed_ms / n_queries, 3)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--schemas', type=int, default=12000)
+    parser.add_argument('--queries', type=int, default=50)
+    args = parser.parse_args()
+    print(json.dumps(bench(args.schemas, args.queries), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark "which routes reach schema X" lookups: the precomputed `RouteReachability`
+against the upstream traversal of `filter_graph` it replaces.
+
+    python -m benchmarks.reachability [--schemas 12000] [--queries 200]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+from benchmarks.synthetic import build_graph
+from fastapi_voyager.graph import GraphIndex, GraphSnapshot, GraphView, RouteReachability
+
+
+def bench(n_schemas: int, n_queries: int) -> dict:
+    tags, routes, nodes, links = build_graph(n_schemas=n_schemas, n_routes=n_schemas // 5)
+    index = GraphIndex(GraphSnapshot(tags=tags, routes=routes, nodes=nodes, links=links))
+    view = GraphView(index)
+
+    start = time.perf_counter()
+    reachability = RouteReachability.build(index)
+    result: dict = {
+        'schemas': n_schemas,
+        'routes': len(routes),
+        'links': len(links),
+        'queries': n_queries,
+        'build_seconds': round(time.perf_counter() - start, 4),
+        'bitset_bytes': reachability.nbytes,
+    }
+
+    rnd = random.Random(0)
+    queries = [rnd.choice(nodes).id for _ in range(n_queries)]
+
+    start = time.perf_counter()
+    traversed = [{r.id for r in view.filter(schema)[1]} for schema in queries]
+    result['traversal_ms_per_query'] = round((time.perf_counter() - start) * 1000 / n_queries, 3)
+
+    start = time.perf_counter()
+    looked_up = [reachability.route_ids(schema) for schema in queries]
+    result['lookup_ms_per_query'] = round((time.perf_counter() - start) * 1000 / n_queries, 3)
+
+    assert traversed == looked_up
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--schemas', type=int, default=12000)
+    parser.add_argument('--queries', type=int, default=200)
+    args = parser.parse_args()
+    print(json.dumps(bench(args.schemas, args.queries), indent=2))
+
+
+if __name__ == '__main__':
+    main()
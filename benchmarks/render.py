@@ -0,0 +1,60 @@
+"""
+Benchmark Renderer.render_dot with Jinja2 templates vs the fast string builders, and the
+peak memory of render_dot vs render_dot_stream written to a file.
+
+    python -m benchmarks.render [--schemas 2000]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+import tracemalloc
+
+from benchmarks.synthetic import build_graph
+from fastapi_voyager.render import Renderer
+
+
+def bench(n_schemas: int, repeat: int = 3) -> dict:
+    tags, routes, nodes, links = build_graph(n_schemas=n_schemas, n_routes=n_schemas // 5)
+    result: dict = {'schemas': n_schemas, 'links': len(links)}
+    outputs = {}
+    for mode, fast_render in (('jinja', False), ('fast', True)):
+        best = float('inf')
+        for _ in range(repeat):
+            renderer = Renderer(
+                show_fields='all', show_pydantic_resolve_meta=True, fast_render=fast_render
+            )
+            start = time.perf_counter()
+            outputs[mode] = renderer.render_dot(tags, routes, nodes, links)
+            best = min(best, time.perf_counter() - start)
+        result[f'{mode}_seconds'] = round(best, 4)
+    result['identical'] = outputs['jinja'] == outputs['fast']
+    result['speedup'] = round(result['jinja_seconds'] / result['fast_seconds'], 2)
+    result['dot_mb'] = round(len(outputs['fast']) / 2**20, 2)
+    del outputs
+
+    for mode in ('render_dot', 'render_dot_stream'):
+        renderer = Renderer(show_fields='all', show_pydantic_resolve_meta=True)
+        tracemalloc.start()
+        with open(os.devnull, 'w') as f:
+            if mode == 'render_dot':
+                f.write(renderer.render_dot(tags, routes, nodes, links))
+            else:
+                f.writelines(renderer.render_dot_stream(tags, routes, nodes, links))
+        result[f'{mode}_peak_mb'] = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+        tracemalloc.stop()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--schemas', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    print(json.dumps(bench(args.schemas, args.repeat), indent=2))
+
+
+if __name__ == '__main__':
+    main()
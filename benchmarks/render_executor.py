@@ -0,0 +1,57 @@
+"""
+Benchmark rendering many tag views of one large graph inline vs in a process pool.
+
+    python -m benchmarks.render_executor [--schemas 3000] [--views 16] [--workers 4]
+
+Views are requested from ``--workers`` threads at once, like concurrent page loads.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from benchmarks.synthetic import build_graph
+from fastapi_voyager.graph import GraphIndex, GraphSnapshot
+from fastapi_voyager.render_executor import ProcessPoolRenderExecutor, RenderExecutor
+
+
+def bench(n_schemas: int, n_views: int, n_workers: int) -> dict:
+    tags, routes, nodes, links = build_graph(n_schemas=n_schemas, n_routes=n_schemas // 5)
+    index = GraphIndex(GraphSnapshot(tags, routes, nodes, links, {n.id: n for n in nodes}))
+    views = [
+        {'include_tags': [tags[i % len(tags)].name], 'show_fields': 'all'} for i in range(n_views)
+    ]
+
+    result: dict = {'schemas': n_schemas, 'views': n_views, 'workers': n_workers}
+    for mode, executor in (
+        ('inline', RenderExecutor()),
+        ('process_pool', ProcessPoolRenderExecutor(max_workers=n_workers)),
+    ):
+        render = partial(executor.render_view, index)
+        # warm up: start workers and ship the snapshot
+        with ThreadPoolExecutor(n_workers) as threads:
+            list(threads.map(render, views[:n_workers]))
+        start = time.perf_counter()
+        with ThreadPoolExecutor(n_workers) as threads:
+            outputs = list(threads.map(render, views))
+        result[f'{mode}_seconds'] = round(time.perf_counter() - start, 4)
+        result[f'{mode}_bytes'] = sum(len(o) for o in outputs)
+        executor.shutdown()
+    result['speedup'] = round(result['inline_seconds'] / result['process_pool_seconds'], 2)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--schemas', type=int, default=3000)
+    parser.add_argument('--views', type=int, default=16)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+    print(json.dumps(bench(args.schemas, args.views, args.workers), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""
+End-to-end benchmark suite on synthetic FastAPI / Litestar / Django Ninja apps.
+
+    python -m benchmarks.suite [--framework fastapi litestar django-ninja]
+                               [--routes 200] [--schemas 400] [--depth 4] ...
+                               [--output results.json]
+
+For each framework a synthetic app is generated (see `benchmarks.apps`) and the stages of
+a voyager deployment are timed: ``Voyager.collect_snapshot`` and the `GraphIndex` build
+(cold), ``Voyager.analysis`` on a new instance with warm type caches, `filter_graph` by
+schema, the two brief-mode filters, `Renderer.render_dot` of the whole graph and
+`VoyagerErDiagram.render_dot`.
+
+Results are printed, or written with ``--output``, as JSON: the environment, the app
+shape and one entry per framework. Times are seconds, best of ``--repeat`` runs where a
+stage is repeated. Frameworks that are not installed are reported as skipped.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import time
+from collections.abc import Callable
+from dataclasses import fields
+
+from benchmarks.apps import FRAMEWORKS, AppShape, build_app
+from fastapi_voyager.er_diagram import VoyagerErDiagram
+from fastapi_voyager.filter import (
+    filter_graph,
+    filter_subgraph_by_module_prefix,
+    filter_subgraph_from_tag_to_schema_by_module_prefix,
+)
+from fastapi_voyager.graph import GraphIndex
+from fastapi_voyager.render import Renderer
+from fastapi_voyager.version import __version__
+from fastapi_voyager.voyager import Voyager
+
+
+def _best(fn: Callable[[], object], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return round(best, 4)
+
+
+def bench(framework: str, shape: AppShape, repeat: int = 3, queries: int = 20) -> dict:
+    start = time.perf_counter()
+    synthetic = build_app(framework, shape)
+    result: dict = {
+        'framework': framework,
+        'build_app_seconds': round(time.perf_counter() - start, 4),
+    }
+
+    voyager = Voyager()
+    start = time.perf_counter()
+    snapshot = voyager.collect_snapshot(synthetic.app)
+    result['analysis_seconds'] = round(time.perf_counter() - start, 4)
+    start = time.perf_counter()
+    index = GraphIndex(snapshot)
+    result['index_build_seconds'] = round(time.perf_counter() - start, 4)
+    voyager.load_index(index)
+    result['analysis_warm_seconds'] = _best(lambda: Voyager().analysis(synthetic.app), repeat)
+
+    tags, routes, nodes, links = voyager.tags, voyager.routes, voyager.nodes, voyager.links
+    result.update(tags=len(tags), routes=len(routes), schemas=len(nodes), links=len(links))
+    graph = dict(tags=tags, routes=routes, nodes=nodes, links=links)
+
+    rnd = random.Random(shape.seed)
+    targets = [rnd.choice(synthetic.route_schemas) for _ in range(queries)]
+    start = time.perf_counter()
+    for schema in targets:
+        filter_graph(
+            schema=schema, schema_field=None, node_set=voyager.node_set, index=index, **graph
+        )
+    result['filter_graph_ms_per_query'] = round((time.perf_counter() - start) * 1000 / queries, 3)
+
+    prefix = synthetic.module_prefix
+    result['tag_level_brief_filter_seconds'] = _best(
+        lambda: filter_subgraph_by_module_prefix(module_prefix=prefix, **graph), repeat)
+    result['overall_brief_filter_seconds'] = _best(
+        lambda: filter_subgraph_from_tag_to_schema_by_module_prefix(module_prefix=prefix, **graph),
+        repeat,
+    )
+
+    dot = ''
+
+    def render():
+        nonlocal dot
+        dot = Renderer(show_fields='object').render_dot(tags, routes, nodes, links)
+
+    result['render_dot_seconds'] = _best(render, repeat)
+    result['dot_bytes'] = len(dot)
+
+    er_dot = ''
+
+    def render_er():
+        nonlocal er_dot
+        er_dot = VoyagerErDiagram(synthetic.er_diagram, show_fields='all').render_dot()
+
+    result['er_diagram_render_dot_seconds'] = _best(render_er, repeat)
+    result['er_dot_bytes'] = len(er_dot)
+    return result
+
+
+def run(frameworks: list[str], shape: AppShape, repeat: int = 3, queries: int = 20) -> dict:
+    results = []
+    for framework in frameworks:
+        try:
+            results.append(bench(framework, shape, repeat=repeat, queries=queries))
+        except ImportError as e:
+            results.append({'framework': framework, 'skipped': f'not installed: {e.name or e}'})
+    return {
+        'version': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'shape': shape.to_dict(),
+        'results': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--framework', nargs='+', choices=FRAMEWORKS, default=list(FRAMEWORKS))
+    for f in fields(AppShape):
+        parser.add_argument(f'--{f.name}', type=int, default=f.default)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--queries', type=int, default=20)
+    parser.add_argument('--output', '-o', default=None, help='write the JSON results to this file')
+    args = parser.parse_args()
+
+    shape = AppShape(**{f.name: getattr(args, f.name) for f in fields(AppShape)})
+    results = run(args.framework, shape, repeat=args.repeat, queries=args.queries)
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report + '\n')
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
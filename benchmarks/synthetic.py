@@ -0,0 +1,94 @@
+"""
+Synthetic graph data for benchmarks.
+
+Builds analyzed-graph objects (tags, routes, schema nodes, links) directly, without a
+web app, so render and filter code can be measured at sizes real apps reach.
+"""
+from __future__ import annotations
+
+import random
+
+from fastapi_voyager.type import PK, FieldInfo, Link, Route, SchemaNode, Tag
+
+
+def build_graph(
+    *,
+    n_tags: int = 20,
+    n_routes: int = 400,
+    n_schemas: int = 2000,
+    n_fields: int = 12,
+    n_modules: int = 50,
+    depth: int = 4,
+    parent_every: int = 10,
+    seed: int = 0,
+) -> tuple[list[Tag], list[Route], list[SchemaNode], list[Link]]:
+    """Random but reproducible graph shaped like real response models.
+
+    Schemas are split into ``depth`` levels, routes return level 0 schemas and object fields
+    reference random schemas of the next level. Every ``parent_every``-th schema also
+    inherits from a schema of the next level (a ``parent`` link).
+    """
+    rnd = random.Random(seed)
+    level_size = max(1, n_schemas // depth)
+
+    def level_of(i: int) -> int:
+        return min(i // level_size, depth - 1)
+
+    def pick_next_level(i: int) -> SchemaNode | None:
+        level = level_of(i) + 1
+        if level >= depth:
+            return None
+        start = level * level_size
+        end = n_schemas if level == depth - 1 else start + level_size
+        return nodes[rnd.randrange(start, end)]
+
+    nodes: list[SchemaNode] = []
+    for i in range(n_schemas):
+        module = f'app.domain{i % n_modules}.schema'
+        has_children = level_of(i) < depth - 1
+        fields = [
+            FieldInfo(
+                name=f'field_{j}',
+                type_name='list[Optional[SomeVeryLongSchemaName]]' if j % 3 == 0 else 'int',
+                is_object=has_children and j % 3 == 0,
+                from_base=j == n_fields - 1,
+                is_resolve=j % 5 == 0,
+                has_pydantic_resolve_meta=j % 5 == 0,
+            )
+            for j in range(n_fields)
+        ]
+        nodes.append(
+            SchemaNode(id=f'{module}.Schema{i}', module=module, name=f'Schema{i}', fields=fields)
+        )
+
+    links: list[Link] = []
+    tags = [Tag(id=f'tag__t{i}', name=f't{i}', routes=[]) for i in range(n_tags)]
+    routes: list[Route] = []
+    for i in range(n_routes):
+        tag = tags[i % n_tags]
+        target = nodes[i % level_size]
+        route = Route(
+            id=f'app.api{i % n_modules}.route_{i}',
+            name=f'route_{i}',
+            module=f'app.api{i % n_modules}',
+            response_schema=target.name,
+            is_primitive=False,
+        )
+        routes.append(route)
+        tag.routes.append(route)
+        links.append(Link(source=tag.id, source_origin=tag.id, target=route.id,
+                          target_origin=route.id, type='tag_route'))
+        links.append(Link(source=route.id, source_origin=route.id, target=f'{target.id}::{PK}',
+                          target_origin=target.id, type='route_to_schema'))
+
+    for i, node in enumerate(nodes):
+        for f in node.fields:
+            if f.is_object and (target := pick_next_level(i)):
+                links.append(Link(source=f'{node.id}::f{f.name}', source_origin=node.id,
+                                  target=f'{target.id}::{PK}', target_origin=target.id,
+                                  type='schema'))
+        if parent_every and i % parent_every == 0 and (target := pick_next_level(i)):
+            links.append(Link(source=f'{node.id}::{PK}', source_origin=node.id,
+                              target=f'{target.id}::{PK}', target_origin=target.id, type='parent'))
+
+    return tags, routes, nodes, links
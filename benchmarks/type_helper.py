@@ -0,0 +1,84 @@
+"""
+Micro-benchmarks for get_core_types / get_type_name over realistic annotations.
+
+    python -m benchmarks.type_helper [--number 20000]
+
+Reports microseconds per call for the memoized entry points and for the plain implementations
+(top level only, nested arguments of get_type_name still go through the memo).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from typing import Annotated, Generic, Literal, Optional, TypeVar, Union
+
+from pydantic import BaseModel, Field
+
+from fastapi_voyager import type_helper
+
+T = TypeVar('T')
+
+
+class Item(BaseModel):
+    id: int
+
+
+class Tag(BaseModel):
+    name: str
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    total: int
+
+
+def annotations() -> dict[str, object]:
+    # typing.Optional / Union on purpose, they are what get_core_types has to unwrap
+    annos: dict[str, object] = {
+        'class': Item,
+        'optional': Optional[Item],  # noqa: UP045
+        'pep604_optional': Item | None,
+        'nested_optional_list_annotated': Optional[  # noqa: UP045
+            list[Annotated[Item, Field(description='item')]]
+        ],
+        'union_list': Union[list[Item], list[Tag], None],  # noqa: UP007
+        'dict_generic': dict[str, list[Item | None]],
+        'pydantic_generic': Optional[Page[Item]],  # noqa: UP045
+        'literal': Literal['a', 'b'],
+    }
+    try:
+        from typing import TypeAliasType
+    except ImportError:  # Python < 3.12, no PEP 695 aliases
+        return annos
+    item_list = TypeAliasType('ItemList', list[Item])
+    annos['pep695_alias'] = item_list
+    annos['pep695_nested_alias'] = TypeAliasType('MaybeItems', Optional[item_list])  # noqa: UP045
+    return annos
+
+
+def bench(number: int) -> dict:
+    result: dict = {}
+    for name, anno in annotations().items():
+        row = {}
+        for label, func in (
+            ('core_types_plain', type_helper._get_core_types),
+            ('core_types_memo', type_helper.get_core_types),
+            ('type_name_plain', type_helper._get_type_name),
+            ('type_name_memo', type_helper.get_type_name),
+        ):
+            seconds = timeit.timeit(lambda func=func, anno=anno: func(anno), number=number)
+            row[f'{label}_us'] = round(seconds * 1e6 / number, 3)
+        result[name] = row
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=20000)
+    args = parser.parse_args()
+    print(json.dumps(bench(args.number), indent=2))
+
+
+if __name__ == '__main__':
+    main()
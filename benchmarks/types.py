@@ -0,0 +1,53 @@
+"""
+Benchmark construction time and memory of the analyzed-graph objects in ``type.py``.
+
+    python -m benchmarks.types [--schemas 12000]
+
+Builds the synthetic graph (tags, routes, schema nodes with fields, links) and reports
+the wall time and the traced memory held by the result.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from benchmarks.synthetic import build_graph
+
+
+def bench(n_schemas: int) -> dict:
+    gc.collect()
+    start = time.perf_counter()
+    graph = build_graph(n_schemas=n_schemas, n_routes=n_schemas // 5)
+    build_seconds = time.perf_counter() - start
+    del graph
+
+    gc.collect()
+    tracemalloc.start()
+    graph = build_graph(n_schemas=n_schemas, n_routes=n_schemas // 5)
+    gc.collect()
+    held, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tags, routes, nodes, links = graph
+    return {
+        'schemas': len(nodes),
+        'fields': sum(len(n.fields) for n in nodes),
+        'routes': len(routes),
+        'links': len(links),
+        'build_seconds': round(build_seconds, 4),
+        'held_mib': round(held / 2**20, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--schemas', type=int, default=12000)
+    args = parser.parse_args()
+    print(json.dumps(bench(args.schemas), indent=2))
+
+
+if __name__ == '__main__':
+    main()
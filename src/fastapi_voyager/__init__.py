@@ -2,7 +2,17 @@
 
 Utilities to introspect web applications and visualize their routing tree.
 """
-from .server import create_voyager
+from typing import Any
+
 from .version import __version__  # noqa: F401
 
 __all__ = [ "__version__", "create_voyager" ]
+
+
+def __getattr__(name: str) -> Any:
+    # imported on first use: the server pulls in the adapters and the render pipeline
+    if name == "create_voyager":
+        from .server import create_voyager
+
+        return create_voyager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
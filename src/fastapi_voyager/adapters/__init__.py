@@ -2,11 +2,18 @@
 Framework adapters for fastapi-voyager.
 
 This module provides adapters that allow voyager to work with different web frameworks.
+Adapters are imported on first access, so using one does not load the others.
 """
+from importlib import import_module
+from typing import Any
+
 from fastapi_voyager.adapters.base import VoyagerAdapter
-from fastapi_voyager.adapters.django_ninja_adapter import DjangoNinjaAdapter
-from fastapi_voyager.adapters.fastapi_adapter import FastAPIAdapter
-from fastapi_voyager.adapters.litestar_adapter import LitestarAdapter
+
+_ADAPTER_MODULES = {
+    "FastAPIAdapter": "fastapi_voyager.adapters.fastapi_adapter",
+    "DjangoNinjaAdapter": "fastapi_voyager.adapters.django_ninja_adapter",
+    "LitestarAdapter": "fastapi_voyager.adapters.litestar_adapter",
+}
 
 __all__ = [
     "VoyagerAdapter",
@@ -14,3 +21,10 @@ __all__ = [
     "DjangoNinjaAdapter",
     "LitestarAdapter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _ADAPTER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
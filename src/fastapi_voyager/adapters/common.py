@@ -3,22 +3,33 @@ Shared business logic for voyager endpoints.
 
 This module contains the core logic that is reused across all framework adapters.
 """
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import getLogger
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from pydantic_resolve import ErDiagram
 
 from fastapi_voyager.er_diagram import VoyagerErDiagram
+from fastapi_voyager.graph import GraphIndex, GraphSnapshot
 from fastapi_voyager.introspectors.detector import FrameworkType, detect_framework
-from fastapi_voyager.render import Renderer
+from fastapi_voyager.layout import LayoutError, ServerLayout
+from fastapi_voyager.render import RenderCache
+from fastapi_voyager.render_executor import RenderExecutor
 from fastapi_voyager.render_style import RenderConfig
-from fastapi_voyager.type import CoreData, SchemaNode, Tag
+from fastapi_voyager.search import SEARCH_KINDS, SEARCH_LIMIT, SearchHit, SearchIndex
+from fastapi_voyager.type import CoreData, SchemaNode, SchemaSummary, Tag
 from fastapi_voyager.type_helper import get_source, get_vscode_link
 from fastapi_voyager.version import __version__
 from fastapi_voyager.voyager import Voyager
 
 WEB_DIR = Path(__file__).parent.parent / "web"
-WEB_DIR.mkdir(exist_ok=True)
 
 STATIC_FILES_PATH = "/fastapi-voyager-static"
 
@@ -28,6 +39,31 @@ STATIC_PATH_PLACEHOLDER = "<!-- STATIC_PATH -->"
 THEME_COLOR_PLACEHOLDER = "<!-- THEME_COLOR -->"
 VOYAGER_PATH_PLACEHOLDER = "<!-- VOYAGER_PATH -->"
 
+# number of recently produced /dot responses kept per analyzed graph
+RESPONSE_CACHE_SIZE = 32
+
+# streamed POST /dot responses up to this many characters are also kept in the response cache
+STREAM_CACHE_LIMIT = 1 << 20
+
+# filters of the UI's first POST /dot, prerendered by `warmup`, see `initial_view_payload`
+INITIAL_VIEW_FILTERS = {"show_fields": "object", "show_module": False}
+
+# upper bound of the GET /search ``limit`` parameter
+MAX_SEARCH_LIMIT = 200
+
+# threads running analysis / rendering for the async adapters
+OFFLOAD_WORKERS = 2
+
+T = TypeVar("T")
+
+logger = getLogger(__name__)
+
+
+def ensure_web_dir() -> Path:
+    """The bundled web directory, created if missing so static file mounts do not fail."""
+    WEB_DIR.mkdir(exist_ok=True)
+    return WEB_DIR
+
 
 def build_ga_snippet(ga_id: str | None) -> str:
     """Build Google Analytics snippet."""
@@ -49,6 +85,86 @@ def build_ga_snippet(ga_id: str | None) -> str:
 """
 
 
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header value matches ``etag`` (weak comparison, RFC 9110)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class Offloader:
+    """
+    Bounded thread pool for the blocking VoyagerContext calls of async adapters.
+
+    Analysis and rendering can take hundreds of milliseconds, async handlers await them
+    here instead of running them on the host app's event loop. At most ``max_workers``
+    calls run at once, later ones queue, see `stats` for the current queue depth.
+    """
+
+    def __init__(self, max_workers: int = OFFLOAD_WORKERS):
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="voyager")
+            return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``func(*args, **kwargs)`` in the pool and await its result."""
+        def call() -> T:
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        def on_done(future: Future) -> None:
+            if future.cancelled():  # dropped before it started
+                with self._lock:
+                    self.queued -= 1
+
+        executor = self._get_executor()
+        with self._lock:
+            self.queued += 1
+        future = executor.submit(call)
+        future.add_done_callback(on_done)
+        return await asyncio.wrap_future(future)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a free worker."""
+        return self.queued
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "running": self.running,
+                "queued": self.queued,
+                "completed": self.completed,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
 class VoyagerContext:
     """
     Context object that holds configuration and provides business logic methods.
@@ -68,6 +184,9 @@ class VoyagerContext:
         er_diagram: ErDiagram | None = None,
         enable_pydantic_resolve_meta: bool = False,
         framework_name: str | None = None,
+        offload_workers: int | None = None,
+        render_executor: RenderExecutor | None = None,
+        server_layout: ServerLayout | None = None,
     ):
         self.target_app = target_app
         self.module_color = module_color or {}
@@ -84,6 +203,22 @@ class VoyagerContext:
         # Display name for frontend (backward compatible)
         self.framework_name = framework_name or self._get_display_name()
 
+        # Analyzed graph of target_app, built lazily and shared by all requests
+        self._index: GraphIndex | None = None
+        self._index_lock = threading.Lock()
+
+        # Async adapters run blocking calls here, see `run_blocking`
+        self.offloader = Offloader(OFFLOAD_WORKERS if offload_workers is None else offload_workers)
+        # Renders filtered views, in-process unless e.g. a ProcessPoolRenderExecutor is given
+        self.render_executor = render_executor or RenderExecutor()
+        # Optional server-side Graphviz layout, the UI lays out in the browser otherwise
+        self.server_layout = server_layout
+
+        # Optional background warm-up, see `start_warmup`, run by `startup` when set
+        self.warmup_on_startup = False
+        self._warmup_thread: threading.Thread | None = None
+        self.warmup_seconds: float | None = None
+
     def _get_display_name(self) -> str:
         """Get display name for the detected framework type."""
         display_names = {
@@ -93,6 +228,10 @@ class VoyagerContext:
         }
         return display_names.get(self._framework_type, "API")
 
+    @property
+    def has_server_layout(self) -> bool:
+        return self.server_layout is not None and self.server_layout.available
+
     def _get_theme_color(self) -> str:
         """Get theme color for the current framework."""
         config = RenderConfig()
@@ -112,6 +251,9 @@ class VoyagerContext:
 
     def get_voyager(self, **kwargs) -> Voyager:
         """Create a Voyager instance with common configuration."""
+        return Voyager(**self._get_voyager_config(**kwargs))
+
+    def _get_voyager_config(self, **kwargs) -> dict[str, Any]:
         config = {
             "module_color": self.module_color,
             "show_pydantic_resolve_meta": self.enable_pydantic_resolve_meta,
@@ -119,7 +261,146 @@ class VoyagerContext:
             "entity_class_names": self._get_entity_class_names(),
         }
         config.update(kwargs)
-        return Voyager(**config)
+        return config
+
+    def get_index(self) -> GraphIndex:
+        """
+        Get the analyzed and indexed graph of the target app, analyzing it on first use.
+
+        The index is reused until `invalidate_snapshot` is called.
+        """
+        index = self._index
+        if index is None:
+            self.wait_for_warmup()
+            with self._index_lock:
+                if self._index is None:
+                    snapshot = self.get_voyager().collect_snapshot(self.target_app)
+                    self._index = GraphIndex(snapshot)
+                index = self._index
+        return index
+
+    def warmup(self) -> float:
+        """
+        Build the graph, the GET /dot response and the initial view now, return the seconds it took.
+
+        The initial view is the POST /dot response the UI requests first, see
+        `initial_view_payload`; it is laid out too when server-side layout is enabled.
+        """
+        start = time.perf_counter()
+        self._build_cached_option_param()
+        self.get_search_index()
+        self.get_index().build_reachability()
+        payload = self.initial_view_payload()
+        if payload is not None:
+            self.get_filtered_dot(payload)
+            if self.has_server_layout:
+                try:
+                    self.get_filtered_layout(payload)
+                except LayoutError as e:
+                    logger.warning("initial view layout failed: %s", e)
+        self.warmup_seconds = time.perf_counter() - start
+        logger.info("voyager warm-up finished in %.3fs", self.warmup_seconds)
+        return self.warmup_seconds
+
+    def start_warmup(self) -> threading.Thread:
+        """
+        Run `warmup` in a daemon thread.
+
+        Requests arriving meanwhile wait for it instead of analyzing the app a second time.
+        The duration is available as ``warmup_seconds`` once finished. Only the first call
+        starts a thread, later ones return it.
+        """
+        if self._warmup_thread is not None:
+            return self._warmup_thread
+        thread = threading.Thread(target=self._run_warmup, name="voyager-warmup", daemon=True)
+        self._warmup_thread = thread
+        thread.start()
+        return thread
+
+    def _run_warmup(self) -> None:
+        try:
+            self.warmup()
+        except Exception:
+            logger.exception("voyager warm-up failed, the graph will be built on first request")
+
+    def wait_for_warmup(self, timeout: float | None = None) -> None:
+        """Block until a running background warm-up finishes."""
+        thread = self._warmup_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def get_stats(self) -> dict:
+        """Runtime metrics for GET /stats: offload pool usage and the warm-up duration."""
+        return {"offload": self.offloader.stats(), "warmup_seconds": self.warmup_seconds}
+
+    def startup(self) -> None:
+        """Startup hook of the serving app, starts the warm-up if ``warmup_on_startup``."""
+        if self.warmup_on_startup:
+            self.start_warmup()
+
+    def shutdown(self) -> None:
+        """Shutdown hook of the serving app, stops the offload threads."""
+        self.offloader.shutdown()
+
+    async def run_blocking(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Await a blocking call (analysis, rendering) without stalling the event loop."""
+        return await self.offloader.run(func, *args, **kwargs)
+
+    async def iterate_blocking(self, chunks: Iterable[T]) -> AsyncIterator[T]:
+        """Iterate a blocking iterable (e.g. a DOT stream) on the offload threads."""
+        iterator = iter(chunks)
+        done = object()
+        while (chunk := await self.run_blocking(next, iterator, done)) is not done:
+            yield chunk
+
+    def get_snapshot(self) -> GraphSnapshot:
+        """Get the unfiltered analysis result of the target app."""
+        return self.get_index().snapshot
+
+    def invalidate_snapshot(self) -> None:
+        """Drop the cached graph, call it after routes are added or removed at runtime."""
+        with self._index_lock:
+            self._index = None
+
+    def get_analyzed_voyager(self, **kwargs) -> Voyager:
+        """Create a Voyager instance viewing the cached graph, sharing its render cache."""
+        index = self.get_index()
+        render_cache = index.cached('render_cache', lambda: RenderCache.sized_for(index.n_objects))
+        voyager = self.get_voyager(render_cache=render_cache, **kwargs)
+        voyager.load_index(index)
+        return voyager
+
+    def get_etag(self, endpoint: str, params: dict | None = None) -> str:
+        """
+        Strong ETag of an ``endpoint`` response on the current graph.
+
+        Derived from the snapshot fingerprint, the context configuration and the request
+        parameters, so it changes whenever the response content could change.
+        """
+        config = {
+            "version": __version__,
+            "module_color": self.module_color,
+            "module_prefix": self.module_prefix,
+            "swagger_url": self.swagger_url,
+            "initial_page_policy": self.initial_page_policy,
+            "has_er_diagram": self.er_diagram is not None,
+            "enable_pydantic_resolve_meta": self.enable_pydantic_resolve_meta,
+            "framework_name": self.framework_name,
+            "theme_color": self._get_theme_color(),
+            "server_layout": self.has_server_layout,
+        }
+        h = hashlib.blake2b(digest_size=16)
+        h.update(self.get_index().fingerprint.encode())
+        for part in (config, endpoint, params):
+            h.update(json.dumps(part, sort_keys=True, default=str).encode())
+        return f'"{h.hexdigest()}"'
+
+    def _response_cache(self) -> RenderCache:
+        return self.get_index().cached("response_cache", lambda: RenderCache(RESPONSE_CACHE_SIZE))
+
+    def _cached_response(self, etag: str, build: Callable[[], T]) -> T:
+        """Reuse a recently produced response with the same ETag, dropped with the graph."""
+        return self._response_cache().get_or_render(etag, build)
 
     def analyze_and_get_dot(self) -> tuple[str, list[Tag], list[SchemaNode]]:
         """
@@ -128,10 +409,13 @@ class VoyagerContext:
         Returns:
             Tuple of (dot_graph, tags, schemas)
         """
-        voyager = self.get_voyager()
-        voyager.analysis(self.target_app)
+        voyager = self.get_analyzed_voyager()
         dot = voyager.render_dot()
+        tags, schemas = self._sorted_tags_and_schemas(voyager)
+        return dot, tags, schemas
 
+    @staticmethod
+    def _sorted_tags_and_schemas(voyager: Voyager) -> tuple[list[Tag], list[SchemaNode]]:
         # include tags and their routes
         tags = voyager.tags
         for t in tags:
@@ -141,16 +425,24 @@ class VoyagerContext:
         schemas = voyager.nodes[:]
         schemas.sort(key=lambda s: s.name)
 
-        return dot, tags, schemas
+        return tags, schemas
 
     def get_option_param(self) -> dict:
-        """Get the option parameter for the voyager UI."""
-        dot, tags, schemas = self.analyze_and_get_dot()
+        """Get the option parameter for the voyager UI, cached under its ETag."""
+        self.wait_for_warmup()
+        return self._build_cached_option_param()
+
+    def _build_cached_option_param(self) -> dict:
+        return self._cached_response(self.get_etag("GET /dot"), self._build_option_param)
+
+    def _build_option_param(self) -> dict:
+        # ids, names and modules only: fields are fetched on demand from POST /schemas and
+        # the first graph from POST /dot, as selected by initial_page_policy
+        tags, schemas = self._sorted_tags_and_schemas(self.get_analyzed_voyager())
 
         return {
             "tags": tags,
-            "schemas": schemas,
-            "dot": dot,
+            "schemas": [SchemaSummary(id=s.id, name=s.name, module=s.module) for s in schemas],
             "enable_brief_mode": bool(self.module_prefix),
             "version": __version__,
             "swagger_url": self.swagger_url,
@@ -158,11 +450,52 @@ class VoyagerContext:
             "has_er_diagram": self.er_diagram is not None,
             "enable_pydantic_resolve_meta": self.enable_pydantic_resolve_meta,
             "framework_name": self.framework_name,
+            "server_layout": self.has_server_layout,
         }
 
+    def initial_view_payload(self) -> dict | None:
+        """
+        POST /dot payload of the UI's first render with default filters, None if it renders nothing.
+
+        ``initial_page_policy`` 'first' shows the first tag, 'full' every tag, 'empty' nothing.
+        """
+        if self.initial_page_policy == "empty":
+            return None
+        tags = None
+        if self.initial_page_policy == "first":
+            first = self.get_option_param()["tags"][:1]
+            if not first:
+                return None
+            tags = [first[0].name]
+        return {"tags": tags, **INITIAL_VIEW_FILTERS}
+
+    def get_schema_details(self, schema_ids: list[str]) -> list[SchemaNode]:
+        """Schema nodes with fields for POST /schemas, in request order, unknown ids skipped."""
+        node_set = self.get_snapshot().node_set
+        return [node_set[i] for i in dict.fromkeys(schema_ids) if i in node_set]
+
+    def get_search_index(self) -> SearchIndex:
+        """The search index of the current graph, built on first use."""
+        index = self.get_index()
+        return index.cached("search_index", lambda: SearchIndex(index.snapshot))
+
+    def search(
+        self, query: str, limit: int = SEARCH_LIMIT, kinds: str | list[str] | None = None
+    ) -> list[SearchHit]:
+        """
+        Ranked schema, route and field matches of ``query`` for GET /search.
+
+        ``kinds`` restricts the hit kinds, as a list or comma separated, see SEARCH_KINDS.
+        """
+        if isinstance(kinds, str):
+            kinds = [k.strip() for k in kinds.split(",") if k.strip()]
+        kinds = [k for k in kinds or () if k in SEARCH_KINDS] or None
+        limit = min(max(limit, 0), MAX_SEARCH_LIMIT)
+        return self.get_search_index().search(query, limit=limit, kinds=kinds)
+
     def get_search_dot(self, payload: dict) -> list[Tag]:
         """Get filtered tags for search."""
-        voyager = self.get_voyager(
+        voyager = self.get_analyzed_voyager(
             schema=payload.get("schema_name"),
             schema_field=payload.get("schema_field"),
             show_fields=payload.get("show_fields", "object"),
@@ -170,7 +503,6 @@ class VoyagerContext:
             show_module=payload.get("show_module", True),
             show_pydantic_resolve_meta=payload.get("show_pydantic_resolve_meta", False),
         )
-        voyager.analysis(self.target_app)
         tags = voyager.calculate_filtered_tag_and_route()
 
         for t in tags:
@@ -179,51 +511,116 @@ class VoyagerContext:
 
         return tags
 
+    @staticmethod
+    def get_filtered_dot_params(payload: dict) -> dict:
+        """Normalize a POST /dot payload, defaults filled in."""
+        return {
+            "tags": payload.get("tags"),
+            "schema_name": payload.get("schema_name"),
+            "schema_field": payload.get("schema_field"),
+            "show_fields": payload.get("show_fields", "object"),
+            "route_name": payload.get("route_name"),
+            "brief": bool(payload.get("brief", False)),
+            "hide_primitive_route": payload.get("hide_primitive_route", False),
+            "show_module": payload.get("show_module", True),
+            "show_pydantic_resolve_meta": payload.get("show_pydantic_resolve_meta", False),
+        }
+
+    def get_filtered_dot_etag(self, payload: dict) -> str:
+        """ETag of the POST /dot response for ``payload``."""
+        return self.get_etag("POST /dot", self.get_filtered_dot_params(payload))
+
     def get_filtered_dot(self, payload: dict) -> str:
-        """Get filtered dot graph."""
-        voyager = self.get_voyager(
-            include_tags=payload.get("tags"),
-            schema=payload.get("schema_name"),
-            schema_field=payload.get("schema_field"),
-            show_fields=payload.get("show_fields", "object"),
-            route_name=payload.get("route_name"),
-            hide_primitive_route=payload.get("hide_primitive_route", False),
-            show_module=payload.get("show_module", True),
-            show_pydantic_resolve_meta=payload.get("show_pydantic_resolve_meta", False),
+        """Get filtered dot graph, cached under its ETag."""
+        params = self.get_filtered_dot_params(payload)
+        etag = self.get_etag("POST /dot", params)
+        return self._cached_response(etag, lambda: self._render_filtered_dot(params))
+
+    def get_filtered_layout_etag(self, payload: dict) -> str:
+        """ETag of the POST /dot-layout response for ``payload``."""
+        return self.get_etag("POST /dot-layout", self.get_filtered_dot_params(payload))
+
+    def get_filtered_layout(self, payload: dict) -> str:
+        """
+        Get the filtered dot graph laid out as SVG by the server.
+
+        Raises LayoutError when server-side layout is not enabled or fails.
+        """
+        if not self.has_server_layout:
+            raise LayoutError("server-side layout is not enabled")
+        return self.server_layout.layout(self.get_filtered_dot(payload), "svg")
+
+    def stream_filtered_dot(self, payload: dict) -> Iterator[str]:
+        """
+        Get filtered dot graph as chunks, for streaming responses.
+
+        A cached response is returned as one chunk. Otherwise filtering happens right away
+        and rendering as the chunks are consumed; the result is cached once fully consumed
+        unless it is larger than ``STREAM_CACHE_LIMIT``.
+        """
+        params = self.get_filtered_dot_params(payload)
+        etag = self.get_etag("POST /dot", params)
+        cache = self._response_cache()
+        dot = cache.get(etag)
+        if dot is not None:
+            return iter((dot,))
+        chunks = self.render_executor.render_view_stream(
+            self.get_index(),
+            self._filtered_dot_voyager_kwargs(params),
+            brief=params["brief"],
+            module_prefix=self.module_prefix,
+        )
+        return self._cache_stream(cache, etag, chunks)
+
+    @staticmethod
+    def _cache_stream(cache: RenderCache, etag: str, chunks: Iterator[str]) -> Iterator[str]:
+        kept: list[str] | None = []
+        size = 0
+        for chunk in chunks:
+            if kept is not None:
+                size += len(chunk)
+                if size <= STREAM_CACHE_LIMIT:
+                    kept.append(chunk)
+                else:
+                    kept = None
+            yield chunk
+        if kept is not None:
+            cache.put(etag, ''.join(kept))
+
+    def _render_filtered_dot(self, params: dict) -> str:
+        return self.render_executor.render_view(
+            self.get_index(),
+            self._filtered_dot_voyager_kwargs(params),
+            brief=params["brief"],
+            module_prefix=self.module_prefix,
         )
-        voyager.analysis(self.target_app)
 
-        if payload.get("brief"):
-            if payload.get("tags"):
-                return voyager.render_tag_level_brief_dot(module_prefix=self.module_prefix)
-            else:
-                return voyager.render_overall_brief_dot(module_prefix=self.module_prefix)
-        else:
-            return voyager.render_dot()
+    def _filtered_dot_voyager_kwargs(self, params: dict) -> dict[str, Any]:
+        return self._get_voyager_config(
+            include_tags=params["tags"],
+            schema=params["schema_name"],
+            schema_field=params["schema_field"],
+            show_fields=params["show_fields"],
+            route_name=params["route_name"],
+            hide_primitive_route=params["hide_primitive_route"],
+            show_module=params["show_module"],
+            show_pydantic_resolve_meta=params["show_pydantic_resolve_meta"],
+        )
 
     def get_core_data(self, payload: dict) -> CoreData:
         """Get core data for the graph."""
-        voyager = self.get_voyager(
+        voyager = self.get_analyzed_voyager(
             include_tags=payload.get("tags"),
             schema=payload.get("schema_name"),
             schema_field=payload.get("schema_field"),
             show_fields=payload.get("show_fields", "object"),
             route_name=payload.get("route_name"),
         )
-        voyager.analysis(self.target_app)
         return voyager.dump_core_data()
 
     def render_dot_from_core_data(self, core_data: CoreData) -> str:
         """Render dot graph from core data."""
-        renderer = Renderer(
-            show_fields=core_data.show_fields,
-            module_color=core_data.module_color,
-            schema=core_data.schema,
-            theme_color=self._get_theme_color(),
-        )
-        return renderer.render_dot(
-            core_data.tags, core_data.routes, core_data.nodes, core_data.links
-        )
+        return self.render_executor.render_core_data(core_data, self._get_theme_color())
 
     def get_er_diagram_dot(self, payload: dict) -> str:
         """Get ER diagram dot graph."""
@@ -6,11 +6,23 @@ It creates an ASGI application that can be integrated with Django.
 """
 import json
 import mimetypes
+from dataclasses import asdict
+from functools import partial
 from typing import Any
+from urllib.parse import parse_qs
 
 from fastapi_voyager.adapters.base import VoyagerAdapter
-from fastapi_voyager.adapters.common import STATIC_FILES_PATH, VOYAGER_PATH_PLACEHOLDER, WEB_DIR, VoyagerContext
-from fastapi_voyager.type import CoreData, SchemaNode, Tag
+from fastapi_voyager.adapters.common import (
+    STATIC_FILES_PATH,
+    VOYAGER_PATH_PLACEHOLDER,
+    WEB_DIR,
+    VoyagerContext,
+    etag_matches,
+)
+from fastapi_voyager.layout import LayoutError, ServerLayout
+from fastapi_voyager.render_executor import RenderExecutor
+from fastapi_voyager.search import SEARCH_LIMIT
+from fastapi_voyager.type import CoreData, SchemaNode, SchemaSummary, Tag
 
 
 class DjangoNinjaAdapter(VoyagerAdapter):
@@ -33,6 +45,9 @@ class DjangoNinjaAdapter(VoyagerAdapter):
         er_diagram: Any = None,
         enable_pydantic_resolve_meta: bool = False,
         server_mode: bool = False,
+        render_executor: RenderExecutor | None = None,
+        server_layout: ServerLayout | None = None,
+        offload_workers: int | None = None,
     ):
         self.ctx = VoyagerContext(
             target_app=target_app,
@@ -45,6 +60,9 @@ class DjangoNinjaAdapter(VoyagerAdapter):
             er_diagram=er_diagram,
             enable_pydantic_resolve_meta=enable_pydantic_resolve_meta,
             framework_name="Django Ninja",
+            render_executor=render_executor,
+            server_layout=server_layout,
+            offload_workers=offload_workers,
         )
         self.server_mode = server_mode
         # Note: gzip should be handled by Django's middleware, not here
@@ -76,13 +94,26 @@ class DjangoNinjaAdapter(VoyagerAdapter):
         elif method == "GET" and path == "/manifest.webmanifest":
             await self._handle_manifest(send)
         elif method == "GET" and path == "/dot":
-            await self._handle_get_dot(send)
+            await self._handle_get_dot(send, self._get_header(scope, b"if-none-match"))
+        elif method == "GET" and path == "/stats":
+            await self._send_json(self.ctx.get_stats(), send)
+        elif method == "GET" and path == "/search":
+            await self._handle_search(scope.get("query_string", b""), send)
         elif method == "POST" and path == "/er-diagram":
             await self._handle_post_request(receive, send, self._handle_er_diagram)
+        elif method == "POST" and path == "/schemas":
+            await self._handle_post_request(receive, send, self._handle_schema_details)
         elif method == "POST" and path == "/dot-search":
             await self._handle_post_request(receive, send, self._handle_search_dot)
         elif method == "POST" and path == "/dot":
-            await self._handle_post_request(receive, send, self._handle_filtered_dot)
+            handler = partial(
+                self._handle_filtered_dot, if_none_match=self._get_header(scope, b"if-none-match")
+            )
+            await self._handle_post_request(receive, send, handler)
+        elif method == "POST" and path == "/dot-layout":
+            if_none_match = self._get_header(scope, b"if-none-match")
+            handler = partial(self._handle_filtered_layout, if_none_match=if_none_match)
+            await self._handle_post_request(receive, send, handler)
         elif method == "POST" and path == "/dot-core-data":
             await self._handle_post_request(receive, send, self._handle_core_data)
         elif method == "POST" and path == "/dot-render-core-data":
@@ -94,6 +125,26 @@ class DjangoNinjaAdapter(VoyagerAdapter):
         else:
             await self._send_404(send)
 
+    async def _handle_lifespan(self, receive, send):
+        """ASGI lifespan protocol, forward the host's lifespan scope here to get it."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.ctx.startup()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.ctx.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    def _get_header(scope, name: bytes) -> str | None:
+        """Get a request header value from the ASGI scope (name in lowercase)."""
+        for key, value in scope.get("headers", []):
+            if key.lower() == name:
+                return value.decode("latin-1")
+        return None
+
     async def _handle_post_request(self, receive, send, handler):
         """Helper to handle POST requests with JSON body."""
         body = b""
@@ -171,14 +222,17 @@ class DjangoNinjaAdapter(VoyagerAdapter):
             send,
         )
 
-    async def _handle_get_dot(self, send):
+    async def _handle_get_dot(self, send, if_none_match: str | None = None):
         """Handle GET /dot - return options and initial dot graph."""
-        data = self.ctx.get_option_param()
+        etag = await self.ctx.run_blocking(self.ctx.get_etag, "GET /dot")
+        if etag_matches(if_none_match, etag):
+            await self._send_not_modified(etag, send)
+            return
+        data = await self.ctx.run_blocking(self.ctx.get_option_param)
         # Convert tags and schemas to dicts for JSON serialization
         response_data = {
             "tags": [self._tag_to_dict(t) for t in data["tags"]],
-            "schemas": [self._schema_to_dict(s) for s in data["schemas"]],
-            "dot": data["dot"],
+            "schemas": [self._schema_summary_to_dict(s) for s in data["schemas"]],
             "enable_brief_mode": data["enable_brief_mode"],
             "version": data["version"],
             "initial_page_policy": data["initial_page_policy"],
@@ -186,39 +240,81 @@ class DjangoNinjaAdapter(VoyagerAdapter):
             "has_er_diagram": data["has_er_diagram"],
             "enable_pydantic_resolve_meta": data["enable_pydantic_resolve_meta"],
             "framework_name": data["framework_name"],
+            "server_layout": data["server_layout"],
         }
-        await self._send_json(response_data, send)
+        await self._send_json(response_data, send, headers=[[b"etag", etag.encode()]])
 
     async def _handle_er_diagram(self, payload, send):
         """Handle POST /er-diagram."""
-        data = self.ctx.get_er_diagram_data(payload)
+        data = await self.ctx.run_blocking(self.ctx.get_er_diagram_data, payload)
         await self._send_json(data, send)
 
+    async def _handle_schema_details(self, payload, send):
+        """Handle POST /schemas."""
+        schemas = await self.ctx.run_blocking(
+            self.ctx.get_schema_details, payload.get("schema_ids") or []
+        )
+        await self._send_json({"schemas": [self._schema_to_dict(s) for s in schemas]}, send)
+
+    async def _handle_search(self, query_string: bytes, send):
+        """Handle GET /search?q=&limit=&kinds=."""
+        params = parse_qs(query_string.decode("latin-1"))
+        query = params.get("q", [""])[0]
+        try:
+            limit = int(params.get("limit", [SEARCH_LIMIT])[0])
+        except ValueError:
+            limit = SEARCH_LIMIT
+        kinds = params.get("kinds", [None])[0]
+        hits = await self.ctx.run_blocking(self.ctx.search, query, limit, kinds)
+        await self._send_json({"query": query, "hits": [asdict(h) for h in hits]}, send)
+
     async def _handle_search_dot(self, payload, send):
         """Handle POST /dot-search."""
-        tags = self.ctx.get_search_dot(payload)
+        tags = await self.ctx.run_blocking(self.ctx.get_search_dot, payload)
         response_data = {"tags": [self._tag_to_dict(t) for t in tags]}
         await self._send_json(response_data, send)
 
-    async def _handle_filtered_dot(self, payload, send):
+    async def _handle_filtered_dot(self, payload, send, if_none_match: str | None = None):
         """Handle POST /dot."""
-        dot = self.ctx.get_filtered_dot(payload)
-        await self._send_text(dot, send)
+        etag = await self.ctx.run_blocking(self.ctx.get_filtered_dot_etag, payload)
+        if etag_matches(if_none_match, etag):
+            await self._send_not_modified(etag, send)
+            return
+        dot = await self.ctx.run_blocking(self.ctx.get_filtered_dot, payload)
+        await self._send_text(dot, send, headers=[[b"etag", etag.encode()]])
+
+    async def _handle_filtered_layout(self, payload, send, if_none_match: str | None = None):
+        """Handle POST /dot-layout."""
+        etag = await self.ctx.run_blocking(self.ctx.get_filtered_layout_etag, payload)
+        if etag_matches(if_none_match, etag):
+            await self._send_not_modified(etag, send)
+            return
+        try:
+            svg = await self.ctx.run_blocking(self.ctx.get_filtered_layout, payload)
+        except LayoutError as e:
+            await self._send_json({"error": str(e)}, send, status_code=503)
+            return
+        await self._send_response(
+            "image/svg+xml", svg.encode("utf-8"), send, headers=[[b"etag", etag.encode()]]
+        )
 
     async def _handle_core_data(self, payload, send):
         """Handle POST /dot-core-data."""
-        core_data = self.ctx.get_core_data(payload)
+        core_data = await self.ctx.run_blocking(self.ctx.get_core_data, payload)
         await self._send_json(core_data.model_dump(), send)
 
     async def _handle_render_core_data(self, payload, send):
         """Handle POST /dot-render-core-data."""
-        core_data = CoreData(**payload)
-        dot = self.ctx.render_dot_from_core_data(core_data)
+        dot = await self.ctx.run_blocking(
+            lambda: self.ctx.render_dot_from_core_data(CoreData(**payload))
+        )
         await self._send_text(dot, send)
 
     async def _handle_source(self, payload, send):
         """Handle POST /source."""
-        result = self.ctx.get_source_code(payload.get("schema_name", ""))
+        result = await self.ctx.run_blocking(
+            self.ctx.get_source_code, payload.get("schema_name", "")
+        )
         status_code = 200 if "error" not in result else 400
         if "error" in result and "not found" in result["error"]:
             status_code = 404
@@ -226,7 +322,9 @@ class DjangoNinjaAdapter(VoyagerAdapter):
 
     async def _handle_vscode_link(self, payload, send):
         """Handle POST /vscode-link."""
-        result = self.ctx.get_vscode_link(payload.get("schema_name", ""))
+        result = await self.ctx.run_blocking(
+            self.ctx.get_vscode_link, payload.get("schema_name", "")
+        )
         status_code = 200 if "error" not in result else 400
         if "error" in result and "not found" in result["error"]:
             status_code = 404
@@ -241,21 +339,43 @@ class DjangoNinjaAdapter(VoyagerAdapter):
             status_code=200,
         )
 
-    async def _send_json(self, data: dict, send, status_code: int = 200):
+    async def _send_json(
+        self, data: dict, send, status_code: int = 200, headers: list | None = None
+    ):
         """Send JSON response."""
         body = json.dumps(data).encode("utf-8")
-        await self._send_response("application/json", body, send, status_code=status_code)
+        await self._send_response(
+            "application/json", body, send, status_code=status_code, headers=headers
+        )
 
-    async def _send_text(self, text: str, send):
+    async def _send_text(self, text: str, send, headers: list | None = None):
         """Send plain text response."""
-        await self._send_response("text/plain; charset=utf-8", text.encode("utf-8"), send)
+        await self._send_response(
+            "text/plain; charset=utf-8", text.encode("utf-8"), send, headers=headers
+        )
+
+    async def _send_not_modified(self, etag: str, send):
+        """Send 304 response for a matching conditional request."""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [[b"etag", etag.encode()]],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
 
     async def _send_404(self, send):
         """Send 404 response."""
         await self._send_response("text/plain", b"Not Found", send, status_code=404)
 
     async def _send_response(
-        self, content_type: str, body: bytes, send, status_code: int = 200
+        self,
+        content_type: str,
+        body: bytes,
+        send,
+        status_code: int = 200,
+        headers: list | None = None,
     ):
         """Send ASGI response."""
         await send(
@@ -265,6 +385,7 @@ class DjangoNinjaAdapter(VoyagerAdapter):
                 "headers": [
                     [b"content-type", content_type.encode()],
                     [b"content-length", str(len(body)).encode()],
+                    *(headers or []),
                 ],
             }
         )
@@ -283,11 +404,16 @@ class DjangoNinjaAdapter(VoyagerAdapter):
                     "unique_id": r.unique_id,
                     "response_schema": r.response_schema,
                     "is_primitive": r.is_primitive,
+                    "path": r.path,
                 }
                 for r in tag.routes
             ],
         }
 
+    def _schema_summary_to_dict(self, schema: SchemaSummary) -> dict:
+        """Convert SchemaSummary to dict."""
+        return {"id": schema.id, "module": schema.module, "name": schema.name}
+
     def _schema_to_dict(self, schema: SchemaNode) -> dict:
         """Convert SchemaNode to dict."""
         return {
@@ -317,7 +443,11 @@ class DjangoNinjaAdapter(VoyagerAdapter):
                     # Return 404 for non-voyager paths
                     # (Django should handle these before they reach here)
                     await self._send_404(send)
+            elif scope["type"] == "lifespan":
+                await self._handle_lifespan(receive, send)
             else:
                 await self._send_404(send)
 
+        # expose the context so callers can invalidate the cached graph
+        asgi_app.voyager_context = self.ctx
         return asgi_app
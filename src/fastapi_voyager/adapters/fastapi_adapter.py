@@ -3,19 +3,29 @@ FastAPI adapter for fastapi-voyager.
 
 This module provides the FastAPI-specific implementation of the voyager server.
 """
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from typing import Any, Literal
 
 from pydantic import BaseModel
 
 from fastapi_voyager.adapters.base import VoyagerAdapter
-from fastapi_voyager.adapters.common import STATIC_FILES_PATH, VOYAGER_PATH_PLACEHOLDER, VoyagerContext
-from fastapi_voyager.type import CoreData, SchemaNode, Tag
+from fastapi_voyager.adapters.common import (
+    STATIC_FILES_PATH,
+    VOYAGER_PATH_PLACEHOLDER,
+    VoyagerContext,
+    ensure_web_dir,
+    etag_matches,
+)
+from fastapi_voyager.layout import LayoutError, ServerLayout
+from fastapi_voyager.render_executor import RenderExecutor
+from fastapi_voyager.search import SEARCH_LIMIT, SearchHit
+from fastapi_voyager.type import CoreData, SchemaNode, SchemaSummary, Tag
 
 
 class OptionParam(BaseModel):
     tags: list[Tag]
-    schemas: list[SchemaNode]
-    dot: str
+    schemas: list[SchemaSummary]
     enable_brief_mode: bool
     version: str
     initial_page_policy: Literal["first", "full", "empty"]
@@ -23,6 +33,7 @@ class OptionParam(BaseModel):
     has_er_diagram: bool = False
     enable_pydantic_resolve_meta: bool = False
     framework_name: str = "API"
+    server_layout: bool = False
 
 
 class Payload(BaseModel):
@@ -62,6 +73,19 @@ class SourcePayload(BaseModel):
     schema_name: str
 
 
+class SearchResult(BaseModel):
+    query: str
+    hits: list[SearchHit]
+
+
+class SchemaDetailsPayload(BaseModel):
+    schema_ids: list[str]
+
+
+class SchemaDetails(BaseModel):
+    schemas: list[SchemaNode]
+
+
 class FastAPIAdapter(VoyagerAdapter):
     """
     FastAPI-specific implementation of VoyagerAdapter.
@@ -82,6 +106,9 @@ class FastAPIAdapter(VoyagerAdapter):
         er_diagram: Any = None,
         enable_pydantic_resolve_meta: bool = False,
         server_mode: bool = False,
+        render_executor: RenderExecutor | None = None,
+        server_layout: ServerLayout | None = None,
+        offload_workers: int | None = None,
     ):
         self.ctx = VoyagerContext(
             target_app=target_app,
@@ -94,16 +121,40 @@ class FastAPIAdapter(VoyagerAdapter):
             er_diagram=er_diagram,
             enable_pydantic_resolve_meta=enable_pydantic_resolve_meta,
             framework_name="FastAPI",
+            render_executor=render_executor,
+            server_layout=server_layout,
+            offload_workers=offload_workers,
         )
         self.gzip_minimum_size = gzip_minimum_size
         # Note: server_mode is accepted for API consistency but not used
         # since FastAPI apps are always standalone with routes at /
 
+    def _with_context_hooks(
+        self, lifespan: Callable[[Any], AbstractAsyncContextManager]
+    ) -> Callable[[Any], AbstractAsyncContextManager]:
+        """``lifespan`` running the context's startup / shutdown hooks inside it."""
+
+        @asynccontextmanager
+        async def with_hooks(app: Any) -> AsyncIterator[Any]:
+            async with lifespan(app) as state:
+                self.ctx.startup()
+                try:
+                    yield state
+                finally:
+                    self.ctx.shutdown()
+
+        return with_hooks
+
     def create_app(self) -> Any:
         """Create and return a FastAPI application with voyager endpoints."""
         # Lazy import FastAPI to avoid import errors when framework is not installed
-        from fastapi import APIRouter, FastAPI
-        from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
+        from fastapi import APIRouter, FastAPI, Request, Response
+        from fastapi.responses import (
+            HTMLResponse,
+            JSONResponse,
+            PlainTextResponse,
+            StreamingResponse,
+        )
         from fastapi.staticfiles import StaticFiles
         from starlette.middleware.gzip import GZipMiddleware
 
@@ -114,18 +165,51 @@ class FastAPIAdapter(VoyagerAdapter):
             return self.ctx.get_er_diagram_data(payload.model_dump())
 
         @router.get("/dot", response_model=OptionParam)
-        def get_dot() -> OptionParam:
+        def get_dot(request: Request, response: Response) -> OptionParam:
+            etag = self.ctx.get_etag("GET /dot")
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers={"ETag": etag})
             data = self.ctx.get_option_param()
+            response.headers["ETag"] = etag
             return OptionParam(**data)
 
+        @router.post("/schemas", response_model=SchemaDetails)
+        def get_schema_details(payload: SchemaDetailsPayload) -> SchemaDetails:
+            return SchemaDetails(schemas=self.ctx.get_schema_details(payload.schema_ids))
+
+        @router.get("/search", response_model=SearchResult)
+        def search(
+            q: str = "", limit: int = SEARCH_LIMIT, kinds: str | None = None
+        ) -> SearchResult:
+            return SearchResult(query=q, hits=self.ctx.search(q, limit=limit, kinds=kinds))
+
+        @router.get("/stats")
+        def get_stats() -> dict:
+            return self.ctx.get_stats()
+
         @router.post("/dot-search", response_model=SearchResultOptionParam)
         def get_search_dot(payload: SchemaSearchPayload) -> SearchResultOptionParam:
             tags = self.ctx.get_search_dot(payload.model_dump())
             return SearchResultOptionParam(tags=tags)
 
         @router.post("/dot", response_class=PlainTextResponse)
-        def get_filtered_dot(payload: Payload) -> str:
-            return self.ctx.get_filtered_dot(payload.model_dump())
+        def get_filtered_dot(payload: Payload, request: Request) -> Response:
+            etag = self.ctx.get_filtered_dot_etag(payload.model_dump())
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            chunks = self.ctx.stream_filtered_dot(payload.model_dump())
+            return StreamingResponse(chunks, media_type="text/plain", headers={"ETag": etag})
+
+        @router.post("/dot-layout", response_class=Response)
+        def get_filtered_dot_layout(payload: Payload, request: Request) -> Response:
+            etag = self.ctx.get_filtered_layout_etag(payload.model_dump())
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            try:
+                svg = self.ctx.get_filtered_layout(payload.model_dump())
+            except LayoutError as e:
+                return JSONResponse(content={"error": str(e)}, status_code=503)
+            return Response(svg, media_type="image/svg+xml", headers={"ETag": etag})
 
         @router.post("/dot-core-data", response_model=CoreData)
         def get_filtered_dot_core_data(payload: Payload) -> CoreData:
@@ -181,9 +265,14 @@ class FastAPIAdapter(VoyagerAdapter):
         if self.gzip_minimum_size is not None and self.gzip_minimum_size >= 0:
             app.add_middleware(GZipMiddleware, minimum_size=self.gzip_minimum_size)
 
-        from fastapi_voyager.adapters.common import WEB_DIR
-
-        app.mount(STATIC_FILES_PATH, StaticFiles(directory=str(WEB_DIR)), name="static")
+        app.mount(STATIC_FILES_PATH, StaticFiles(directory=str(ensure_web_dir())), name="static")
         app.include_router(router)
+        # a mounted voyager app gets no lifespan events of its own, follow the host app's
+        for lifespan_app in (app, self.ctx.target_app):
+            if isinstance(lifespan_app, FastAPI):
+                router_ = lifespan_app.router
+                router_.lifespan_context = self._with_context_hooks(router_.lifespan_context)
+        # expose the context so callers can invalidate the cached graph
+        app.state.voyager_context = self.ctx
 
         return app
@@ -3,11 +3,21 @@ Litestar adapter for fastapi-voyager.
 
 This module provides the Litestar-specific implementation of the voyager server.
 """
-from typing import Any
+from dataclasses import asdict
+from typing import Annotated, Any
 
 from fastapi_voyager.adapters.base import VoyagerAdapter
-from fastapi_voyager.adapters.common import STATIC_FILES_PATH, VOYAGER_PATH_PLACEHOLDER, WEB_DIR, VoyagerContext
-from fastapi_voyager.type import CoreData, SchemaNode, Tag
+from fastapi_voyager.adapters.common import (
+    STATIC_FILES_PATH,
+    VOYAGER_PATH_PLACEHOLDER,
+    VoyagerContext,
+    ensure_web_dir,
+    etag_matches,
+)
+from fastapi_voyager.layout import LayoutError, ServerLayout
+from fastapi_voyager.render_executor import RenderExecutor
+from fastapi_voyager.search import SEARCH_LIMIT
+from fastapi_voyager.type import CoreData, SchemaNode, SchemaSummary, Tag
 
 
 class LitestarAdapter(VoyagerAdapter):
@@ -30,6 +40,9 @@ class LitestarAdapter(VoyagerAdapter):
         er_diagram: Any = None,
         enable_pydantic_resolve_meta: bool = False,
         server_mode: bool = False,
+        render_executor: RenderExecutor | None = None,
+        server_layout: ServerLayout | None = None,
+        offload_workers: int | None = None,
     ):
         self.ctx = VoyagerContext(
             target_app=target_app,
@@ -42,6 +55,9 @@ class LitestarAdapter(VoyagerAdapter):
             er_diagram=er_diagram,
             enable_pydantic_resolve_meta=enable_pydantic_resolve_meta,
             framework_name="Litestar",
+            render_executor=render_executor,
+            server_layout=server_layout,
+            offload_workers=offload_workers,
         )
         self.gzip_minimum_size = gzip_minimum_size
         # Note: server_mode is accepted for API consistency but not used
@@ -51,51 +67,117 @@ class LitestarAdapter(VoyagerAdapter):
         """Create and return a Litestar application with voyager endpoints."""
         # Lazy import Litestar to avoid import errors when framework is not installed
         from litestar import Litestar, MediaType, Request, Response, get, post
+        from litestar.params import Parameter
+        from litestar.response import Stream
         from litestar.static_files import create_static_files_router
 
         @post("/er-diagram")
         async def get_er_diagram(request: Request) -> dict:
             payload = await request.json()
-            return self.ctx.get_er_diagram_data(payload)
+            return await self.ctx.run_blocking(self.ctx.get_er_diagram_data, payload)
 
         @get("/dot")
-        async def get_dot(request: Request) -> dict:
-            data = self.ctx.get_option_param()
-            # Convert tags and schemas to dicts for JSON serialization
-            return {
-                "tags": [self._tag_to_dict(t) for t in data["tags"]],
-                "schemas": [self._schema_to_dict(s) for s in data["schemas"]],
-                "dot": data["dot"],
-                "enable_brief_mode": data["enable_brief_mode"],
-                "version": data["version"],
-                "initial_page_policy": data["initial_page_policy"],
-                "swagger_url": data["swagger_url"],
-                "has_er_diagram": data["has_er_diagram"],
-                "enable_pydantic_resolve_meta": data["enable_pydantic_resolve_meta"],
-                "framework_name": data["framework_name"],
-            }
+        async def get_dot(request: Request) -> Response:
+            if_none_match = request.headers.get("if-none-match")
+
+            def build() -> Response:
+                etag = self.ctx.get_etag("GET /dot")
+                if etag_matches(if_none_match, etag):
+                    return Response(content=b"", status_code=304, headers={"ETag": etag})
+                data = self.ctx.get_option_param()
+                # Convert tags and schemas to dicts for JSON serialization
+                content = {
+                    "tags": [self._tag_to_dict(t) for t in data["tags"]],
+                    "schemas": [self._schema_summary_to_dict(s) for s in data["schemas"]],
+                    "enable_brief_mode": data["enable_brief_mode"],
+                    "version": data["version"],
+                    "initial_page_policy": data["initial_page_policy"],
+                    "swagger_url": data["swagger_url"],
+                    "has_er_diagram": data["has_er_diagram"],
+                    "enable_pydantic_resolve_meta": data["enable_pydantic_resolve_meta"],
+                    "framework_name": data["framework_name"],
+                    "server_layout": data["server_layout"],
+                }
+                return Response(content=content, media_type=MediaType.JSON, headers={"ETag": etag})
+
+            return await self.ctx.run_blocking(build)
+
+        @post("/schemas")
+        async def get_schema_details(request: Request) -> dict:
+            payload = await request.json()
+            schemas = await self.ctx.run_blocking(
+                self.ctx.get_schema_details, payload.get("schema_ids") or []
+            )
+            return {"schemas": [self._schema_to_dict(s) for s in schemas]}
+
+        @get("/search")
+        async def search(
+            q: Annotated[str, Parameter()] = "",
+            limit: Annotated[int, Parameter()] = SEARCH_LIMIT,
+            kinds: Annotated[str | None, Parameter()] = None,
+        ) -> dict:
+            hits = await self.ctx.run_blocking(self.ctx.search, q, limit, kinds)
+            return {"query": q, "hits": [asdict(h) for h in hits]}
+
+        @get("/stats")
+        async def get_stats() -> dict:
+            # answered on the loop, it must respond while the offload pool is busy
+            return self.ctx.get_stats()
 
         @post("/dot-search")
         async def get_search_dot(request: Request) -> dict:
             payload = await request.json()
-            tags = self.ctx.get_search_dot(payload)
+            tags = await self.ctx.run_blocking(self.ctx.get_search_dot, payload)
             return {"tags": [self._tag_to_dict(t) for t in tags]}
 
         @post("/dot")
-        async def get_filtered_dot(request: Request) -> str:
+        async def get_filtered_dot(request: Request) -> Response | Stream:
+            payload = await request.json()
+            if_none_match = request.headers.get("if-none-match")
+
+            def build() -> Response | Stream:
+                etag = self.ctx.get_filtered_dot_etag(payload)
+                if etag_matches(if_none_match, etag):
+                    return Response(content=b"", status_code=304, headers={"ETag": etag})
+                chunks = self.ctx.stream_filtered_dot(payload)
+                return Stream(
+                    self.ctx.iterate_blocking(chunks),
+                    media_type=MediaType.TEXT,
+                    headers={"ETag": etag},
+                )
+
+            return await self.ctx.run_blocking(build)
+
+        @post("/dot-layout")
+        async def get_filtered_dot_layout(request: Request) -> Response:
             payload = await request.json()
-            return self.ctx.get_filtered_dot(payload)
+            if_none_match = request.headers.get("if-none-match")
+
+            def build() -> Response:
+                etag = self.ctx.get_filtered_layout_etag(payload)
+                if etag_matches(if_none_match, etag):
+                    return Response(content=b"", status_code=304, headers={"ETag": etag})
+                try:
+                    svg = self.ctx.get_filtered_layout(payload)
+                except LayoutError as e:
+                    return Response(
+                        content={"error": str(e)}, status_code=503, media_type=MediaType.JSON
+                    )
+                return Response(content=svg, media_type="image/svg+xml", headers={"ETag": etag})
+
+            return await self.ctx.run_blocking(build)
 
         @post("/dot-core-data")
         async def get_filtered_dot_core_data(request: Request) -> CoreData:
             payload = await request.json()
-            return self.ctx.get_core_data(payload)
+            return await self.ctx.run_blocking(self.ctx.get_core_data, payload)
 
         @post("/dot-render-core-data")
         async def render_dot_from_core_data(request: Request) -> str:
             payload = await request.json()
-            core_data = CoreData(**payload)
-            return self.ctx.render_dot_from_core_data(core_data)
+            return await self.ctx.run_blocking(
+                lambda: self.ctx.render_dot_from_core_data(CoreData(**payload))
+            )
 
         @get("/", media_type=MediaType.HTML)
         async def index() -> str:
@@ -115,7 +197,9 @@ class LitestarAdapter(VoyagerAdapter):
         @post("/source")
         async def get_object_by_module_name(request: Request) -> dict:
             payload = await request.json()
-            result = self.ctx.get_source_code(payload.get("schema_name", ""))
+            result = await self.ctx.run_blocking(
+                self.ctx.get_source_code, payload.get("schema_name", "")
+            )
             status_code = 200 if "error" not in result else 400
             if "error" in result and "not found" in result["error"]:
                 status_code = 404
@@ -128,7 +212,9 @@ class LitestarAdapter(VoyagerAdapter):
         @post("/vscode-link")
         async def get_vscode_link_by_module_name(request: Request) -> dict:
             payload = await request.json()
-            result = self.ctx.get_vscode_link(payload.get("schema_name", ""))
+            result = await self.ctx.run_blocking(
+                self.ctx.get_vscode_link, payload.get("schema_name", "")
+            )
             status_code = 200 if "error" not in result else 400
             if "error" in result and "not found" in result["error"]:
                 status_code = 404
@@ -141,7 +227,7 @@ class LitestarAdapter(VoyagerAdapter):
         # Create static files router using the new API (replaces deprecated StaticFilesConfig)
         static_files_router = create_static_files_router(
             path=STATIC_FILES_PATH,
-            directories=[str(WEB_DIR)],
+            directories=[str(ensure_web_dir())],
         )
 
         # Create Litestar app
@@ -149,8 +235,12 @@ class LitestarAdapter(VoyagerAdapter):
             route_handlers=[
                 get_er_diagram,
                 get_dot,
+                get_schema_details,
+                search,
+                get_stats,
                 get_search_dot,
                 get_filtered_dot,
+                get_filtered_dot_layout,
                 get_filtered_dot_core_data,
                 render_dot_from_core_data,
                 index,
@@ -160,7 +250,15 @@ class LitestarAdapter(VoyagerAdapter):
                 get_vscode_link_by_module_name,
                 static_files_router,
             ],
+            on_startup=[self.ctx.startup],
+            on_shutdown=[self.ctx.shutdown],
         )
+        # a mounted voyager app gets no lifespan events of its own, follow the host app's
+        if isinstance(self.ctx.target_app, Litestar):
+            self.ctx.target_app.on_startup.append(self.ctx.startup)
+            self.ctx.target_app.on_shutdown.append(self.ctx.shutdown)
+        # expose the context so callers can invalidate the cached graph
+        app.state.voyager_context = self.ctx
 
         return app
 
@@ -177,11 +275,16 @@ class LitestarAdapter(VoyagerAdapter):
                     "unique_id": r.unique_id,
                     "response_schema": r.response_schema,
                     "is_primitive": r.is_primitive,
+                    "path": r.path,
                 }
                 for r in tag.routes
             ],
         }
 
+    def _schema_summary_to_dict(self, schema: SchemaSummary) -> dict:
+        """Convert SchemaSummary to dict."""
+        return {"id": schema.id, "module": schema.module, "name": schema.name}
+
     def _schema_to_dict(self, schema: SchemaNode) -> dict:
         """Convert SchemaNode to dict."""
         return {
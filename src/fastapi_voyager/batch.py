@@ -0,0 +1,198 @@
+"""
+Render many views of one app in one run, for the CLI ``--views`` mode.
+
+The app is analyzed once, then every view is filtered and rendered from the shared
+`GraphIndex`, in parallel through a `ProcessPoolRenderExecutor`. ER diagram views need the
+live classes and render in the calling process. Results are written to an output directory
+together with a ``manifest.json``.
+
+A views spec is a JSON file::
+
+    {
+      "module_color": {"app.models": "tomato"},
+      "module_prefix": "app.models",
+      "views": [
+        {"name": "page", "tags": ["page"]},
+        {"name": "story", "schema": "app.models.Story", "show_fields": "all"},
+        {"name": "page-brief", "tags": ["page"], "brief": true},
+        {"name": "er", "er_diagram": "app.models:diagram"}
+      ]
+    }
+"""
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+
+from fastapi_voyager.er_diagram import VoyagerErDiagram
+from fastapi_voyager.graph import GraphIndex
+from fastapi_voyager.render_executor import ProcessPoolRenderExecutor, RenderExecutor
+from fastapi_voyager.version import __version__
+from fastapi_voyager.voyager import Voyager
+
+logger = getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+
+# view spec key -> Voyager argument
+VIEW_OPTIONS = {
+    'tags': 'include_tags',
+    'schema': 'schema',
+    'schema_field': 'schema_field',
+    'show_fields': 'show_fields',
+    'route_name': 'route_name',
+    'hide_primitive_route': 'hide_primitive_route',
+    'show_module': 'show_module',
+    'show_pydantic_resolve_meta': 'show_pydantic_resolve_meta',
+}
+
+# view spec keys of ER diagram views, passed to VoyagerErDiagram
+ER_VIEW_OPTIONS = ('show_fields', 'show_module', 'edge_minlen', 'show_methods')
+
+_VIEW_NAME = re.compile(r'^[\w.-]+$')
+
+
+@dataclass
+class ViewSpec:
+    """One view to render, ``options`` are view spec keys, see VIEW_OPTIONS / ER_VIEW_OPTIONS."""
+    name: str
+    options: dict[str, Any] = field(default_factory=dict)
+    brief: bool = False
+    module_prefix: str | None = None
+    # 'module:attribute' of a pydantic-resolve ErDiagram, for ER diagram views
+    er_diagram: str | None = None
+
+
+@dataclass
+class BatchSpec:
+    views: list[ViewSpec]
+    module_color: dict[str, str] = field(default_factory=dict)
+
+
+def parse_spec(data: dict | list) -> BatchSpec:
+    """Validate a views spec, a bare list is taken as the ``views``."""
+    if isinstance(data, list):
+        data = {'views': data}
+    module_prefix = data.get('module_prefix')
+    views: list[ViewSpec] = []
+    seen: set[str] = set()
+    for item in data.get('views') or []:
+        item = dict(item)
+        name = item.pop('name', None)
+        if not name or not _VIEW_NAME.match(name):
+            raise ValueError(f'view name must match {_VIEW_NAME.pattern}: {name!r}')
+        if name in seen:
+            raise ValueError(f'duplicated view name: {name}')
+        seen.add(name)
+
+        er_diagram = item.pop('er_diagram', None)
+        brief = bool(item.pop('brief', False))
+        prefix = item.pop('module_prefix', module_prefix)
+        allowed = ER_VIEW_OPTIONS if er_diagram else VIEW_OPTIONS
+        unknown = set(item) - set(allowed)
+        if unknown:
+            raise ValueError(f'unknown options for view {name}: {", ".join(sorted(unknown))}')
+        views.append(ViewSpec(
+            name=name, options=item, brief=brief, module_prefix=prefix, er_diagram=er_diagram
+        ))
+    if not views:
+        raise ValueError('views spec has no views')
+    return BatchSpec(views=views, module_color=dict(data.get('module_color') or {}))
+
+
+def load_spec(path: str | Path) -> BatchSpec:
+    with open(path, encoding='utf-8') as f:
+        return parse_spec(json.load(f))
+
+
+def _load_object(target: str) -> Any:
+    module_name, _, attr = target.partition(':')
+    if not attr:
+        raise ValueError(f"expected 'module:attribute', got {target!r}")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def render_views(
+    app: Any,
+    spec: BatchSpec,
+    output_dir: str | Path,
+    *,
+    workers: int | None = None,
+    cache_dir: str | None = None,
+) -> dict:
+    """
+    Render every view of ``spec`` into ``output_dir`` as ``<name>.dot``, return the manifest.
+
+    ``workers`` render processes are used, default one per CPU, 1 renders in this process.
+    With ``cache_dir`` the analysis is shared with other runs, see `snapshot_cache`.
+    """
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    analyzer = Voyager()
+    if cache_dir:
+        from fastapi_voyager.snapshot_cache import load_or_collect_snapshot
+
+        snapshot = load_or_collect_snapshot(analyzer, app, cache_dir)
+    else:
+        snapshot = analyzer.collect_snapshot(app)
+    index = GraphIndex(snapshot)
+    analysis_seconds = time.perf_counter() - start
+
+    workers = workers or os.cpu_count() or 1
+    graph_views = [v for v in spec.views if not v.er_diagram]
+    if workers > 1 and len(graph_views) > 1:
+        executor = ProcessPoolRenderExecutor(workers)
+    else:
+        executor = RenderExecutor()
+
+    def render(view: ViewSpec) -> dict:
+        view_start = time.perf_counter()
+        if view.er_diagram:
+            dot = VoyagerErDiagram(_load_object(view.er_diagram), **view.options).render_dot()
+        else:
+            voyager_kwargs = {VIEW_OPTIONS[k]: v for k, v in view.options.items()}
+            voyager_kwargs['module_color'] = spec.module_color
+            dot = executor.render_view(
+                index, voyager_kwargs, brief=view.brief, module_prefix=view.module_prefix
+            )
+        file_name = f'{view.name}.dot'
+        (output / file_name).write_text(dot, encoding='utf-8')
+        return {
+            'name': view.name,
+            'file': file_name,
+            'options': view.options,
+            'brief': view.brief,
+            'module_prefix': view.module_prefix,
+            'er_diagram': view.er_diagram,
+            'size': len(dot),
+            'seconds': round(time.perf_counter() - view_start, 4),
+        }
+
+    try:
+        # ER diagrams inspect live classes, render them here, graph views go to the executor
+        entries = {v.name: render(v) for v in spec.views if v.er_diagram}
+        with ThreadPoolExecutor(max(1, min(workers, len(graph_views)))) as pool:
+            entries.update((e['name'], e) for e in pool.map(render, graph_views))
+    finally:
+        executor.shutdown()
+
+    manifest = {
+        'version': __version__,
+        'fingerprint': index.fingerprint,
+        'analysis_seconds': round(analysis_seconds, 4),
+        'total_seconds': round(time.perf_counter() - start, 4),
+        'views': [entries[v.name] for v in spec.views],
+    }
+    (output / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    logger.info(f'{len(spec.views)} views written to {output}')
+    return manifest
@@ -7,9 +7,7 @@ import os
 import sys
 from typing import Any
 
-from fastapi_voyager import server as viz_server
 from fastapi_voyager.version import __version__
-from fastapi_voyager.voyager import Voyager
 
 logger = logging.getLogger(__name__)
 
@@ -125,9 +123,16 @@ def generate_visualization(
     show_fields: bool = False,
     module_color: dict[str, str] | None = None,
     route_name: str | None = None,
+    cache_dir: str | None = None,
 ):
 
-    """Generate DOT file for API router visualization."""
+    """Generate DOT file for API router visualization.
+
+    With ``cache_dir`` the analysis is cached on disk and reused by later runs on the
+    unchanged app, see `fastapi_voyager.snapshot_cache`.
+    """
+    from fastapi_voyager.voyager import Voyager
+
     analytics = Voyager(
         include_tags=tags,
         schema=schema,
@@ -136,13 +141,16 @@ def generate_visualization(
         route_name=route_name,
     )
 
-    analytics.analysis(app)
+    if cache_dir:
+        from fastapi_voyager.snapshot_cache import load_or_collect_snapshot
 
-    dot_content = analytics.render_dot()
-    
-    # Optionally write to file
+        analytics.load_snapshot(load_or_collect_snapshot(analytics, app, cache_dir))
+    else:
+        analytics.analysis(app)
+
+    # Write chunk by chunk, large graphs never exist as one string
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(dot_content)
+        f.writelines(analytics.render_dot_stream())
     logger.info(f"DOT file generated: {output_file}")
     logger.info("To render the graph, use: dot -Tpng router_viz.dot -o router_viz.png")
     logger.info("Or view online: https://dreampuf.github.io/GraphvizOnline/")
@@ -163,6 +171,8 @@ Examples:
   voyager -m tests.demo --web fastapi --tags=page restful                               # filter routes by tags
   voyager -m tests.demo --web fastapi --module_color=tests.demo:red --module_color=tests.service:yellow
   voyager -m tests.demo --web fastapi -o my_graph.dot                                   # Output to my_graph.dot
+  voyager -m tests.demo --web fastapi --tags=page --cache_dir=.voyager_cache            # reuse analysis across runs
+  voyager -m tests.demo --web fastapi --views=views.json --output_dir=diagrams          # render many views at once
   voyager -m tests.demo --web fastapi --server                                          # start a local server to preview
   voyager -m tests.demo --web fastapi --server --port=8001                              # start a local server to preview
 """
@@ -256,6 +266,35 @@ Examples:
         default=None,
         help="Filter by route id (format: <endpoint>_<path with _>)"
     )
+    parser.add_argument(
+        "--cache_dir",
+        type=str,
+        default=None,
+        help=(
+            "Cache the analyzed app in this directory, later runs with other filters reuse it "
+            "until routes or their source files change"
+        )
+    )
+    parser.add_argument(
+        "--views",
+        metavar="SPEC",
+        default=None,
+        help=(
+            "Render every view of a JSON views spec into --output_dir, analyzing the app once "
+            "(see fastapi_voyager.batch)"
+        )
+    )
+    parser.add_argument(
+        "--output_dir",
+        default="voyager_views",
+        help="Output directory for --views (default: voyager_views)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Render processes for --views (default: one per CPU, 1 renders in-process)"
+    )
     parser.add_argument(
         "--log-level",
         dest="log_level",
@@ -269,6 +308,9 @@ Examples:
     if args.module_prefix and not args.server:
         parser.error("--module_prefix can only be used together with --server")
 
+    if args.views and args.server:
+        parser.error("--views cannot be used together with --server")
+
     if not (args.module_name or args.module):
         parser.error("You must provide a module file or -m module name")
 
@@ -319,8 +361,10 @@ Examples:
                 logger.info("uvicorn is required to run the server. Install via 'pip install uvicorn' or 'uv add uvicorn'.")
                 sys.exit(1)
 
+            from fastapi_voyager.server import create_voyager
+
             # Create voyager app - it auto-detects framework and returns appropriate app type
-            app_server = viz_server.create_voyager(
+            app_server = create_voyager(
                 app,
                 module_color=module_color,
                 module_prefix=args.module_prefix,
@@ -328,6 +372,12 @@ Examples:
             )
             logger.info(f"Starting {args.web} preview server at http://{args.host}:{args.port} ... (Ctrl+C to stop)")
             uvicorn.run(app_server, host=args.host, port=args.port, log_level=level_name.lower())
+        elif args.views:
+            from fastapi_voyager.batch import load_spec, render_views
+
+            spec = load_spec(args.views)
+            spec.module_color.update(module_color or {})
+            render_views(app, spec, args.output_dir, workers=args.workers, cache_dir=args.cache_dir)
         else:
             # Generate and write dot file locally
             generate_visualization(
@@ -338,6 +388,7 @@ Examples:
                 show_fields=args.show_fields,
                 module_color=module_color,
                 route_name=args.route_name,
+                cache_dir=args.cache_dir,
             )
     except Exception as e:
         logger.info(f"Error generating visualization: {e}")
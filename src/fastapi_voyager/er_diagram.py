@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from logging import getLogger
 
 from pydantic import BaseModel
@@ -18,9 +19,10 @@ from fastapi_voyager.type import (
     SchemaNode,
 )
 from fastapi_voyager.type_helper import (
+    class_memo,
     full_class_name,
     get_core_types,
-    get_type_name,
+    get_field_records,
     is_list,
     safe_issubclass,
     update_forward_refs,
@@ -145,7 +147,7 @@ class VoyagerErDiagram:
         self.show_methods = show_methods
     
     def generate_node_head(self, link_name: str):
-        return f'{link_name}::{PK}'
+        return sys.intern(f'{link_name}::{PK}')
 
     def analysis_entity(self, entity: Entity):
         schema = entity.kls
@@ -258,6 +260,7 @@ class VoyagerErDiagram:
                 for entity in self.er_diagram.entities
         }
 
+        update_forward_refs(*(entity.kls for entity in self.er_diagram.entities))
         for entity in self.er_diagram.entities:
             self.analysis_entity(entity)
         renderer = DiagramRenderer(
@@ -272,17 +275,20 @@ class VoyagerErDiagram:
 
 def get_fields(schema: type[BaseModel], fk_set: set[str] | None = None) -> list[FieldInfo]:
 
-    fields: list[FieldInfo] = []
-    for k, v in schema.model_fields.items():
-        anno = v.annotation
-        fields.append(FieldInfo(
-            is_object=k in fk_set if fk_set is not None else False,
-            name=k,
-            from_base=False,
-            type_name=get_type_name(anno),
-            is_exclude=bool(v.exclude)
-        ))
-    return fields
+    def _build() -> list[FieldInfo]:
+        return [
+            FieldInfo(
+                is_object=r.name in fk_set if fk_set is not None else False,
+                name=r.name,
+                from_base=False,
+                type_name=r.type_name,
+                is_exclude=r.is_exclude
+            )
+            for r in get_field_records(schema)
+        ]
+
+    key = ('er_fields', frozenset(fk_set) if fk_set is not None else None)
+    return list(class_memo(schema, key, _build))
 
 
 def get_queries_and_mutations(
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+from array import array
 from collections import deque
+from typing import TYPE_CHECKING
 
-from fastapi_voyager.type import PK, Link, Route, SchemaNode, Tag
+from fastapi_voyager.type import PK, Link, LinkType, Route, SchemaNode, Tag
+
+if TYPE_CHECKING:
+    from fastapi_voyager.graph import GraphIndex
+
+# parent/subset links are the ones pruned by schema_field
+PRUNABLE_LINK_TYPES: tuple[LinkType, ...] = ("parent", "subset")
 
 
 def filter_graph(
@@ -14,6 +22,10 @@ def filter_graph(
     nodes: list[SchemaNode],
     links: list[Link],
     node_set: dict[str, SchemaNode],
+    index: GraphIndex | None = None,
+    mask: bytearray | None = None,
+    node_rank: array | None = None,
+    link_rank: array | None = None,
 ) -> tuple[list[Tag], list[Route], list[SchemaNode], list[Link]]:
     """Filter tags, routes, schema nodes and links based on a target schema and optional field.
 
@@ -26,83 +38,121 @@ def filter_graph(
          - Upstream: reverse walk (collect nodes that point to current frontier) -> brings in children & entry chain.
          - Downstream: forward walk (collect targets from current frontier) -> brings in ancestors.
       5. Keep only objects (tags, routes, nodes, links) whose origin ids are in the collected set.
+
+    `index` is a prebuilt GraphIndex over a graph containing the inputs. When given, the traversal
+    runs on its integer handles and adjacency, so the cost is proportional to the collected
+    subgraph instead of the whole link list. `mask` restricts the index to the handles the inputs
+    actually hold (e.g. a GraphView projection), by default every tag / route / schema is used.
+    Results keep the order of the inputs: `node_rank` / `link_rank` give the position of each
+    handle / link in `nodes` / `links` when it differs from the index order.
+    Without `index`, one is built from the inputs.
     """
     if schema is None:
         return tags, routes, nodes, links
 
-    seed_node_ids = {n.id for n in nodes if n.id == schema}
-    if not seed_node_ids:
+    if index is None:
+        from fastapi_voyager.graph import GraphIndex, GraphSnapshot
+
+        index = GraphIndex(
+            GraphSnapshot(tags=tags, routes=routes, nodes=nodes, links=links, node_set=node_set)
+        )
+        mask = node_rank = link_rank = None
+
+    if mask is None:
+        n_objects = index.n_objects
+
+        def inside(h: int) -> bool:
+            return h < n_objects
+    else:
+        inside = mask.__getitem__
+
+    start = index.handle.get(schema)
+    if start is None or index.node_index[start] < 0 or not inside(start):
         return tags, routes, nodes, links
 
-    # Step 1: schema_field pruning logic for parent/subset links
+    link_src, link_dst, link_type = index.link_src, index.link_dst, index.link_type
+    n_handles = len(index.ids)
+    prunable = index.type_codes(PRUNABLE_LINK_TYPES)
+
+    # Step 1: schema_field pruning logic for parent/subset links, None means keep all
+    accepted: bytearray | None = None
+    # breadth-first layer of each accepted schema, accepted links are listed layer by layer
+    depth: dict[int, int] = {start: 0}
     if schema_field:
-        current_targets = set(seed_node_ids)
-        accepted_targets = set(seed_node_ids)
-        accepted_links: list[Link] = []
-        parent_subset_links = [lk for lk in links if lk.type in ("parent", "subset")]
-        other_links = [lk for lk in links if lk.type not in ("parent", "subset")]
-
-        while current_targets:
-            next_targets: set[str] = set()
-            for lk in parent_subset_links:
-                if (
-                    lk.target_origin in current_targets
-                    and lk.source_origin not in accepted_targets
-                    and lk.source_origin in node_set
-                    and lk.target_origin in node_set
-                ):
-                    src_node = node_set.get(lk.source_origin)
-                    if src_node and any(f.name == schema_field for f in src_node.fields):
-                        accepted_links.append(lk)
-                        next_targets.add(lk.source_origin)
-                        accepted_targets.add(lk.source_origin)
-                elif lk.target_origin in current_targets and lk.source_origin in accepted_targets:
-                    src_node = node_set.get(lk.source_origin)
-                    if src_node and any(f.name == schema_field for f in src_node.fields):
-                        if lk not in accepted_links:
-                            accepted_links.append(lk)
-            current_targets = next_targets
-        filtered_links = other_links + accepted_links
+        accepted = bytearray(len(index.links))
+        has_field = index.handles_with_field(schema_field)
+        layer = [start]
+        while layer:
+            next_layer = []
+            for target in layer:
+                for pos in index.in_adj[target]:
+                    if link_type[pos] not in prunable:
+                        continue
+                    source = link_src[pos]
+                    if source in has_field and inside(source):
+                        accepted[pos] = 1
+                        if source not in depth:
+                            depth[source] = depth[target] + 1
+                            next_layer.append(source)
+            layer = next_layer
+
+    def usable(pos: int) -> bool:
+        return accepted is None or link_type[pos] not in prunable or bool(accepted[pos])
+
+    # Step 2: upstream (reverse) and downstream (forward) traversal
+    included = bytearray(n_handles)
+    included[start] = 1
+    included_handles = [start]
+    for adj, end in ((index.in_adj, link_src), (index.out_adj, link_dst)):
+        visited = bytearray(n_handles)
+        visited[start] = 1
+        frontier = [start]
+        while frontier:
+            h = frontier.pop()
+            for pos in adj[h]:
+                other = end[pos]
+                if visited[other] or not usable(pos) or not inside(other):
+                    continue
+                visited[other] = 1
+                frontier.append(other)
+                if not included[other]:
+                    included[other] = 1
+                    included_handles.append(other)
+
+    out_adj = index.out_adj
+    link_positions = [
+        pos
+        for h in included_handles
+        for pos in out_adj[h]
+        if included[link_dst[pos]] and usable(pos)
+    ]
+
+    handle = index.handle
+    if node_rank is None:
+        _nodes = index.nodes_of(included_handles)
+    else:
+        node_index = index.node_index
+        schema_handles = sorted(
+            (h for h in included_handles if node_index[h] >= 0), key=node_rank.__getitem__
+        )
+        _nodes = [index.nodes[node_index[h]] for h in schema_handles]
+    if accepted is not None:
+        # other links keep their order, accepted parent / subset links follow, see above
+        rank = link_rank.__getitem__ if link_rank is not None else int
+
+        def link_order(pos: int) -> tuple[int, int, int]:
+            if link_type[pos] in prunable:
+                return 1, depth[link_dst[pos]], rank(pos)
+            return 0, 0, rank(pos)
+
+        _links = [index.links[p] for p in sorted(link_positions, key=link_order)]
+    elif link_rank is None:
+        _links = index.links_at(link_positions)
     else:
-        filtered_links = links
-
-    # Step 2: build adjacency maps
-    fwd: dict[str, set[str]] = {}
-    rev: dict[str, set[str]] = {}
-    for lk in filtered_links:
-        fwd.setdefault(lk.source_origin, set()).add(lk.target_origin)
-        rev.setdefault(lk.target_origin, set()).add(lk.source_origin)
-
-    # Upstream (reverse) traversal
-    upstream: set[str] = set()
-    frontier = set(seed_node_ids)
-    while frontier:
-        new_layer: set[str] = set()
-        for nid in frontier:
-            for src in rev.get(nid, ()):  # src points to nid
-                if src not in upstream and src not in seed_node_ids:
-                    new_layer.add(src)
-        upstream.update(new_layer)
-        frontier = new_layer
-
-    # Downstream (forward) traversal
-    downstream: set[str] = set()
-    frontier = set(seed_node_ids)
-    while frontier:
-        new_layer: set[str] = set()
-        for nid in frontier:
-            for tgt in fwd.get(nid, ()):  # nid points to tgt
-                if tgt not in downstream and tgt not in seed_node_ids:
-                    new_layer.add(tgt)
-        downstream.update(new_layer)
-        frontier = new_layer
-
-    included_ids: set[str] = set(seed_node_ids) | upstream | downstream
-
-    _nodes = [n for n in nodes if n.id in included_ids]
-    _links = [l for l in filtered_links if l.source_origin in included_ids and l.target_origin in included_ids]
-    _tags = [t for t in tags if t.id in included_ids]
-    _routes = [r for r in routes if r.id in included_ids]
+        _links = [index.links[p] for p in sorted(link_positions, key=link_rank.__getitem__)]
+
+    _tags = [t for t in tags if t.id in handle and included[handle[t.id]]]
+    _routes = [r for r in routes if r.id in handle and included[handle[r.id]]]
 
     return _tags, _routes, _nodes, _links
 
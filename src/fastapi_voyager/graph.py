@@ -0,0 +1,537 @@
+"""
+Analyzed graph snapshot shared across requests.
+
+Analysis walks every route of the target app and inspects live pydantic classes, which is
+expensive on large apps. The result only changes when routes are added or removed, so it
+is captured once as a ``GraphSnapshot``, indexed once as a ``GraphIndex``, and every
+filter / render path reads it through a cheap per-request ``GraphView``.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, TypeVar, get_args
+
+from fastapi_voyager.filter import filter_graph
+from fastapi_voyager.type import Link, LinkType, Route, SchemaNode, Tag
+
+SCHEMA_LINK_TYPES: tuple[LinkType, ...] = ('schema', 'parent', 'subset')
+LINK_TYPES: tuple[LinkType, ...] = get_args(LinkType)
+
+# worst case bytes of route bitsets (schemas x routes / 8) `RouteReachability` may take,
+# larger graphs answer schema -> routes lookups by traversal
+REACHABILITY_MAX_BYTES = 32 << 20
+
+T = TypeVar('T')
+
+
+@dataclass
+class GraphSnapshot:
+    """Unfiltered analysis result of an app: every tag, route, schema node and link.
+
+    Objects inside a snapshot are shared between requests and must be treated as read-only,
+    consumers that need to mutate (e.g. sort ``Tag.routes``) work on projected copies.
+    """
+    tags: list[Tag]
+    routes: list[Route]
+    nodes: list[SchemaNode]
+    links: list[Link]
+    node_set: dict[str, SchemaNode] = field(default_factory=dict)
+
+
+class GraphIndex:
+    """
+    Immutable lookup structure over a GraphSnapshot.
+
+    - id -> object maps for tags, routes and schema nodes
+    - routes per tag name
+    - dense integer handles for every tag / route / schema / link endpoint id, traversal
+      (views, filter_graph) runs on handles, link arrays and adjacency lists of link
+      positions, strings are only looked up to materialize results
+    - lazily built derived data (render caches, ...), see `cached`, which lives and dies
+      with the index
+    """
+
+    def __init__(self, snapshot: GraphSnapshot):
+        self.snapshot = snapshot
+        self.tags = snapshot.tags
+        self.routes = snapshot.routes
+        self.nodes = snapshot.nodes
+        self.links = snapshot.links
+
+        self.tag_map: dict[str, Tag] = {t.id: t for t in self.tags}
+        self.tag_by_name: dict[str, Tag] = {t.name: t for t in self.tags}
+        self.route_map: dict[str, Route] = {r.id: r for r in self.routes}
+        self.node_map: dict[str, SchemaNode] = snapshot.node_set or {n.id: n for n in self.nodes}
+
+        self.tag_pos: dict[str, int] = {t.id: i for i, t in enumerate(self.tags)}
+
+        # handle -> id and id -> handle
+        self.ids: list[str] = []
+        self.handle: dict[str, int] = {}
+        intern = self._intern
+        for items in (self.tags, self.routes, self.nodes):
+            for item in items:
+                intern(item.id)
+        # handles below this belong to a tag, route or schema node, the rest are link
+        # endpoints without an object
+        self.n_objects = len(self.ids)
+
+        # link type codes, see LINK_TYPES
+        self.type_code: dict[str, int] = {lt: i for i, lt in enumerate(LINK_TYPES)}
+
+        # per link: source / target handle and type code
+        self.link_src = array('l', (intern(lk.source_origin) for lk in self.links))
+        self.link_dst = array('l', (intern(lk.target_origin) for lk in self.links))
+        self.link_type = bytearray(self._code(lk.type) for lk in self.links)
+
+        # handle -> schema node position, -1 for tags / routes / unknown endpoints
+        self.node_index = array('l', [-1]) * len(self.ids)
+        for i, node in enumerate(self.nodes):
+            self.node_index[self.handle[node.id]] = i
+
+        # handle -> positions of links leaving / entering it, in analysis order
+        self.out_adj: list[list[int]] = [[] for _ in self.ids]
+        self.in_adj: list[list[int]] = [[] for _ in self.ids]
+        for pos, (src, dst) in enumerate(zip(self.link_src, self.link_dst, strict=True)):
+            self.out_adj[src].append(pos)
+            self.in_adj[dst].append(pos)
+
+        self._derived: dict[str, Any] = {}
+        self._derived_lock = threading.Lock()
+
+    def _intern(self, origin: str) -> int:
+        h = self.handle.get(origin)
+        if h is None:
+            h = self.handle[origin] = len(self.ids)
+            self.ids.append(origin)
+        return h
+
+    def _code(self, link_type: str) -> int:
+        code = self.type_code.get(link_type)
+        if code is None:  # not a declared LinkType, keep it distinct anyway
+            code = self.type_code[link_type] = len(self.type_code)
+        return code
+
+    def type_codes(self, types: Iterable[str]) -> frozenset[int]:
+        """Codes of link types, for matching against ``link_type``."""
+        return frozenset(self.type_code[t] for t in types if t in self.type_code)
+
+    def cached(self, key: str, factory: Callable[[], T]) -> T:
+        """Get per-index derived data, building it with ``factory`` on first use."""
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+        with self._derived_lock:
+            if key not in self._derived:
+                self._derived[key] = factory()
+            return self._derived[key]
+
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of the snapshot, equal for equal analysis results."""
+        return self.cached('fingerprint', self._build_fingerprint)
+
+    def _build_fingerprint(self) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        for items in (self.tags, self.routes, self.nodes, self.links):
+            for item in items:
+                h.update(repr(item).encode())
+            h.update(b'\0')
+        return h.hexdigest()
+
+    def build_reachability(self) -> RouteReachability | None:
+        """
+        Build (once) and return the routes reaching each schema node, see `route_reachability`.
+        """
+        return self.cached('route_reachability', lambda: RouteReachability.build(self))
+
+    @property
+    def route_reachability(self) -> RouteReachability | None:
+        """Routes reaching each schema node, None when over REACHABILITY_MAX_BYTES."""
+        return self.build_reachability()
+
+    def nodes_with_field(self, field_name: str) -> set[str]:
+        """Ids of schema nodes declaring a field named ``field_name`` (inherited ones included)."""
+        return {self.ids[h] for h in self.handles_with_field(field_name)}
+
+    def handles_with_field(self, field_name: str) -> set[int]:
+        """Handles of schema nodes declaring a field named ``field_name``."""
+        field_index = self.cached('field_index', self._build_field_index)
+        return field_index.get(field_name, set())
+
+    def _build_field_index(self) -> dict[str, set[int]]:
+        field_index: dict[str, set[int]] = {}
+        for node in self.nodes:
+            h = self.handle[node.id]
+            for f in node.fields:
+                field_index.setdefault(f.name, set()).add(h)
+        return field_index
+
+    def out_links(self, origin: str, types: Iterable[str] | None = None) -> Iterator[int]:
+        """Positions of links whose source_origin is ``origin``."""
+        return self._links_of(self.out_adj, origin, types)
+
+    def in_links(self, origin: str, types: Iterable[str] | None = None) -> Iterator[int]:
+        """Positions of links whose target_origin is ``origin``."""
+        return self._links_of(self.in_adj, origin, types)
+
+    def _links_of(
+        self, adj: list[list[int]], origin: str, types: Iterable[str] | None
+    ) -> Iterator[int]:
+        h = self.handle.get(origin)
+        if h is None:
+            return iter(())
+        if types is None:
+            return iter(adj[h])
+        codes = self.type_codes(types)
+        link_type = self.link_type
+        return (pos for pos in adj[h] if link_type[pos] in codes)
+
+    def links_at(self, positions: Iterable[int]) -> list[Link]:
+        """Materialize link positions in analysis order."""
+        return [self.links[p] for p in sorted(positions)]
+
+    def nodes_of(self, handles: Iterable[int]) -> list[SchemaNode]:
+        """Materialize schema node handles in analysis order, other handles are skipped."""
+        node_index = self.node_index
+        return [self.nodes[i] for i in sorted(node_index[h] for h in handles if node_index[h] >= 0)]
+
+
+class RouteReachability:
+    """
+    Precomputed answer to "which routes reach schema X", the upstream half of `filter_graph`.
+
+    Every schema node handle maps to a bitset (an int) over route handles: bit ``h - base``
+    is set when route handle ``h`` reaches the node through its response model, fields,
+    parents and subsets. Bitsets are computed once per index over the strongly connected
+    components of the graph in topological order, nodes of one component share one int.
+    """
+
+    def __init__(self, index: GraphIndex, base: int, bits: dict[int, int]):
+        self.index = index
+        self.base = base
+        self.bits = bits
+
+    @classmethod
+    def build(
+        cls, index: GraphIndex, max_bytes: int = REACHABILITY_MAX_BYTES
+    ) -> RouteReachability | None:
+        """Reachability of ``index``, None when the worst case size exceeds ``max_bytes``."""
+        route_handles = sorted({index.handle[r.id] for r in index.routes})
+        if not route_handles:
+            return cls(index, 0, {})
+        base = route_handles[0]
+        n_bits = route_handles[-1] - base + 1
+        if len(index.nodes) * ((n_bits + 7) // 8) > max_bytes:
+            return None
+
+        is_route = bytearray(len(index.ids))
+        for h in route_handles:
+            is_route[h] = 1
+
+        link_src, in_adj = index.link_src, index.in_adj
+        bits = [0] * len(index.ids)
+        for component in reversed(cls._components(index, route_handles)):
+            # sources first: predecessors outside the component are final already
+            acc = 0
+            for h in component:
+                if is_route[h]:
+                    acc |= 1 << (h - base)
+                for pos in in_adj[h]:
+                    acc |= bits[link_src[pos]]
+            for h in component:
+                bits[h] = acc
+
+        node_index = index.node_index
+        return cls(index, base, {h: b for h, b in enumerate(bits) if b and node_index[h] >= 0})
+
+    @staticmethod
+    def _components(index: GraphIndex, roots: list[int]) -> list[list[int]]:
+        """
+        Strongly connected components reachable from ``roots``, sinks first (iterative Tarjan).
+        """
+        out_adj, link_dst = index.out_adj, index.link_dst
+        n = len(index.ids)
+        order = array('l', [-1]) * n
+        low = array('l', [0]) * n
+        on_stack = bytearray(n)
+        stack: list[int] = []
+        components: list[list[int]] = []
+        counter = 0
+
+        for root in roots:
+            if order[root] >= 0:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work = [(root, 0)]
+            while work:
+                v, i = work[-1]
+                adj = out_adj[v]
+                if i < len(adj):
+                    work[-1] = (v, i + 1)
+                    w = link_dst[adj[i]]
+                    if order[w] < 0:
+                        order[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = 1
+                        work.append((w, 0))
+                    elif on_stack[w] and order[w] < low[v]:
+                        low[v] = order[w]
+                    continue
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                if low[v] == order[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(component)
+        return components
+
+    def route_handles(self, schema: str) -> list[int]:
+        """Handles of the routes reaching schema node ``schema``, ascending."""
+        h = self.index.handle.get(schema)
+        b = self.bits.get(h, 0) if h is not None else 0
+        handles = []
+        while b:
+            low = b & -b
+            handles.append(self.base + low.bit_length() - 1)
+            b ^= low
+        return handles
+
+    def route_ids(self, schema: str) -> set[str]:
+        """Ids of the routes reaching schema node ``schema``."""
+        ids = self.index.ids
+        return {ids[h] for h in self.route_handles(schema)}
+
+    @property
+    def nbytes(self) -> int:
+        """Payload bytes of the bitsets, shared ones counted once."""
+        unique = {id(b): b for b in self.bits.values()}
+        return sum((b.bit_length() + 7) // 8 for b in unique.values())
+
+
+class GraphView:
+    """
+    Per-request projection of a GraphIndex.
+
+    Applies ``include_tags``, ``route_name`` and ``hide_primitive_route`` the same way a
+    filtered analysis would: keep the matching tags and routes, then the schema nodes
+    reachable from those routes. Work is proportional to the projected graph, the
+    unfiltered view reuses the index lists directly.
+
+    Tags are copied so callers may sort or trim ``Tag.routes``, everything else is shared.
+    """
+
+    def __init__(
+        self,
+        index: GraphIndex,
+        *,
+        include_tags: list[str] | None = None,
+        route_name: str | None = None,
+        hide_primitive_route: bool = False,
+    ):
+        self.index = index
+        self.include_tags = include_tags
+        self.route_name = route_name
+        self.hide_primitive_route = hide_primitive_route
+        self.is_full = not (include_tags or route_name is not None or hide_primitive_route)
+
+        if include_tags:
+            source_tags = sorted(
+                (
+                    index.tag_by_name[name]
+                    for name in set(include_tags)
+                    if name in index.tag_by_name
+                ),
+                key=lambda t: index.tag_pos[t.id],
+            )
+        else:
+            source_tags = index.tags
+
+        self.tags: list[Tag] = []
+        self.routes: list[Route] = []
+        for tag in source_tags:
+            tag_routes = [r for r in tag.routes if self._keep_route(r)]
+            self.tags.append(Tag(id=tag.id, name=tag.name, routes=tag_routes))
+            self.routes.extend(tag_routes)
+
+        self.tag_ids: set[str] = {t.id for t in self.tags}
+        self.route_ids: set[str] = {r.id for r in self.routes}
+
+        # positions in nodes / links, None when they are in index order
+        self.node_rank: array | None = None
+        self.link_rank: array | None = None
+
+        if self.is_full:
+            # every handle is part of the view
+            self.mask: bytearray | None = None
+            self.nodes = index.nodes
+            self.links = index.links
+            self.node_set = index.node_map
+        else:
+            handle = index.handle
+            self.mask = bytearray(len(index.ids))
+            for origin in self.tag_ids | self.route_ids:
+                self.mask[handle[origin]] = 1
+            node_handles, schema_links = self._analysis_order()
+            for h in node_handles:
+                self.mask[h] = 1
+            node_index = index.node_index
+            self.nodes = [index.nodes[node_index[h]] for h in node_handles]
+            positions = self._route_links() + schema_links
+            self.links = [index.links[pos] for pos in positions]
+            self.node_set = {n.id: n for n in self.nodes}
+            # position of each handle / link in self.nodes / self.links, see filter_graph
+            self.node_rank = array('l', [0]) * len(index.ids)
+            for i, h in enumerate(node_handles):
+                self.node_rank[h] = i
+            self.link_rank = array('l', [0]) * len(index.links)
+            for i, pos in enumerate(positions):
+                self.link_rank[pos] = i
+
+    def _keep_route(self, route: Route) -> bool:
+        if self.route_name is not None and route.id != self.route_name:
+            return False
+        if self.hide_primitive_route and route.is_primitive:
+            return False
+        return True
+
+    def _analysis_order(self) -> tuple[list[int], list[int]]:
+        """
+        Schema node handles and schema link positions reachable from the projected routes.
+
+        Both come in the order an analysis of only these routes (`Voyager.analysis_schemas`)
+        adds them: response models in route order, then depth first, subset and parent links
+        always followed, field links on first sight. Graphviz lays out clusters and nodes in
+        declaration order, so a filtered view draws the same diagram a filtered analysis did.
+        Links of a node are stored in that visiting order already (see `out_adj`).
+        """
+        index = self.index
+        link_dst, link_type, out_adj = index.link_dst, index.link_type, index.out_adj
+        route_codes = index.type_codes(('route_to_schema',))
+        schema_codes = index.type_codes(SCHEMA_LINK_TYPES)
+        always_followed = index.type_codes(('parent', 'subset'))
+
+        seen = bytearray(len(index.ids))
+        emitted = bytearray(len(index.links))
+        nodes: list[int] = []
+        links: list[int] = []
+        roots = [
+            link_dst[pos]
+            for route in self.routes
+            for pos in out_adj[index.handle[route.id]]
+            if link_type[pos] in route_codes
+        ]
+        for root in roots:
+            if not seen[root]:
+                seen[root] = 1
+                nodes.append(root)
+            # frames of (handle, next out_adj index), a handle may be re-entered like the
+            # recursive analysis does
+            stack = [(root, 0)]
+            while stack:
+                h, i = stack[-1]
+                adj = out_adj[h]
+                while i < len(adj) and link_type[adj[i]] not in schema_codes:
+                    i += 1
+                if i == len(adj):
+                    stack.pop()
+                    continue
+                stack[-1] = (h, i + 1)
+                pos = adj[i]
+                target = link_dst[pos]
+                if not seen[target]:
+                    seen[target] = 1
+                    nodes.append(target)
+                new = not emitted[pos]
+                if new:
+                    emitted[pos] = 1
+                    links.append(pos)
+                if new or link_type[pos] in always_followed:
+                    stack.append((target, 0))
+        return nodes, links
+
+    def _route_links(self) -> list[int]:
+        """Positions of the tag -> route and route -> schema links of the projected routes."""
+        index = self.index
+        mask, link_dst, link_type = self.mask, index.link_dst, index.link_type
+        out_adj = index.out_adj
+        tag_route = index.type_codes(('tag_route',))
+        route_to_schema = index.type_codes(('route_to_schema',))
+
+        positions: list[int] = []
+        for tid in self.tag_ids:
+            positions.extend(
+                pos for pos in out_adj[index.handle[tid]]
+                if link_type[pos] in tag_route and mask[link_dst[pos]]
+            )
+        for rid in self.route_ids:
+            positions.extend(
+                pos for pos in out_adj[index.handle[rid]] if link_type[pos] in route_to_schema
+            )
+        # analysis emits them route by route, as the snapshot does
+        positions.sort()
+        return positions
+
+    def contains(self, origin: str) -> bool:
+        """Whether a tag / route / schema id is part of this view."""
+        h = self.index.handle.get(origin)
+        if h is None:
+            return False
+        if self.mask is None:
+            return h < self.index.n_objects
+        return bool(self.mask[h])
+
+    def routes_reaching(self, schema: str | None) -> set[str] | None:
+        """
+        Ids of all routes reaching schema node ``schema``, from the index's `RouteReachability`.
+
+        Matches the routes ``filter(schema)`` keeps once intersected with this view's routes.
+        None when there is nothing to look up: no precomputed reachability, or ``schema`` is
+        not a schema node of this view, where ``filter`` returns the view unchanged.
+        """
+        reachability = self.index.route_reachability
+        if reachability is None or schema is None or not self.contains(schema):
+            return None
+        if self.index.node_index[self.index.handle[schema]] < 0:
+            return None
+        return reachability.route_ids(schema)
+
+    def filter(
+        self,
+        schema: str | None,
+        schema_field: str | None = None,
+    ) -> tuple[list[Tag], list[Route], list[SchemaNode], list[Link]]:
+        """Narrow the view to the neighbourhood of ``schema``, see ``filter.filter_graph``.
+
+        Traversal runs on the index restricted to this view, so it only touches the result.
+        """
+        return filter_graph(
+            schema=schema,
+            schema_field=schema_field,
+            tags=self.tags,
+            routes=self.routes,
+            nodes=self.nodes,
+            links=self.links,
+            node_set=self.node_set,
+            index=self.index,
+            mask=self.mask,
+            node_rank=self.node_rank,
+            link_rank=self.link_rank,
+        )
@@ -0,0 +1,159 @@
+"""
+Optional server-side Graphviz layout.
+
+The UI lays DOT out in the browser with Graphviz compiled to wasm, which takes many seconds
+for a few thousand nodes. When a local ``dot`` binary or pygraphviz is available,
+`ServerLayout` lays views out on the server instead and caches the result by DOT content,
+in memory and optionally on disk, so each distinct view is laid out once.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+from abc import ABC, abstractmethod
+from logging import getLogger
+from pathlib import Path
+
+from fastapi_voyager.render import RenderCache
+
+logger = getLogger(__name__)
+
+# output formats of `dot -T...` the layout can be requested in
+LAYOUT_FORMATS = ('svg', 'json')
+
+# laid out views kept in memory
+LAYOUT_CACHE_SIZE = 64
+
+# seconds a single layout may take
+LAYOUT_TIMEOUT = 300
+
+
+class LayoutError(RuntimeError):
+    """Server-side layout is unavailable or failed, clients fall back to laying out the DOT."""
+
+
+class LayoutEngine(ABC):
+    """Lays out a DOT graph with the ``dot`` algorithm."""
+
+    name: str
+
+    @abstractmethod
+    def layout(self, dot: str, fmt: str) -> str:
+        pass
+
+
+class DotBinaryEngine(LayoutEngine):
+    """Runs a local Graphviz ``dot`` executable."""
+
+    name = 'dot'
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def layout(self, dot: str, fmt: str) -> str:
+        try:
+            result = subprocess.run(
+                [self.path, f'-T{fmt}'],
+                input=dot,
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                timeout=LAYOUT_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            raise LayoutError(f'dot failed: {e}') from e
+        if result.returncode != 0:
+            raise LayoutError(f'dot failed: {result.stderr.strip()}')
+        return result.stdout
+
+
+class PygraphvizEngine(LayoutEngine):
+    """Uses the pygraphviz binding to libgraphviz."""
+
+    name = 'pygraphviz'
+
+    def layout(self, dot: str, fmt: str) -> str:
+        import pygraphviz
+
+        try:
+            return pygraphviz.AGraph(string=dot).draw(format=fmt, prog='dot').decode('utf-8')
+        except Exception as e:
+            raise LayoutError(f'pygraphviz failed: {e}') from e
+
+
+def find_layout_engine() -> LayoutEngine | None:
+    """The first available engine: a ``dot`` executable on PATH, then pygraphviz."""
+    path = shutil.which('dot')
+    if path is not None:
+        return DotBinaryEngine(path)
+    try:
+        import pygraphviz  # noqa: F401
+    except ImportError:
+        return None
+    return PygraphvizEngine()
+
+
+class ServerLayout:
+    """
+    Lays out DOT graphs on the server, caching results by content hash.
+
+    ``engine`` defaults to `find_layout_engine()`; without one `available` is False and the
+    UI keeps laying out in the browser. With ``cache_dir`` layouts are also stored on disk
+    and survive restarts.
+    """
+
+    def __init__(
+        self,
+        engine: LayoutEngine | None = None,
+        cache_dir: str | Path | None = None,
+        cache_size: int = LAYOUT_CACHE_SIZE,
+    ):
+        self.engine = engine or find_layout_engine()
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._memory = RenderCache(cache_size)
+        if self.engine is None:
+            logger.info('no Graphviz layout engine found, graphs are laid out in the browser')
+
+    @property
+    def available(self) -> bool:
+        return self.engine is not None
+
+    def cache_key(self, dot: str, fmt: str) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f'{self.engine.name if self.engine else ""}\0{fmt}\0'.encode())
+        h.update(dot.encode())
+        return h.hexdigest()
+
+    def layout(self, dot: str, fmt: str = 'svg') -> str:
+        """Laid out ``dot`` in ``fmt``, see LAYOUT_FORMATS."""
+        if self.engine is None:
+            raise LayoutError('no layout engine available')
+        if fmt not in LAYOUT_FORMATS:
+            raise ValueError(f'unsupported layout format: {fmt}')
+        key = self.cache_key(dot, fmt)
+        return self._memory.get_or_render(key, lambda: self._load_or_layout(key, dot, fmt))
+
+    def _load_or_layout(self, key: str, dot: str, fmt: str) -> str:
+        path = self.cache_dir / f'{key}.{fmt}' if self.cache_dir is not None else None
+        if path is not None and path.is_file():
+            return path.read_text(encoding='utf-8')
+
+        result = self.engine.layout(dot, fmt)
+        if path is not None:
+            self._write(path, result)
+        return result
+
+    @staticmethod
+    def _write(path: Path, content: str) -> None:
+        # write then rename, concurrent readers never see a partial file
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f'could not write layout cache {path}: {e}')
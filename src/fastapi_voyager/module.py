@@ -22,6 +22,8 @@ def _build_module_tree(
     """
     # Map from top-level module name to node
     top_modules: dict[str, N] = {}
+    # Child modules by name, per node (keyed by id(node)), so lookups don't scan parent.modules
+    children: dict[int, dict[str, N]] = {}
     # Items without module path
     root_level_items: list[I] = []
 
@@ -35,28 +37,33 @@ def _build_module_tree(
         return NodeClass(**kwargs)  # type: ignore[arg-type]
 
     def get_or_create(child_name: str, parent: N) -> N:
-        for m in parent.modules:
-            if m.name == child_name:
-                return m
+        siblings = children.setdefault(id(parent), {})
+        node = siblings.get(child_name)
+        if node is not None:
+            return node
         parent_full = parent.fullname
         fullname = child_name if not parent_full or parent_full == "__root__" else f"{parent_full}.{child_name}"
-        new_node = make_node(child_name, fullname)
-        parent.modules.append(new_node)
-        return new_node
+        node = siblings[child_name] = make_node(child_name, fullname)
+        parent.modules.append(node)
+        return node
 
-    # Build the tree
+    # Build the tree, items of one module path share the walk
+    by_path: dict[str, N] = {}
     for it in items:
         module_path = get_module_path(it) or ""
         if not module_path:
             root_level_items.append(it)
             continue
-        parts = module_path.split('.')
-        top_name = parts[0]
-        if top_name not in top_modules:
-            top_modules[top_name] = make_node(top_name, top_name)
-        current = top_modules[top_name]
-        for part in parts[1:]:
-            current = get_or_create(part, current)
+        current = by_path.get(module_path)
+        if current is None:
+            parts = module_path.split('.')
+            top_name = parts[0]
+            if top_name not in top_modules:
+                top_modules[top_name] = make_node(top_name, top_name)
+            current = top_modules[top_name]
+            for part in parts[1:]:
+                current = get_or_create(part, current)
+            by_path[module_path] = current
         getattr(current, item_list_attr).append(it)
 
     result: list[N] = list(top_modules.values())
@@ -64,22 +71,61 @@ def _build_module_tree(
         result.append(make_node("__root__", "__root__"))
         setattr(result[-1], item_list_attr, root_level_items)
 
-    # Collapse linear chains: no items on node and exactly one child module
-    def collapse(node: N) -> None:
+    # Collapse linear chains: no items on node and exactly one child module.
+    # Iterative, deep package trees must not hit the recursion limit.
+    stack = list(result)
+    while stack:
+        node = stack.pop()
         while len(node.modules) == 1 and len(getattr(node, item_list_attr)) == 0:
             child = node.modules[0]
             node.name = f"{node.name}.{child.name}"
             node.fullname = child.fullname
             setattr(node, item_list_attr, getattr(child, item_list_attr))
             node.modules = child.modules
-        for m in node.modules:
-            collapse(m)
-
-    for top in result:
-        collapse(top)
+        stack.extend(node.modules)
 
     return result
 
+class ModuleColorTrie:
+    """
+    Longest-prefix lookup of module colors, e.g. ``--module_color``.
+
+    Keys match the way ``fullname.startswith(key)`` does, the character trie finds the
+    longest matching key in one walk over ``fullname`` however many colors are configured.
+    """
+
+    def __init__(self, module_color: dict[str, str]):
+        # trie node: [children by character, color of the key ending here]
+        self._root: list[Any] = [{}, None]
+        for prefix, color in module_color.items():
+            node = self._root
+            for ch in prefix:
+                node = node[0].setdefault(ch, [{}, None])
+            node[1] = color
+
+    def match(self, fullname: str) -> str | None:
+        """Color of the longest key ``fullname`` starts with, None if there is none."""
+        node = self._root
+        color = node[1]
+        for ch in fullname:
+            node = node[0].get(ch)
+            if node is None:
+                break
+            if node[1] is not None:
+                color = node[1]
+        return color
+
+
+def assign_module_colors(modules: list[ModuleNode], colors: ModuleColorTrie) -> list[ModuleNode]:
+    """Set ``ModuleNode.color`` on every module of the tree, return ``modules``."""
+    stack = list(modules)
+    while stack:
+        node = stack.pop()
+        node.color = colors.match(node.fullname)
+        stack.extend(node.modules)
+    return modules
+
+
 def build_module_schema_tree(schema_nodes: list[SchemaNode]) -> list[ModuleNode]:
     """Build a module tree for schema nodes, grouped by their module path."""
     return _build_module_tree(
@@ -1,32 +1,59 @@
 """
 Render FastAPI application structure to DOT format using Jinja2 templates.
 """
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from functools import cache
 from logging import getLogger
 from pathlib import Path
+from typing import Any, Literal, TypeVar
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-from fastapi_voyager.module import build_module_route_tree, build_module_schema_tree
+from fastapi_voyager.module import (
+    ModuleColorTrie,
+    assign_module_colors,
+    build_module_route_tree,
+    build_module_schema_tree,
+)
 from fastapi_voyager.render_style import RenderConfig
 from fastapi_voyager.type import (
+    PK,
     FieldInfo,
     FieldType,
     Link,
     MethodInfo,
     ModuleNode,
     ModuleRoute,
-    PK,
     Route,
     SchemaNode,
     Tag,
 )
-from typing import Literal
+
+T = TypeVar('T')
 
 logger = getLogger(__name__)
 
 # Get the template directory relative to this file
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# target size of the chunks yielded by Renderer.render_dot_stream
+DOT_CHUNK_SIZE = 64 * 1024
+
+
+@cache
+def _get_environment(template_dir: Path) -> Environment:
+    """Shared Jinja2 environment per template dir, so templates compile once per process."""
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        # bundled templates never change at runtime, skip the mtime check on every lookup
+        auto_reload=False,
+    )
+
 
 class TemplateRenderer:
     """
@@ -35,12 +62,7 @@ class TemplateRenderer:
 
     def __init__(self, template_dir: Path = TEMPLATE_DIR):
         # Initialize Jinja2 environment
-        self.env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self.env = _get_environment(template_dir)
 
     def render_template(self, template_name: str, **context) -> str:
         """Render a template with the given context."""
@@ -48,6 +70,248 @@ class TemplateRenderer:
         return template.render(**context)
 
 
+# String builders producing byte-identical output to the bundled templates.
+# Jinja renders None as 'None' and a missing variable as '', the defaults below follow that.
+# Note trim_blocks / lstrip_blocks: an `{% if %}` line loses its indent and trailing newline.
+
+def _cluster(*, cluster_id, tooltip, border_color, label, content, pen_color=None, pen_width=None):
+    return (
+        f'subgraph cluster_{cluster_id} {{\n'
+        f'    tooltip="{tooltip}"\n'
+        f'    color = "{border_color}"\n'
+        '    style="rounded"\n'
+        f'    label = "  {label}"\n'
+        '    labeljust = "l"\n'
+        + (f'pencolor = "{pen_color}"' if pen_color else '')
+        + (f'penwidth = {pen_width}' if pen_width else '')
+        + f'    {content}\n}}'
+    )
+
+
+def _cluster_container(*, name, label, content, border_color, margin, fontsize):
+    return (
+        f'subgraph cluster_{name} {{\n'
+        f'    color = "{border_color}"\n'
+        f'    margin={margin}\n'
+        '    style="dashed"\n'
+        f'    label = "  {label}"\n'
+        '    labeljust = "l"\n'
+        f'    fontsize = {fontsize}\n'
+        f'    {content}\n}}'
+    )
+
+
+def _graph_header(pad, nodesep, spline, font, node_fontsize):
+    return (
+        'digraph world {\n'
+        f'    pad="{pad}"\n'
+        f'    nodesep={nodesep}\n'
+        + (f'splines={spline}' if spline else '')
+        + f'    fontname="{font}"\n'
+        f'    node [fontname="{font}"]\n'
+        '    edge [\n'
+        f'        fontname="{font}"\n'
+        '        color="gray"\n'
+        '    ]\n'
+        '    graph [\n'
+        '        rankdir = "LR"\n'
+        '    ];\n'
+        '    node [\n'
+        f'        fontsize = {node_fontsize}\n'
+        '    ];\n\n'
+    )
+
+
+def _digraph(*, pad, nodesep, font, node_fontsize, tags_cluster, routes_cluster, schemas_cluster,
+             links, spline=''):
+    return (
+        _graph_header(pad, nodesep, spline, font, node_fontsize)
+        + f'    {tags_cluster}\n\n'
+        f'    {routes_cluster}\n\n'
+        f'    {schemas_cluster}\n\n'
+        f'    {links}\n}}'
+    )
+
+
+def _er_diagram(*, pad, nodesep, font, node_fontsize, er_cluster, links, spline=''):
+    return (
+        _graph_header(pad, nodesep, spline, font, node_fontsize)
+        + '    subgraph cluster_schema {\n'
+        '        color = "#aaa"\n'
+        '        margin=18\n'
+        '        style="dashed"\n'
+        '        label="  ER Diagram"\n'
+        '        labeljust="l"\n'
+        '        fontsize="20"\n'
+        f'        {er_cluster}\n'
+        '    }\n\n'
+        f'    {links}\n}}'
+    )
+
+
+def _link(*, source, target, attributes):
+    return f'{source} -> {target} [{attributes}];'
+
+
+def _route_node(*, id, name, response_schema, margin):
+    return (
+        f'"{id}" [\n'
+        f'    label = "    {name} | {response_schema}    "\n'
+        f'    margin="{margin}"\n'
+        '    shape = "record"\n'
+        '];'
+    )
+
+
+def _schema_node(*, id, label, margin):
+    return f'"{id}" [\n    label = {label}\n    shape = "plain"\n    margin="{margin}"\n];'
+
+
+def _tag_node(*, id, name, margin):
+    return (
+        f'"{id}" [\n'
+        f'    label = "    {name}    "\n'
+        '    shape = "record"\n'
+        f'    margin="{margin}"\n'
+        '];'
+    )
+
+
+def _colored_text(*, text, color, strikethrough=False):
+    if strikethrough:
+        return f'<font color="{color}"><s>{text}</s></font>'
+    return f'<font color="{color}">{text}</font>'
+
+
+def _pydantic_meta(*, meta_parts):
+    if meta_parts:
+        return (
+            '<br align="left"/><br align="left"/>'
+            + '<br align="left"/>'.join(meta_parts)
+            + '<br align="left"/>'
+        )
+    return ''
+
+
+def _schema_field_row(*, align, content, port=None):
+    port_attr = f'port="f{port}"' if port else ''
+    return f'<tr><td align="{align}" {port_attr} cellpadding="8">{content}</td></tr>'
+
+
+def _schema_header(*, text, bg_color, port=None, is_entity=False):
+    port_attr = f'port="{port}"' if port else ''
+    text_html = f'<b>{text} (E)</b>' if is_entity else text
+    return (
+        f'<tr><td cellpadding="6" bgcolor="{bg_color}" align="center" colspan="1" width="75" '
+        f'{port_attr}>'
+        f'<font color="white">{text_html}</font></td></tr>'
+    )
+
+
+def _schema_table(*, header, rows):
+    return (
+        '<<table border="0" cellborder="1" cellpadding="0" cellspacing="0" bgcolor="white" '
+        'width="75">\n'
+        f'{header}\n{rows}\n</table>>'
+    )
+
+
+FAST_TEMPLATES: dict[str, Callable[..., str]] = {
+    'dot/cluster.j2': _cluster,
+    'dot/cluster_container.j2': _cluster_container,
+    'dot/digraph.j2': _digraph,
+    'dot/er_diagram.j2': _er_diagram,
+    'dot/link.j2': _link,
+    'dot/route_node.j2': _route_node,
+    'dot/schema_node.j2': _schema_node,
+    'dot/tag_node.j2': _tag_node,
+    'html/colored_text.j2': _colored_text,
+    'html/pydantic_meta.j2': _pydantic_meta,
+    'html/schema_field_row.j2': _schema_field_row,
+    'html/schema_header.j2': _schema_header,
+    'html/schema_table.j2': _schema_table,
+}
+
+
+class FastTemplateRenderer(TemplateRenderer):
+    """
+    Drop-in TemplateRenderer that builds the bundled templates with plain string formatting.
+
+    Output is byte-identical to the Jinja2 templates, a full-field render calls several
+    templates per field so skipping Jinja's context setup matters on large graphs.
+    Unknown template names fall back to Jinja2.
+    """
+
+    def render_template(self, template_name: str, **context) -> str:
+        """Render a template with the given context."""
+        builder = FAST_TEMPLATES.get(template_name)
+        if builder is None:
+            return super().render_template(template_name, **context)
+        return builder(**context)
+
+
+RENDER_CACHE_SIZE = 8192
+# fragment cache entries per tag / route / schema node, see RenderCache.sized_for
+RENDER_CACHE_ENTRIES_PER_NODE = 4
+MODULE_TREE_CACHE_SIZE = 64
+
+
+class RenderCache:
+    """
+    Bounded LRU cache of rendered node fragments (schema / route / tag nodes).
+
+    Shared by the renderers of one analyzed graph, so filtered re-renders only pay for
+    links and clusters. Renderers sharing a cache must use the same RenderConfig, and the
+    cache must be dropped together with the graph it was filled from.
+
+    Module trees and module color tries go to the separate ``module_trees`` LRU: a full
+    render stores one fragment per node, which must not evict them.
+    """
+
+    def __init__(self, maxsize: int = RENDER_CACHE_SIZE, module_tree_size: int = 0):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.module_trees = RenderCache(module_tree_size) if module_tree_size else None
+
+    @classmethod
+    def sized_for(cls, node_count: int) -> "RenderCache":
+        """Fragment cache of a graph with ``node_count`` nodes, large enough for a full render."""
+        return cls(
+            max(RENDER_CACHE_SIZE, RENDER_CACHE_ENTRIES_PER_NODE * node_count),
+            module_tree_size=MODULE_TREE_CACHE_SIZE,
+        )
+
+    def get_or_render(self, key: Hashable, render: Callable[[], T]) -> T:
+        """Return the cached fragment for ``key``, rendering and storing it on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = render()
+            self.put(key, value)
+        return value
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached fragment for ``key``, or None."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 class Renderer:
     """
     Render FastAPI application structure to DOT format.
@@ -67,9 +331,13 @@ class Renderer:
         config: RenderConfig | None = None,
         theme_color: str | None = None,
         show_methods: bool = True,
+        fast_render: bool = True,
+        cache: RenderCache | None = None,
     ) -> None:
         self.show_fields = show_fields if show_fields in ('single', 'object', 'all') else 'single'
         self.module_color = module_color or {}
+        # module trees and their colors are cached per module_color, see _module_tree
+        self._module_color_key = tuple(sorted(self.module_color.items()))
         self.schema = schema
         self.show_module = show_module
         self.show_pydantic_resolve_meta = show_pydantic_resolve_meta
@@ -83,8 +351,11 @@ class Renderer:
         # Framework theme color (overrides default primary color)
         self.theme_color = theme_color or self.colors.primary
 
-        # Initialize template renderer
-        self.template_renderer = TemplateRenderer()
+        # Initialize template renderer, fast_render=False renders through Jinja2 templates
+        self.template_renderer = FastTemplateRenderer() if fast_render else TemplateRenderer()
+
+        # Optional node fragment cache shared with other renderers of the same graph
+        self.cache = cache
 
         logger.info(f'show_module: {self.show_module}')
         logger.info(f'module_color: {self.module_color}')
@@ -233,6 +504,12 @@ class Renderer:
         else:  # 'single'
             return []
 
+    def _get_header_color(self, node: SchemaNode, color: str | None = None) -> str:
+        """Header color: highlight for the selected schema, else module color or theme color."""
+        if node.id == self.schema:
+            return self.colors.highlight
+        return self.theme_color if color is None else color
+
     def render_schema_label(self, node: SchemaNode, color: str | None = None) -> str:
         """
         Render a schema node's label as an HTML table.
@@ -274,15 +551,11 @@ class Renderer:
             for method in node.mutations:
                 rows.append(self._render_schema_method(method, type='mutation'))
 
-        # Determine header color
-        default_color = self.theme_color if color is None else color
-        header_color = self.colors.highlight if node.id == self.schema else default_color
-
         # Render header
         header = self.template_renderer.render_template(
             'html/schema_header.j2',
             text=node.name,
-            bg_color=header_color,
+            bg_color=self._get_header_color(node, color),
             port=PK,
             is_entity=node.is_entity
         )
@@ -332,6 +605,19 @@ class Renderer:
 
     def render_schema_node(self, node: SchemaNode, color: str | None = None) -> str:
         """Render a schema node in DOT format."""
+        if self.cache is not None:
+            key = (
+                'schema',
+                node.id,
+                self.show_fields,
+                self.show_pydantic_resolve_meta,
+                self.show_methods,
+                self._get_header_color(node, color),
+            )
+            return self.cache.get_or_render(key, lambda: self._render_schema_node(node, color))
+        return self._render_schema_node(node, color)
+
+    def _render_schema_node(self, node: SchemaNode, color: str | None = None) -> str:
         label = self.render_schema_label(node, color)
 
         return self.template_renderer.render_template(
@@ -343,6 +629,13 @@ class Renderer:
 
     def render_tag_node(self, tag: Tag) -> str:
         """Render a tag node in DOT format."""
+        if self.cache is not None:
+            return self.cache.get_or_render(
+                ('tag', tag.id), lambda: self._render_tag_node(tag)
+            )
+        return self._render_tag_node(tag)
+
+    def _render_tag_node(self, tag: Tag) -> str:
         return self.template_renderer.render_template(
             'dot/tag_node.j2',
             id=tag.id,
@@ -352,6 +645,13 @@ class Renderer:
 
     def render_route_node(self, route: Route) -> str:
         """Render a route node in DOT format."""
+        if self.cache is not None:
+            return self.cache.get_or_render(
+                ('route', route.id), lambda: self._render_route_node(route)
+            )
+        return self._render_route_node(route)
+
+    def _render_route_node(self, route: Route) -> str:
         # Truncate response schema if too long
         response_schema = route.response_schema
         if len(response_schema) > self.config.max_type_length:
@@ -365,118 +665,163 @@ class Renderer:
             margin=self.style.node_margin
         )
 
+    def _template_frame(self, template_name: str, slots: tuple[str, ...], **context) -> list[str]:
+        """
+        Render ``template_name`` around its ``slots``: the literal pieces before, between and
+        after them, so the slot content can be streamed in between.
+        """
+        markers = [f'\0{i}\0' for i in range(len(slots))]
+        rest = self.template_renderer.render_template(
+            template_name, **context, **dict(zip(slots, markers, strict=True))
+        )
+        pieces = []
+        for marker in markers:
+            head, rest = rest.split(marker, 1)
+            pieces.append(head)
+        pieces.append(rest)
+        return pieces
+
+    def _module_tree(
+        self,
+        kind: str,
+        items: list[T],
+        build: Callable[[list[T]], list[Any]],
+        *key: Hashable,
+    ) -> list[Any]:
+        """
+        Module tree of ``items``, shared through the render cache per set of item ids.
+
+        Trees are only read while rendering, so one tree serves every render of the same
+        filtered nodes / routes of a graph. ``key`` adds whatever else ``build`` depends on.
+        """
+        cache = self._module_tree_cache()
+        if cache is None:
+            return build(items)
+        cache_key = (f'module_{kind}_tree', tuple(item.id for item in items), *key)
+        return cache.get_or_render(cache_key, lambda: build(items))
+
+    def _module_colors(self) -> ModuleColorTrie:
+        """Trie of ``module_color``, built once per render cache (per graph)."""
+        cache = self._module_tree_cache()
+        if cache is None:
+            return ModuleColorTrie(self.module_color)
+        key = ('module_color_trie', self._module_color_key)
+        return cache.get_or_render(key, lambda: ModuleColorTrie(self.module_color))
+
+    def _module_tree_cache(self) -> RenderCache | None:
+        """Cache of module trees and color tries, the fragment cache when it has none."""
+        if self.cache is None or self.cache.module_trees is None:
+            return self.cache
+        return self.cache.module_trees
+
+    def _build_colored_module_schema_tree(self, nodes: list[SchemaNode]) -> list[ModuleNode]:
+        return assign_module_colors(build_module_schema_tree(nodes), self._module_colors())
+
     def _render_module_schema(
         self,
         mod: ModuleNode,
-        module_color_flag: set[str],
         inherit_color: str | None = None,
         show_cluster: bool = True
     ) -> str:
         """Render a module schema tree."""
-        color = inherit_color
-        cluster_color: str | None = None
+        return ''.join(self._stream_module_schema(mod, inherit_color, show_cluster))
 
-        # Check if this module has a custom color
-        for k in module_color_flag:
-            if mod.fullname.startswith(k):
-                module_color_flag.remove(k)
-                color = self.module_color[k]
-                cluster_color = color if color != inherit_color else None
-                break
-
-        # Render inner schema nodes
-        inner_nodes = [
-            self.render_schema_node(node, color)
-            for node in mod.schema_nodes
-        ]
-        inner_nodes_str = '\n'.join(inner_nodes)
-
-        # Recursively render child modules
-        child_str = '\n'.join(
-            self._render_module_schema(
-                m,
-                module_color_flag=module_color_flag,
-                inherit_color=color,
-                show_cluster=show_cluster
-            )
-            for m in mod.modules
-        )
+    def _stream_module_schema(
+        self,
+        mod: ModuleNode,
+        inherit_color: str | None = None,
+        show_cluster: bool = True
+    ) -> Iterator[str]:
+        # colors are resolved on the tree, see assign_module_colors
+        color = mod.color if mod.color is not None else inherit_color
+        cluster_color = color if color != inherit_color else None
 
         if show_cluster:
             # Render as a cluster
-            cluster_id = f'module_{mod.fullname.replace(".", "_")}'
-            pen_style = ''
-
-            if cluster_color:
-                pen_style = f'pencolor = "{cluster_color}"'
-                pen_style += '\n' + 'penwidth = 3' if color else ''
-            else:
-                pen_style = 'pencolor="#ccc"'
-
-            return self.template_renderer.render_template(
+            head, tail = self._template_frame(
                 'dot/cluster.j2',
-                cluster_id=cluster_id,
+                ('content',),
+                cluster_id=f'module_{mod.fullname.replace(".", "_")}',
                 label=mod.name,
                 tooltip=mod.fullname,
                 border_color=self.colors.border,
                 pen_color=cluster_color,
                 pen_width=3 if color and not cluster_color else None,
-                content=f'{inner_nodes_str}\n{child_str}'
             )
-        else:
-            # Render without cluster
-            return f'{inner_nodes_str}\n{child_str}'
+            yield head
 
-    def render_module_schema_content(self, nodes: list[SchemaNode]) -> str:
-        """Render all module schemas."""
-        module_schemas = build_module_schema_tree(nodes)
-        module_color_flag = set(self.module_color.keys())
+        # Render inner schema nodes
+        yield '\n'.join(self.render_schema_node(node, color) for node in mod.schema_nodes)
+        yield '\n'
 
-        return '\n'.join(
-            self._render_module_schema(
+        # Recursively render child modules
+        for i, m in enumerate(mod.modules):
+            if i:
+                yield '\n'
+            yield from self._stream_module_schema(
                 m,
-                module_color_flag=module_color_flag,
-                show_cluster=self.show_module
+                inherit_color=color,
+                show_cluster=show_cluster
             )
-            for m in module_schemas
-        )
+
+        if show_cluster:
+            yield tail
+
+    def render_module_schema_content(self, nodes: list[SchemaNode]) -> str:
+        """Render all module schemas."""
+        return ''.join(self.stream_module_schema_content(nodes))
+
+    def stream_module_schema_content(self, nodes: list[SchemaNode]) -> Iterator[str]:
+        """Render all module schemas, chunk by chunk."""
+        module_schemas = self._module_tree(
+            'schema', nodes, self._build_colored_module_schema_tree, self._module_color_key)
+
+        for i, m in enumerate(module_schemas):
+            if i:
+                yield '\n'
+            yield from self._stream_module_schema(m, show_cluster=self.show_module)
 
     def _render_module_route(self, mod: ModuleRoute, show_cluster: bool = True) -> str:
         """Render a module route tree."""
-        # Render inner route nodes
-        inner_nodes = [self.render_route_node(r) for r in mod.routes]
-        inner_nodes_str = '\n'.join(inner_nodes)
-
-        # Recursively render child modules
-        child_str = '\n'.join(
-            self._render_module_route(m, show_cluster=show_cluster)
-            for m in mod.modules
-        )
+        return ''.join(self._stream_module_route(mod, show_cluster))
 
+    def _stream_module_route(self, mod: ModuleRoute, show_cluster: bool = True) -> Iterator[str]:
         if show_cluster:
-            cluster_id = f'route_module_{mod.fullname.replace(".", "_")}'
-
-            return self.template_renderer.render_template(
+            head, tail = self._template_frame(
                 'dot/cluster.j2',
-                cluster_id=cluster_id,
+                ('content',),
+                cluster_id=f'route_module_{mod.fullname.replace(".", "_")}',
                 label=mod.name,
                 tooltip=mod.fullname,
                 border_color=self.colors.border,
                 pen_color=None,
                 pen_width=None,
-                content=f'{inner_nodes_str}\n{child_str}'
             )
-        else:
-            return f'{inner_nodes_str}\n{child_str}'
+            yield head
+
+        # Render inner route nodes
+        yield '\n'.join(self.render_route_node(r) for r in mod.routes)
+        yield '\n'
+
+        # Recursively render child modules
+        for i, m in enumerate(mod.modules):
+            if i:
+                yield '\n'
+            yield from self._stream_module_route(m, show_cluster=show_cluster)
+
+        if show_cluster:
+            yield tail
 
     def render_module_route_content(self, routes: list[Route]) -> str:
         """Render all module routes."""
-        module_routes = build_module_route_tree(routes)
+        return ''.join(self.stream_module_route_content(routes))
 
-        return '\n'.join(
-            self._render_module_route(m, show_cluster=self.show_module)
-            for m in module_routes
-        )
+    def stream_module_route_content(self, routes: list[Route]) -> Iterator[str]:
+        """Render all module routes, chunk by chunk."""
+        for i, m in enumerate(self._module_tree('route', routes, build_module_route_tree)):
+            if i:
+                yield '\n'
+            yield from self._stream_module_route(m, show_cluster=self.show_module)
 
     def _render_cluster_container(
         self,
@@ -486,15 +831,27 @@ class Renderer:
         fontsize: str | None = None
     ) -> str:
         """Render a cluster container (for tags, routes, schemas)."""
-        return self.template_renderer.render_template(
+        return ''.join(self._stream_cluster_container(name, label, (content,), fontsize))
+
+    def _stream_cluster_container(
+        self,
+        name: str,
+        label: str,
+        content: Iterable[str],
+        fontsize: str | None = None
+    ) -> Iterator[str]:
+        head, tail = self._template_frame(
             'dot/cluster_container.j2',
+            ('content',),
             name=name,
             label=label,
-            content=content,
             border_color=self.colors.border,
             margin=self.style.cluster_margin,
             fontsize=fontsize or self.style.cluster_fontsize
         )
+        yield head
+        yield from content
+        yield tail
 
     def render_dot(
         self,
@@ -517,45 +874,85 @@ class Renderer:
         Returns:
             Complete DOT graph as a string
         """
-        # Render tag nodes
-        tag_str = '\n'.join(self.render_tag_node(t) for t in tags)
-
-        # Render tags cluster
-        tags_cluster = self._render_cluster_container(
-            name='tags',
-            label='Tags',
-            content=tag_str
-        )
-
-        # Render routes cluster
-        module_routes_str = self.render_module_route_content(routes)
-        routes_cluster = self._render_cluster_container(
-            name='router',
-            label='Routes',
-            content=module_routes_str
-        )
+        chunks = self.render_dot_stream(tags, routes, nodes, links, spline_line, chunk_size=0)
+        return ''.join(chunks)
 
-        # Render schemas cluster
-        module_schemas_str = self.render_module_schema_content(nodes)
-        schemas_cluster = self._render_cluster_container(
-            name='schema',
-            label='Schema',
-            content=module_schemas_str
-        )
-
-        # Render links
-        link_str = '\n'.join(self.render_link(link) for link in links)
+    def render_dot_stream(
+        self,
+        tags: list[Tag],
+        routes: list[Route],
+        nodes: list[SchemaNode],
+        links: list[Link],
+        spline_line: bool = False,
+        chunk_size: int = DOT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """
+        Render the complete DOT graph as a sequence of chunks, see `render_dot`.
 
-        # Render complete digraph
-        return self.template_renderer.render_template(
+        Fragments are produced on demand and merged into chunks of about ``chunk_size``
+        characters (0 yields them as they come), so the whole graph never has to be held
+        in memory.
+        """
+        head, after_tags, after_routes, after_schemas, tail = self._template_frame(
             'dot/digraph.j2',
+            ('tags_cluster', 'routes_cluster', 'schemas_cluster', 'links'),
             pad=self.style.pad,
             nodesep=self.style.nodesep,
             spline='line' if spline_line else '',
             font=self.style.font,
             node_fontsize=self.style.node_fontsize,
-            tags_cluster=tags_cluster,
-            routes_cluster=routes_cluster,
-            schemas_cluster=schemas_cluster,
-            links=link_str
         )
+
+        def fragments() -> Iterator[str]:
+            yield head
+
+            # Render tags cluster
+            yield from self._stream_cluster_container(
+                name='tags',
+                label='Tags',
+                content=('\n'.join(self.render_tag_node(t) for t in tags),)
+            )
+            yield after_tags
+
+            # Render routes cluster
+            yield from self._stream_cluster_container(
+                name='router',
+                label='Routes',
+                content=self.stream_module_route_content(routes)
+            )
+            yield after_routes
+
+            # Render schemas cluster
+            yield from self._stream_cluster_container(
+                name='schema',
+                label='Schema',
+                content=self.stream_module_schema_content(nodes)
+            )
+            yield after_schemas
+
+            # Render links
+            for i, link in enumerate(links):
+                if i:
+                    yield '\n'
+                yield self.render_link(link)
+            yield tail
+
+        return _chunked(fragments(), chunk_size)
+
+
+def _chunked(fragments: Iterable[str], chunk_size: int) -> Iterator[str]:
+    """Merge string fragments into chunks of at least ``chunk_size`` characters."""
+    if chunk_size <= 0:
+        yield from fragments
+        return
+    buffer: list[str] = []
+    size = 0
+    for fragment in fragments:
+        buffer.append(fragment)
+        size += len(fragment)
+        if size >= chunk_size:
+            yield ''.join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield ''.join(buffer)
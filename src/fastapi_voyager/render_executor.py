@@ -0,0 +1,191 @@
+"""
+Pluggable executors for filtering and rendering an analyzed graph.
+
+Analysis has to run in the app process because it inspects live classes, but its result
+is plain data and rendering is pure CPU. `RenderExecutor` renders in the calling thread,
+`ProcessPoolRenderExecutor` ships the serialized snapshot to worker processes once per
+worker and renders views there in parallel, outside the GIL of the app worker.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from fastapi_voyager.graph import GraphIndex, GraphSnapshot
+from fastapi_voyager.render import RenderCache, Renderer
+from fastapi_voyager.type import CoreData
+from fastapi_voyager.voyager import Voyager
+
+# analyzed graphs kept per worker process, keyed by snapshot fingerprint
+WORKER_GRAPH_CACHE_SIZE = 2
+
+
+def render_view(
+    index: GraphIndex,
+    voyager_kwargs: dict[str, Any],
+    *,
+    brief: bool = False,
+    module_prefix: str | None = None,
+) -> str:
+    """Render one filtered view of ``index``, ``voyager_kwargs`` are passed to `Voyager`."""
+    chunks = render_view_stream(index, voyager_kwargs, brief=brief, module_prefix=module_prefix)
+    return ''.join(chunks)
+
+
+def render_view_stream(
+    index: GraphIndex,
+    voyager_kwargs: dict[str, Any],
+    *,
+    brief: bool = False,
+    module_prefix: str | None = None,
+) -> Iterator[str]:
+    """Like `render_view`, as DOT chunks. Filtering happens up front, rendering on iteration."""
+    render_cache = index.cached('render_cache', lambda: RenderCache.sized_for(index.n_objects))
+    voyager = Voyager(render_cache=render_cache, **voyager_kwargs)
+    voyager.load_index(index)
+    if brief:
+        if voyager_kwargs.get('include_tags'):
+            return voyager.render_tag_level_brief_dot_stream(module_prefix=module_prefix)
+        return voyager.render_overall_brief_dot_stream(module_prefix=module_prefix)
+    return voyager.render_dot_stream()
+
+
+def render_core_data(core_data: CoreData, theme_color: str | None = None) -> str:
+    """Render dot graph from core data."""
+    renderer = Renderer(
+        show_fields=core_data.show_fields,
+        module_color=core_data.module_color,
+        schema=core_data.schema,
+        theme_color=theme_color,
+    )
+    return renderer.render_dot(core_data.tags, core_data.routes, core_data.nodes, core_data.links)
+
+
+class RenderExecutor:
+    """Renders in the calling thread, the default."""
+
+    def render_view(
+        self,
+        index: GraphIndex,
+        voyager_kwargs: dict[str, Any],
+        *,
+        brief: bool = False,
+        module_prefix: str | None = None,
+    ) -> str:
+        return render_view(index, voyager_kwargs, brief=brief, module_prefix=module_prefix)
+
+    def render_view_stream(
+        self,
+        index: GraphIndex,
+        voyager_kwargs: dict[str, Any],
+        *,
+        brief: bool = False,
+        module_prefix: str | None = None,
+    ) -> Iterator[str]:
+        return render_view_stream(index, voyager_kwargs, brief=brief, module_prefix=module_prefix)
+
+    def render_core_data(self, core_data: CoreData, theme_color: str | None = None) -> str:
+        return render_core_data(core_data, theme_color)
+
+    def shutdown(self) -> None:
+        pass
+
+
+class _GraphNotLoaded(Exception):
+    """Raised in a worker that has not received the snapshot for a fingerprint yet."""
+
+
+_worker_graphs: OrderedDict[str, GraphIndex] = OrderedDict()
+
+
+def _worker_render_view(
+    fingerprint: str,
+    payload: bytes | None,
+    voyager_kwargs: dict[str, Any],
+    brief: bool,
+    module_prefix: str | None,
+) -> str:
+    index = _worker_graphs.get(fingerprint)
+    if index is None:
+        if payload is None:
+            raise _GraphNotLoaded(fingerprint)
+        snapshot: GraphSnapshot = pickle.loads(payload)
+        index = _worker_graphs[fingerprint] = GraphIndex(snapshot)
+        while len(_worker_graphs) > WORKER_GRAPH_CACHE_SIZE:
+            _worker_graphs.popitem(last=False)
+    else:
+        _worker_graphs.move_to_end(fingerprint)
+    return render_view(index, voyager_kwargs, brief=brief, module_prefix=module_prefix)
+
+
+class ProcessPoolRenderExecutor(RenderExecutor):
+    """
+    Renders in a pool of worker processes.
+
+    Jobs only carry the snapshot fingerprint and the view parameters. A worker that has not
+    seen the snapshot yet rejects the job, which is then resent once with the pickled
+    snapshot, so each worker deserializes and indexes a graph once.
+
+    Workers are started with ``spawn`` by default: app servers are multi-threaded, and
+    forking them can deadlock the child.
+    """
+
+    def __init__(self, max_workers: int | None = None, mp_context: Any = None):
+        self.max_workers = max_workers
+        self.mp_context = mp_context or multiprocessing.get_context('spawn')
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self.max_workers, mp_context=self.mp_context)
+            return self._pool
+
+    @staticmethod
+    def _payload(index: GraphIndex) -> bytes:
+        return index.cached(
+            'pickled_snapshot', lambda: pickle.dumps(index.snapshot, pickle.HIGHEST_PROTOCOL)
+        )
+
+    def render_view(
+        self,
+        index: GraphIndex,
+        voyager_kwargs: dict[str, Any],
+        *,
+        brief: bool = False,
+        module_prefix: str | None = None,
+    ) -> str:
+        pool = self._get_pool()
+        args = (voyager_kwargs, brief, module_prefix)
+        try:
+            return pool.submit(_worker_render_view, index.fingerprint, None, *args).result()
+        except _GraphNotLoaded:
+            payload = self._payload(index)
+            return pool.submit(_worker_render_view, index.fingerprint, payload, *args).result()
+
+    def render_view_stream(
+        self,
+        index: GraphIndex,
+        voyager_kwargs: dict[str, Any],
+        *,
+        brief: bool = False,
+        module_prefix: str | None = None,
+    ) -> Iterator[str]:
+        # the result crosses the process boundary as one string, so it is sent as one chunk
+        dot = self.render_view(index, voyager_kwargs, brief=brief, module_prefix=module_prefix)
+        return iter((dot,))
+
+    def render_core_data(self, core_data: CoreData, theme_color: str | None = None) -> str:
+        return self._get_pool().submit(render_core_data, core_data, theme_color).result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,166 @@
+"""
+Search over the schemas, fields and routes of an analyzed graph.
+
+`SearchIndex` is built once per `GraphIndex` (see `VoyagerContext.search`) and answers
+``GET /search?q=`` without scanning the graph: every searchable string is lowercased and
+deduplicated into a key table, keys are indexed by trigram for substring queries and kept
+sorted by word for queries of one or two characters. Matches are ranked exact, prefix,
+word start, then substring.
+"""
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from fastapi_voyager.graph import GraphSnapshot
+
+SEARCH_KINDS = ('schema', 'route', 'field')
+
+# hits returned when no limit is given
+SEARCH_LIMIT = 20
+
+# match ranks, lower is better
+EXACT, PREFIX, WORD, SUBSTRING = range(4)
+
+_WORD_SEPARATORS = '._-/{ '
+
+_KIND_ORDER = {kind: i for i, kind in enumerate(SEARCH_KINDS)}
+
+# most keys a single hit is indexed under: a route's name, id and path
+MAX_KEYS_PER_HIT = 3
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """
+    One match, ``id`` is the schema id of schema and field hits and the route id of routes.
+
+    ``label`` is the schema, route or field name, ``detail`` the module, route path or the
+    name of the schema a field belongs to.
+    """
+    kind: str
+    id: str
+    label: str
+    detail: str
+
+
+def _trigrams(key: str) -> set[str]:
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+
+def _word_starts(key: str) -> list[int]:
+    return [0] + [i + 1 for i, c in enumerate(key[:-1]) if c in _WORD_SEPARATORS]
+
+
+def _rank(key: str, query: str) -> int | None:
+    pos = key.find(query)
+    if pos < 0:
+        return None
+    if pos == 0:
+        return EXACT if len(key) == len(query) else PREFIX
+    # a match at a word start: after '.', '_', '/', ...
+    while pos > 0:
+        if key[pos - 1] in _WORD_SEPARATORS:
+            return WORD
+        pos = key.find(query, pos + 1)
+    return SUBSTRING
+
+
+class SearchIndex:
+    """
+    Trigram and prefix index over schema names and ids, field names, route names, ids and paths.
+
+    Each distinct (kind, lowercased string) is a key, a key belongs to one or more hits
+    (a field name shared by many schemas, ...). Hits are ordered by rank, kind, length and
+    text of the best key matching them, then by id.
+    """
+
+    def __init__(self, snapshot: GraphSnapshot):
+        self.hits: list[SearchHit] = []
+        self._key_pos: dict[tuple[int, str], int] = {}
+        # per key: its text, the kind code of its hits and the hit positions
+        self.keys: list[str] = []
+        self.key_kind: list[int] = []
+        self.key_hits: list[list[int]] = []
+
+        for node in sorted(snapshot.nodes, key=lambda n: n.id):
+            self._add(SearchHit('schema', node.id, node.name, node.module), node.name, node.id)
+        for route in sorted(snapshot.routes, key=lambda r: r.id):
+            hit = SearchHit('route', route.id, route.name, route.path)
+            self._add(hit, route.name, route.id, route.path)
+        for node in sorted(snapshot.nodes, key=lambda n: n.id):
+            for f in node.fields:
+                self._add(SearchHit('field', node.id, f.name, node.name), f.name)
+
+        # trigram -> keys containing it, for queries of three characters or more
+        self.trigrams: dict[str, list[int]] = {}
+        # (suffix starting at a word start, key) sorted, for shorter queries
+        word_suffixes: list[tuple[str, int]] = []
+        for pos, key in enumerate(self.keys):
+            for gram in _trigrams(key):
+                self.trigrams.setdefault(gram, []).append(pos)
+            word_suffixes.extend((key[i:], pos) for i in _word_starts(key))
+        word_suffixes.sort()
+        self.word_suffixes = word_suffixes
+
+    def _add(self, hit: SearchHit, *keys: str) -> None:
+        n = len(self.hits)
+        self.hits.append(hit)
+        kind = _KIND_ORDER[hit.kind]
+        for key in {k.lower() for k in keys if k}:
+            pos = self._key_pos.get((kind, key))
+            if pos is None:
+                pos = self._key_pos[(kind, key)] = len(self.keys)
+                self.keys.append(key)
+                self.key_kind.append(kind)
+                self.key_hits.append([])
+            self.key_hits[pos].append(n)
+
+    def _candidate_keys(self, query: str) -> Iterable[int]:
+        if len(query) < 3:
+            # too short for trigrams, keys with a word starting with the query
+            suffixes = self.word_suffixes
+            found = set()
+            for i in range(bisect_left(suffixes, (query, -1)), len(suffixes)):
+                suffix, pos = suffixes[i]
+                if not suffix.startswith(query):
+                    break
+                found.add(pos)
+            return found
+        # keys containing the query contain each of its trigrams, scan the rarest posting
+        postings = [self.trigrams.get(gram) for gram in _trigrams(query)]
+        if not all(postings):
+            return ()
+        return min(postings, key=len)
+
+    def search(
+        self, query: str, limit: int = SEARCH_LIMIT, kinds: list[str] | None = None
+    ) -> list[SearchHit]:
+        """Best ``limit`` hits for ``query`` (case-insensitive), optionally only of ``kinds``."""
+        query = query.strip().lower()
+        if not query or limit <= 0:
+            return []
+        wanted = {_KIND_ORDER[k] for k in kinds or SEARCH_KINDS}
+
+        keys, key_kind = self.keys, self.key_kind
+        matches = []
+        for pos in self._candidate_keys(query):
+            if key_kind[pos] in wanted:
+                key = keys[pos]
+                rank = _rank(key, query)
+                if rank is not None:
+                    matches.append((rank, key_kind[pos], len(key), key, pos))
+
+        # a hit has at most MAX_KEYS_PER_HIT keys, so this many best keys reach ``limit`` hits
+        result: list[SearchHit] = []
+        seen: set[int] = set()
+        for *_, pos in heapq.nsmallest(limit * MAX_KEYS_PER_HIT, matches):
+            for n in self.key_hits[pos]:
+                if n not in seen:
+                    seen.add(n)
+                    result.append(self.hits[n])
+                    if len(result) == limit:
+                        return result
+        return result
@@ -4,13 +4,18 @@ FastAPI-voyager server module with framework adapter support.
 This module provides the main `create_voyager` function that automatically
 detects the framework type and returns an appropriately configured voyager UI.
 """
-from typing import Any, Literal
+from __future__ import annotations
 
-from pydantic_resolve import ErDiagram
+from typing import TYPE_CHECKING, Any, Literal
 
-from fastapi_voyager.adapters import DjangoNinjaAdapter, FastAPIAdapter, LitestarAdapter
 from fastapi_voyager.introspectors import FrameworkType, detect_framework
 
+if TYPE_CHECKING:
+    from pydantic_resolve import ErDiagram
+
+    from fastapi_voyager.layout import ServerLayout
+    from fastapi_voyager.render_executor import RenderExecutor
+
 INITIAL_PAGE_POLICY = Literal["first", "full", "empty"]
 
 
@@ -26,6 +31,9 @@ def _get_adapter(
     er_diagram: ErDiagram | None = None,
     enable_pydantic_resolve_meta: bool = False,
     server_mode: bool = False,
+    render_executor: RenderExecutor | None = None,
+    server_layout: ServerLayout | None = None,
+    offload_workers: int | None = None,
 ) -> Any:
     """
     Get the appropriate adapter for the given target app.
@@ -43,6 +51,9 @@ def _get_adapter(
         ga_id: Optional Google Analytics ID
         er_diagram: Optional ER diagram from pydantic-resolve
         enable_pydantic_resolve_meta: Enable pydantic-resolve metadata display
+        render_executor: Optional executor for rendering filtered views
+        server_layout: Optional server-side Graphviz layout for the UI
+        offload_workers: Threads running analysis / rendering for async adapters
 
     Returns:
         An adapter instance for the detected framework
@@ -50,10 +61,12 @@ def _get_adapter(
     Raises:
         TypeError: If the app type is not supported
     """
-    # Use centralized framework detection from introspectors
+    # Use centralized framework detection from introspectors, then import only that adapter
     framework = detect_framework(target_app)
 
     if framework == FrameworkType.FASTAPI:
+        from fastapi_voyager.adapters.fastapi_adapter import FastAPIAdapter
+
         return FastAPIAdapter(
             target_app=target_app,
             module_color=module_color,
@@ -66,9 +79,14 @@ def _get_adapter(
             er_diagram=er_diagram,
             enable_pydantic_resolve_meta=enable_pydantic_resolve_meta,
             server_mode=server_mode,
+            render_executor=render_executor,
+            server_layout=server_layout,
+            offload_workers=offload_workers,
         )
 
     elif framework == FrameworkType.LITESTAR:
+        from fastapi_voyager.adapters.litestar_adapter import LitestarAdapter
+
         return LitestarAdapter(
             target_app=target_app,
             module_color=module_color,
@@ -81,9 +99,14 @@ def _get_adapter(
             er_diagram=er_diagram,
             enable_pydantic_resolve_meta=enable_pydantic_resolve_meta,
             server_mode=server_mode,
+            render_executor=render_executor,
+            server_layout=server_layout,
+            offload_workers=offload_workers,
         )
 
     elif framework == FrameworkType.DJANGO_NINJA:
+        from fastapi_voyager.adapters.django_ninja_adapter import DjangoNinjaAdapter
+
         return DjangoNinjaAdapter(
             target_app=target_app,
             module_color=module_color,
@@ -96,6 +119,9 @@ def _get_adapter(
             er_diagram=er_diagram,
             enable_pydantic_resolve_meta=enable_pydantic_resolve_meta,
             server_mode=server_mode,
+            render_executor=render_executor,
+            server_layout=server_layout,
+            offload_workers=offload_workers,
         )
 
     # If we get here, the app type is not supported
@@ -119,6 +145,10 @@ def create_voyager(
     er_diagram: ErDiagram | None = None,
     enable_pydantic_resolve_meta: bool = False,
     server_mode: bool = False,
+    warmup: bool = False,
+    render_executor: RenderExecutor | None = None,
+    server_layout: ServerLayout | None = None,
+    offload_workers: int | None = None,
 ) -> Any:
     """
     Create a voyager UI application for the given target app.
@@ -130,6 +160,19 @@ def create_voyager(
     For Django Ninja: Returns an ASGI application
     For Litestar: Returns a Litestar app
 
+    The analyzed route/schema graph is built on the first request and cached. If routes
+    are added at runtime, call `invalidate_snapshot()` on the attached context
+    (`voyager_app.state.voyager_context` for FastAPI / Litestar,
+    `voyager_asgi_app.voyager_context` for Django Ninja) to rebuild it.
+
+    With ``warmup=True`` the graph and the initial page are built in a background thread
+    once the host app has started, so the first visitor does not pay for the analysis. It
+    begins after the host's own startup hooks (FastAPI lifespan / startup events, Litestar
+    ``on_startup``), or when the voyager app receives the ASGI lifespan startup event
+    (Django Ninja, forward the ``lifespan`` scope to it; standalone server mode). Requests
+    arriving during warm-up wait for it, the duration is logged and kept as
+    ``voyager_context.warmup_seconds``.
+
     Args:
         target_app: The web application to visualize
         module_color: Optional color mapping for modules (e.g., {"myapp": "blue"})
@@ -142,6 +185,15 @@ def create_voyager(
         er_diagram: Optional ER diagram from pydantic-resolve
         enable_pydantic_resolve_meta: Enable display of pydantic-resolve metadata
         server_mode: If True, serve voyager UI at root path (for standalone preview mode)
+        warmup: If True, build the graph and initial page in the background at startup
+        render_executor: Optional executor for rendering filtered views, e.g.
+            `ProcessPoolRenderExecutor()` to render large graphs in worker processes
+        server_layout: Optional `ServerLayout()` to lay graphs out with a local Graphviz
+            (``dot`` binary or pygraphviz) instead of in the browser, results are cached by
+            DOT content. Without a Graphviz install the browser keeps doing the layout.
+        offload_workers: Number of threads the Litestar and Django Ninja adapters run
+            analysis and rendering on (default 2), further requests queue. The pool usage
+            and queue depth are served at ``GET <mount>/stats``.
 
     Returns:
         A framework-specific application object that provides the voyager UI
@@ -183,6 +235,10 @@ def create_voyager(
         er_diagram=er_diagram,
         enable_pydantic_resolve_meta=enable_pydantic_resolve_meta,
         server_mode=server_mode,
+        render_executor=render_executor,
+        server_layout=server_layout,
+        offload_workers=offload_workers,
     )
 
+    adapter.ctx.warmup_on_startup = warmup
     return adapter.create_app()
@@ -0,0 +1,127 @@
+"""
+On-disk cache of analyzed graphs for repeated CLI runs.
+
+Generating several views of one app (``--tags``, ``--schema``, ``--route_name``) analyzes
+the same app every time. The unfiltered `GraphSnapshot` is stored under a key derived from
+the app's routes, and is reused while the source files of the route and schema modules it
+was built from are unchanged.
+
+Cache files are pickles, only point ``cache_dir`` at a directory you trust.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+
+from fastapi_voyager.graph import GraphSnapshot
+from fastapi_voyager.version import __version__
+from fastapi_voyager.voyager import Voyager
+
+logger = getLogger(__name__)
+
+# bump when the cached payload layout changes
+CACHE_FORMAT = 2
+
+
+def app_fingerprint(voyager: Voyager, app: Any) -> str:
+    """Hash of the app's routes and the analysis options that shape the snapshot."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f'{CACHE_FORMAT}\0{__version__}\0'.encode())
+    h.update(repr(sorted(voyager.entity_class_names or ())).encode())
+    for route in voyager._get_introspector(app).get_routes():
+        endpoint = route.endpoint
+        h.update(repr((
+            route.id,
+            route.name,
+            route.module,
+            route.operation_id,
+            route.tags,
+            getattr(endpoint, '__module__', None),
+            getattr(endpoint, '__qualname__', None),
+            repr(route.response_model),
+        )).encode())
+    return h.hexdigest()
+
+
+def _source_mtimes(modules: set[str]) -> dict[str, int]:
+    """mtime of the source file of each loaded module, modules without one are skipped."""
+    mtimes: dict[str, int] = {}
+    for name in modules:
+        path = getattr(sys.modules.get(name), '__file__', None)
+        if path:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+    return mtimes
+
+
+def _snapshot_modules(snapshot: GraphSnapshot) -> set[str]:
+    return {r.module for r in snapshot.routes} | {n.module for n in snapshot.nodes}
+
+
+class SnapshotCache:
+    """Snapshots stored as ``<cache_dir>/<fingerprint>.pickle``."""
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}.pickle'
+
+    def load(self, key: str) -> GraphSnapshot | None:
+        """The snapshot stored under ``key``, None if missing, unreadable or stale."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f'ignoring unreadable snapshot cache {path}: {e}')
+            return None
+        if entry.get('format') != CACHE_FORMAT:
+            return None
+        mtimes: dict[str, int] = entry['mtimes']
+        for source, mtime in mtimes.items():
+            try:
+                if os.stat(source).st_mtime_ns != mtime:
+                    return None
+            except OSError:
+                return None
+        return entry['snapshot']
+
+    def store(self, key: str, snapshot: GraphSnapshot) -> None:
+        entry = {
+            'format': CACHE_FORMAT,
+            'mtimes': _source_mtimes(_snapshot_modules(snapshot)),
+            'snapshot': snapshot,
+        }
+        path = self._path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f'could not write snapshot cache {path}: {e}')
+
+
+def load_or_collect_snapshot(voyager: Voyager, app: Any, cache_dir: str | Path) -> GraphSnapshot:
+    """`Voyager.collect_snapshot`, reusing a cached result for an unchanged app."""
+    cache = SnapshotCache(cache_dir)
+    key = app_fingerprint(voyager, app)
+    snapshot = cache.load(key)
+    if snapshot is not None:
+        logger.info(f'using cached analysis {key}')
+        return snapshot
+    snapshot = voyager.collect_snapshot(app)
+    cache.store(key, snapshot)
+    return snapshot
@@ -1,15 +1,21 @@
-from dataclasses import field
+"""
+Analyzed graph objects.
+
+Tens of thousands of these are built per analysis, so they are plain slotted dataclasses
+without validation. Pydantic validation only happens at the HTTP boundary, see `CoreData`.
+"""
+from dataclasses import dataclass, field
 from typing import Literal
 
-from pydantic.dataclasses import dataclass
+from pydantic import dataclasses as pydantic_dataclasses
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeBase:
     id: str
     name: str
 
-@dataclass
+@dataclass(slots=True)
 class FieldInfo:
     name: str
     type_name: str
@@ -27,31 +33,32 @@ class FieldInfo:
     collect_info: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MethodInfo:
     """@query 或 @mutation 方法信息"""
     name: str              # GraphQL 名称（来自装饰器或方法名）
     return_type: str       # 返回类型字符串
 
-@dataclass
+@dataclass(slots=True)
 class Tag(NodeBase):
     routes: list['Route']  # route.id
 
-@dataclass
+@dataclass(slots=True)
 class Route(NodeBase):
     module: str
     unique_id: str = ''
     response_schema: str = ''
     is_primitive: bool = True
+    path: str = ''
 
-@dataclass
+@dataclass(slots=True)
 class ModuleRoute:
     name: str
     fullname: str
     routes: list[Route]
     modules: list['ModuleRoute']
 
-@dataclass
+@dataclass(slots=True)
 class SchemaNode(NodeBase):
     module: str
     fields: list[FieldInfo] = field(default_factory=list)
@@ -59,12 +66,19 @@ class SchemaNode(NodeBase):
     queries: list[MethodInfo] = field(default_factory=list)   # @query methods
     mutations: list[MethodInfo] = field(default_factory=list) # @mutation methods
 
-@dataclass
+@dataclass(slots=True)
+class SchemaSummary(NodeBase):
+    """Schema without its fields, listed in the initial GET /dot response."""
+    module: str
+
+@dataclass(slots=True)
 class ModuleNode:
     name: str
     fullname: str
     schema_nodes: list[SchemaNode]
     modules: list['ModuleNode']
+    # --module_color of the longest configured prefix of fullname, see module.assign_module_colors
+    color: str | None = None
 
 
 # type: 
@@ -76,7 +90,7 @@ class ModuleNode:
 #    - tag_to_schema: tag -> schema (only happens in module prefix filtering, aka brief mode)
 LinkType = Literal['schema', 'parent', 'tag_route', 'subset', 'route_to_schema', 'tag_to_schema']
 
-@dataclass
+@dataclass(slots=True)
 class Link:
     # node + field level links
     source: str
@@ -93,8 +107,9 @@ class Link:
 FieldType = Literal['single', 'object', 'all']
 PK = "PK"
 
-@dataclass
+@pydantic_dataclasses.dataclass
 class CoreData:
+    """Filtered graph exchanged over HTTP, validated when posted back for rendering."""
     tags: list[Tag]
     routes: list[Route]
     nodes: list[SchemaNode]
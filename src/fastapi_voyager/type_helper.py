@@ -1,8 +1,14 @@
 import inspect
 import logging
 import os
+import sys
+import threading
+import weakref
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
 from types import UnionType
-from typing import Annotated, Any, ForwardRef, Generic, Union, get_args, get_origin
+from typing import Annotated, Any, ForwardRef, Generic, TypeVar, Union, get_args, get_origin
 
 import pydantic_resolve.constant as const
 from pydantic import BaseModel
@@ -12,6 +18,8 @@ from fastapi_voyager.type import FieldInfo
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 # Python <3.12 compatibility: TypeAliasType exists only from 3.12 (PEP 695)
 try:  # pragma: no cover - import guard
     from typing import TypeAliasType  # type: ignore
@@ -26,7 +34,8 @@ def is_list(annotation):
 
 
 def full_class_name(cls):
-    return f"{cls.__module__}.{cls.__qualname__}"
+    # interned: the same id is stored on nodes, links and in every index lookup
+    return sys.intern(f"{cls.__module__}.{cls.__qualname__}")
 
 
 def is_base_entity_subclass(schema, entity_class_names: set[str] | None = None) -> bool:
@@ -49,122 +58,161 @@ def is_base_entity_subclass(schema, entity_class_names: set[str] | None = None)
     return schema_full_name in entity_class_names
 
 
-def get_core_types(tp):
-    """
-    - get the core type
-    - always return a tuple of core types
+TYPE_CACHE_SIZE = 4096
+
+
+class _IdentityMemo:
     """
-    # Helpers
-    def _unwrap_alias(t):
-        """Unwrap PEP 695 type aliases by following __value__ repeatedly."""
-        while isinstance(t, TypeAliasType) or (
-            t.__class__.__name__ == 'TypeAliasType' and hasattr(t, '__value__')
-        ):
-            try:
-                t = t.__value__
-            except Exception:  # pragma: no cover - defensive
-                break
-        return t
+    Bounded memo of a one-argument function keyed by argument identity.
 
-    def _enqueue(items, q):
-        for it in items:
-            if it is not type(None):  # skip None in unions
-                q.append(it)
+    Annotations are not keyed by equality: ``X | None == Optional[X]`` holds, yet their
+    names differ. Identity also covers unhashable annotations. Each entry keeps its
+    argument alive so the id cannot be reused while cached, the oldest entry is evicted
+    once ``maxsize`` is reached.
+    """
 
+    def __init__(self, func: Callable[[Any], T], maxsize: int = TYPE_CACHE_SIZE):
+        self.func = func
+        self.maxsize = maxsize
+        self._data: dict[int, tuple[Any, T]] = {}
+
+    def __call__(self, arg) -> T:
+        entry = self._data.get(id(arg))
+        if entry is not None and entry[0] is arg:
+            return entry[1]
+        value = self.func(arg)
+        if len(self._data) >= self.maxsize:
+            try:
+                self._data.pop(next(iter(self._data)), None)
+            except (StopIteration, RuntimeError):  # pragma: no cover - concurrent eviction
+                pass
+        self._data[id(arg)] = (arg, value)
+        return value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+_NoneType = type(None)
+
+_ORIGIN_NAMES = {
+    list: 'List',
+    dict: 'Dict',
+    set: 'Set',
+    tuple: 'Tuple',
+    frozenset: 'FrozenSet',
+}
+
+
+def _unwrap_alias(t):
+    """Unwrap PEP 695 type aliases by following __value__ repeatedly."""
+    while isinstance(t, TypeAliasType) or (
+        t.__class__.__name__ == 'TypeAliasType' and hasattr(t, '__value__')
+    ):
+        try:
+            t = t.__value__
+        except Exception:  # pragma: no cover - defensive
+            break
+    return t
+
+
+def _get_core_types(tp) -> tuple:
     # Queue-based shelling to reach concrete core types
-    queue: list[object] = [tp]
+    queue = deque((tp,))
     result: list[object] = []
 
     while queue:
-        cur = queue.pop(0)
-        if cur is type(None):
+        cur = queue.popleft()
+        if cur is _NoneType:
             continue
 
         cur = _unwrap_alias(cur)
+        orig = get_origin(cur)
 
         # Handle Annotated[T, ...] as a shell
-        if get_origin(cur) is Annotated:
+        if orig is Annotated:
             args = get_args(cur)
             if args:
                 queue.append(args[0])
-            continue
 
-        # Handle Union / Optional / PEP 604 UnionType
-        orig = get_origin(cur)
-        if orig in (Union, UnionType):
-            args = get_args(cur)
-            # push all non-None members back for further shelling
-            _enqueue(args, queue)
-            continue
+        # Handle Union / Optional / PEP 604 UnionType, skip None members
+        elif orig is Union or orig is UnionType:
+            queue.extend(a for a in get_args(cur) if a is not _NoneType)
 
         # Handle list shells
-        if is_list(cur):
+        elif is_list(cur):
             args = getattr(cur, "__args__", ())
             if args:
                 queue.append(args[0])
-            continue
-
-        # If still an alias-like wrapper, unwrap again and re-process
-        _cur2 = _unwrap_alias(cur)
-        if _cur2 is not cur:
-            queue.append(_cur2)
-            continue
 
         # Otherwise treat as a concrete core type (could be a class, typing.Final, etc.)
-        result.append(cur)
+        else:
+            result.append(cur)
 
     return tuple(result)
 
 
-def get_type_name(anno):
-    def name_of(tp):
-        origin = get_origin(tp)
-        args = get_args(tp)
-
-        # Annotated[T, ...] -> T
-        if origin is Annotated:
-            return name_of(args[0]) if args else 'Annotated'
-
-        # Union / Optional
-        if origin is Union:
-            non_none = [a for a in args if a is not type(None)]
-            if len(non_none) == 1 and len(args) == 2:
-                return f"Optional[{name_of(non_none[0])}]"
-            return f"Union[{', '.join(name_of(a) for a in args)}]"
-
-        # Parametrized generics
-        if origin is not None:
-            origin_name_map = {
-                list: 'List',
-                dict: 'Dict',
-                set: 'Set',
-                tuple: 'Tuple',
-                frozenset: 'FrozenSet',
-            }
-            origin_name = origin_name_map.get(origin)
-            if origin_name is None:
-                origin_name = getattr(origin, '__name__', None) or str(origin).replace('typing.', '')
-            if args:
-                return f"{origin_name}[{', '.join(name_of(a) for a in args)}]"
-            return origin_name
+_core_types_memo = _IdentityMemo(_get_core_types)
+
+
+def get_core_types(tp):
+    """
+    - get the core type
+    - always return a tuple of core types
+    - memoized per annotation object
+    """
+    return _core_types_memo(tp)
+
+
+def _get_type_name(tp) -> str:
+    origin = get_origin(tp)
+    args = get_args(tp)
+
+    # Annotated[T, ...] -> T
+    if origin is Annotated:
+        return get_type_name(args[0]) if args else 'Annotated'
+
+    # Union / Optional
+    if origin is Union:
+        non_none = [a for a in args if a is not _NoneType]
+        if len(non_none) == 1 and len(args) == 2:
+            return f"Optional[{get_type_name(non_none[0])}]"
+        return f"Union[{', '.join(get_type_name(a) for a in args)}]"
+
+    # Parametrized generics
+    if origin is not None:
+        origin_name = _ORIGIN_NAMES.get(origin)
+        if origin_name is None:
+            origin_name = getattr(origin, '__name__', None) or str(origin).replace('typing.', '')
+        if args:
+            return f"{origin_name}[{', '.join(get_type_name(a) for a in args)}]"
+        return origin_name
+
+    # Non-generic leaf types
+    if tp is Any:
+        return 'Any'
+    if tp is None or tp is _NoneType:
+        return 'None'
+    if isinstance(tp, type):
+        return tp.__name__
 
-        # Non-generic leaf types
-        if tp is Any:
-            return 'Any'
-        if tp is None or tp is type(None):
-            return 'None'
-        if isinstance(tp, type):
-            return tp.__name__
+    # ForwardRef
+    fwd = getattr(tp, '__forward_arg__', None) or getattr(tp, 'arg', None)
+    if fwd:
+        return str(fwd)
 
-        # ForwardRef
-        fwd = getattr(tp, '__forward_arg__', None) or getattr(tp, 'arg', None)
-        if fwd:
-            return str(fwd)
+    # Fallback clean string
+    return str(tp).replace('typing.', '').replace('<class ', '').replace('>', '').replace("'", '')
 
-        # Fallback clean string
-        return str(tp).replace('typing.', '').replace('<class ', '').replace('>', '').replace("'", '')
 
-    return name_of(anno)
+_type_name_memo = _IdentityMemo(_get_type_name)
+
+
+def get_type_name(anno) -> str:
+    """Readable name of an annotation, memoized per annotation object."""
+    return _type_name_memo(anno)
 
 
 def is_inheritance_of_pydantic_base(cls):
@@ -180,6 +228,79 @@ def get_bases_fields(schemas: list[type[BaseModel]]) -> set[str]:
     return fields
 
 
+class _ClassMemo:
+    """Extraction results of one model class, valid while its ``model_fields`` is unchanged."""
+    __slots__ = ('fields_id', 'values')
+
+    def __init__(self, fields_id: int):
+        # id() rather than a reference: model_fields holds annotations that may point back
+        # at the class itself, which would keep the weak key alive forever.
+        self.fields_id = fields_id
+        self.values: dict[Hashable, Any] = {}
+
+
+_class_memo: weakref.WeakKeyDictionary[type, _ClassMemo] = weakref.WeakKeyDictionary()
+_class_memo_lock = threading.Lock()
+
+
+def class_memo(schema: type[BaseModel], key: Hashable, factory: Callable[[], T]) -> T:
+    """
+    Process-wide memo of per-class extraction results.
+
+    Entries are weakly keyed by the class, so dynamically created models are not kept
+    alive, and dropped when ``schema.model_fields`` is replaced (``model_rebuild`` resolving
+    forward refs, ...). Cached values are shared and must be treated as read-only.
+    """
+    fields_id = id(schema.model_fields)
+    memo = _class_memo.get(schema)
+    if memo is None or memo.fields_id != fields_id:
+        with _class_memo_lock:
+            memo = _class_memo.get(schema)
+            if memo is None or memo.fields_id != fields_id:
+                memo = _ClassMemo(fields_id)
+                try:
+                    _class_memo[schema] = memo
+                except TypeError:  # pragma: no cover - not weak-referenceable, skip caching
+                    return factory()
+    try:
+        return memo.values[key]
+    except KeyError:
+        value = memo.values[key] = factory()
+        return value
+
+
+def clear_class_memo() -> None:
+    """Drop all memoized per-class extraction results."""
+    with _class_memo_lock:
+        _class_memo.clear()
+
+
+@dataclass(frozen=True)
+class FieldRecord:
+    """Framework independent facts about one pydantic field, see `get_field_records`."""
+    name: str
+    type_name: str
+    is_object: bool
+    is_exclude: bool
+    desc: str
+
+
+def get_field_records(schema: type[BaseModel]) -> tuple[FieldRecord, ...]:
+    """Extract the fields of ``schema`` once, shared by route graph and ER diagram."""
+    return class_memo(schema, 'records', lambda: tuple(
+        FieldRecord(
+            name=k,
+            type_name=get_type_name(v.annotation),
+            is_object=any(
+                is_inheritance_of_pydantic_base(t) for t in get_core_types(v.annotation) if t
+            ),
+            is_exclude=bool(v.exclude),
+            desc=v.description or '',
+        )
+        for k, v in schema.model_fields.items()
+    ))
+
+
 def get_pydantic_fields(schema: type[BaseModel], bases_fields: set[str]) -> list[FieldInfo]:
     """Extract pydantic model fields with metadata.
 
@@ -189,26 +310,24 @@ def get_pydantic_fields(schema: type[BaseModel], bases_fields: set[str]) -> list
 
     Returns:
         A list of FieldInfo objects describing the schema's direct fields.
+        The FieldInfo objects are memoized per class and shared, do not mutate them.
     """
 
-    def _is_object(anno):  # internal helper, previously a method on Analytics
-        _types = get_core_types(anno)
-        return any(is_inheritance_of_pydantic_base(t) for t in _types if t)
+    def _build() -> list[FieldInfo]:
+        return [
+            FieldInfo(
+                is_object=r.is_object,
+                name=r.name,
+                from_base=r.name in bases_fields,
+                type_name=r.type_name,
+                is_exclude=r.is_exclude,
+                desc=r.desc,
+                **analysis_pydantic_resolve_fields(schema, r.name)
+            )
+            for r in get_field_records(schema)
+        ]
 
-    fields: list[FieldInfo] = []
-    for k, v in schema.model_fields.items():
-        anno = v.annotation
-        pydantic_resolve_specific_params = analysis_pydantic_resolve_fields(schema, k)
-        fields.append(FieldInfo(
-            is_object=_is_object(anno),
-            name=k,
-            from_base=k in bases_fields,
-            type_name=get_type_name(anno),
-            is_exclude=bool(v.exclude),
-            desc=v.description or '',
-            **pydantic_resolve_specific_params
-        ))
-    return fields
+    return list(class_memo(schema, ('pydantic_fields', frozenset(bases_fields)), _build))
 
 
 def get_vscode_link(kls, online_repo_url: str | None = None) -> str:
@@ -269,29 +388,44 @@ def safe_issubclass(kls, target_kls):
         return False
 
 
-def update_forward_refs(kls):
-    # TODO: refactor
-    def update_pydantic_forward_refs(pydantic_kls: type[BaseModel]):
-        """
-        recursively update refs.
-        """
+_resolved_types: weakref.WeakSet[type] = weakref.WeakSet()
+
+
+def _is_resolved(tp) -> bool:
+    try:
+        return tp in _resolved_types
+    except TypeError:  # unhashable annotation
+        return False
 
-        pydantic_kls.model_rebuild()
-        setattr(pydantic_kls, const.PYDANTIC_FORWARD_REF_UPDATED, True)
 
-        values = pydantic_kls.model_fields.values()
-        for field in values:
-            update_forward_refs(field.annotation)
-        
-    for shelled_type in get_core_types(kls):
-        # Only treat as updated if the flag is set on the class itself, not via inheritance
+def update_forward_refs(*types):
+    """
+    Resolve forward refs of every pydantic model reachable from ``types``.
 
-        local_attrs = getattr(shelled_type, '__dict__', {})
-        if local_attrs.get(const.PYDANTIC_FORWARD_REF_UPDATED, False):
-            logger.debug("%s visited", shelled_type.__qualname__)
+    Walks the core types of the given annotations, then the field annotations, pydantic
+    bases and ensure_subset references of each model found. Every model is rebuilt at most
+    once per process and remembered in a weak registry, so calls on already resolved
+    models return without touching ``model_rebuild`` or walking annotations again.
+    """
+    stack = list(types)
+    while stack:
+        tp = stack.pop()
+        if _is_resolved(tp):
             continue
-        if safe_issubclass(shelled_type, BaseModel):
-            update_pydantic_forward_refs(shelled_type)
+        for shelled_type in get_core_types(tp):
+            if _is_resolved(shelled_type) or not safe_issubclass(shelled_type, BaseModel):
+                continue
+            # Only treat as updated if the flag is set on the class itself, not via inheritance
+            if not shelled_type.__dict__.get(const.PYDANTIC_FORWARD_REF_UPDATED, False):
+                shelled_type.model_rebuild()
+                setattr(shelled_type, const.PYDANTIC_FORWARD_REF_UPDATED, True)
+            _resolved_types.add(shelled_type)
+
+            stack.extend(field.annotation for field in shelled_type.model_fields.values())
+            stack.extend(b for b in shelled_type.__bases__ if is_inheritance_of_pydantic_base(b))
+            subset_reference = getattr(shelled_type, const.ENSURE_SUBSET_REFERENCE, None)
+            if subset_reference is not None:
+                stack.append(subset_reference)
 
 
 def is_generic_container(cls):
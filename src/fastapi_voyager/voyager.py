@@ -1,14 +1,17 @@
 
+import sys
+from collections.abc import Iterator
+
 import pydantic_resolve.constant as const
 from pydantic import BaseModel
 
 from fastapi_voyager.filter import (
-    filter_graph,
     filter_subgraph_by_module_prefix,
     filter_subgraph_from_tag_to_schema_by_module_prefix,
 )
+from fastapi_voyager.graph import GraphIndex, GraphSnapshot, GraphView
 from fastapi_voyager.introspectors import AppIntrospector, RouteInfo
-from fastapi_voyager.render import Renderer
+from fastapi_voyager.render import RenderCache, Renderer
 from fastapi_voyager.type import PK, CoreData, FieldType, Link, LinkType, Route, SchemaNode, Tag
 from fastapi_voyager.type_helper import (
     full_class_name,
@@ -38,6 +41,7 @@ class Voyager:
             show_pydantic_resolve_meta: bool = False,
             theme_color: str | None = None,
             entity_class_names: set[str] | None = None,
+            render_cache: RenderCache | None = None,
         ):
 
         self.routes: list[Route] = []
@@ -63,6 +67,12 @@ class Voyager:
         self.show_pydantic_resolve_meta = show_pydantic_resolve_meta
         self.theme_color = theme_color
         self.entity_class_names = entity_class_names
+        self.render_cache = render_cache
+
+        # per-request projection of the analyzed graph, replaced by load_index, empty until
+        # an app is analyzed so every render path works on an empty graph
+        self.view: GraphView
+        self.load_index(GraphIndex(GraphSnapshot(tags=[], routes=[], nodes=[], links=[])))
 
     def _get_introspector(self, app) -> AppIntrospector:
         """
@@ -96,6 +106,15 @@ class Voyager:
             app: A web application instance (FastAPI, Django Ninja API, etc.)
                   or an AppIntrospector instance for custom frameworks.
 
+        The whole app is analyzed first (see `collect_snapshot`), then `include_tags`,
+        `route_name` and `hide_primitive_route` are applied by `load_snapshot`.
+        """
+        self.load_snapshot(self.collect_snapshot(app))
+
+    def collect_snapshot(self, app) -> GraphSnapshot:
+        """
+        Analyze every route of the app, ignoring view filters.
+
         1. get routes which return pydantic schema
             1.1 collect tags and routes, add links tag-> route
             1.2 collect response_model and links route -> response_model
@@ -105,6 +124,9 @@ class Voyager:
         introspector = self._get_introspector(app)
         schemas: list[type[BaseModel]] = []
 
+        self.routes, self.nodes, self.links, self.tags = [], [], [], []
+        self.node_set, self.link_set, self.tag_set = {}, set(), {}
+
         # First, group all routes by tag
         routes_by_tag: dict[str, list[RouteInfo]] = {}
         for route_info in introspector.get_routes():
@@ -112,31 +134,13 @@ class Voyager:
             route_tag = route_info.tags[0] if route_info.tags else '__default__'
             routes_by_tag.setdefault(route_tag, []).append(route_info)
 
-        # Then filter by include_tags if provided
-        if self.include_tags:
-            filtered_routes_by_tag = {
-                tag: routes
-                for tag, routes in routes_by_tag.items()
-                if tag in self.include_tags
-            }
-        else:
-            filtered_routes_by_tag = routes_by_tag
-
-        # Process filtered routes
-        for route_tag, route_infos in filtered_routes_by_tag.items():
-            tag_id = f'tag__{route_tag}'
+        for route_tag, route_infos in routes_by_tag.items():
+            tag_id = sys.intern(f'tag__{route_tag}')
             tag_obj = Tag(id=tag_id, name=route_tag, routes=[])
             self.tags.append(tag_obj)
 
             for route_info in route_infos:
-                # filter by route_name (route.id) if provided
-                if self.route_name is not None and route_info.id != self.route_name:
-                    continue
-
                 is_primitive_response = is_non_pydantic_type(route_info.response_model)
-                # filter primitive route if needed
-                if self.hide_primitive_route and is_primitive_response:
-                    continue
 
                 self.links.append(
                     Link(
@@ -160,6 +164,7 @@ class Voyager:
                     unique_id=unique_id,
                     response_schema=get_type_name(route_info.response_model),
                     is_primitive=is_primitive_response,
+                    path=(route_info.extra or {}).get('path') or '',
                 )
                 self.routes.append(route_obj)
                 tag_obj.routes.append(route_obj)
@@ -167,7 +172,6 @@ class Voyager:
                 # add response_models and create links from route -> response_model
                 for schema in get_core_types(route_info.response_model):
                     if schema and safe_issubclass(schema, BaseModel):
-                        is_primitive_response = False
                         target_name = full_class_name(schema)
                         self.links.append(
                             Link(
@@ -181,11 +185,46 @@ class Voyager:
 
                         schemas.append(schema)
 
+        # resolve forward refs of every reachable model in one pass, the per-schema
+        # calls in analysis_schemas then only hit the resolved-types registry
+        update_forward_refs(*schemas)
         for s in schemas:
             self.analysis_schemas(s)
 
         self.nodes = list(self.node_set.values())
 
+        return GraphSnapshot(
+            tags=self.tags,
+            routes=self.routes,
+            nodes=self.nodes,
+            links=self.links,
+            node_set=self.node_set,
+        )
+
+    def load_snapshot(self, snapshot: GraphSnapshot):
+        """Index an unfiltered snapshot and project it into this voyager's view."""
+        self.load_index(GraphIndex(snapshot))
+
+    def load_index(self, index: GraphIndex):
+        """
+        Project a prebuilt GraphIndex into this voyager's view.
+
+        Keeps tags in include_tags, routes matching route_name / hide_primitive_route and
+        the schema nodes reachable from them, see `GraphView`.
+        """
+        self.view = GraphView(
+            index,
+            include_tags=self.include_tags,
+            route_name=self.route_name,
+            hide_primitive_route=self.hide_primitive_route,
+        )
+        self.tags = self.view.tags
+        self.routes = self.view.routes
+        self.nodes = self.view.nodes
+        self.links = self.view.links
+        self.node_set = self.view.node_set
+        self.tag_set = {t.id: t for t in self.tags}
+
 
     def add_to_node_set(self, schema):
         """
@@ -301,18 +340,10 @@ class Voyager:
 
 
     def generate_node_head(self, link_name: str):
-        return f'{link_name}::{PK}'
+        return sys.intern(f'{link_name}::{PK}')
 
     def dump_core_data(self):
-        _tags, _routes, _nodes, _links = filter_graph(
-            schema=self.schema,
-            schema_field=self.schema_field,
-            tags=self.tags,
-            routes=self.routes,
-            nodes=self.nodes,
-            links=self.links,
-            node_set=self.node_set,
-        )
+        _tags, _routes, _nodes, _links = self.view.filter(self.schema, self.schema_field)
         return CoreData(
             tags=_tags,
             routes=_routes,
@@ -330,31 +361,24 @@ class Voyager:
             return tags, routes, links
     
     def calculate_filtered_tag_and_route(self):
-        _tags, _routes, _, _ = filter_graph(
-            schema=self.schema,
-            schema_field=self.schema_field,
-            tags=self.tags,
-            routes=self.routes,
-            nodes=self.nodes,
-            links=self.links,
-            node_set=self.node_set,
-        )
+        # without field pruning, the routes are the precomputed upstream routes of the schema
+        route_ids = None if self.schema_field else self.view.routes_reaching(self.schema)
+        if route_ids is not None:
+            _tags = [t for t in self.view.tags if any(r.id in route_ids for r in t.routes)]
+        else:
+            _tags, _routes, _, _ = self.view.filter(self.schema, self.schema_field)
+            route_ids = {r.id for r in _routes}
         # filter tag.routes based by _routes
-        route_ids = {r.id for r in _routes}
         for t in _tags:
             t.routes = [r for r in t.routes if r.id in route_ids]
         return _tags
 
     def render_dot(self):
-        _tags, _routes, _nodes, _links = filter_graph(
-            schema=self.schema,
-            schema_field=self.schema_field,
-            tags=self.tags,
-            routes=self.routes,
-            nodes=self.nodes,
-            links=self.links,
-            node_set=self.node_set,
-        )
+        return ''.join(self.render_dot_stream())
+
+    def render_dot_stream(self) -> Iterator[str]:
+        """Render the filtered graph as DOT chunks, see `Renderer.render_dot_stream`."""
+        _tags, _routes, _nodes, _links = self.view.filter(self.schema, self.schema_field)
 
         renderer = Renderer(
             show_fields=self.show_fields,
@@ -362,22 +386,18 @@ class Voyager:
             schema=self.schema,
             show_module=self.show_module,
             show_pydantic_resolve_meta=self.show_pydantic_resolve_meta,
-            theme_color=self.theme_color)
+            theme_color=self.theme_color,
+            cache=self.render_cache)
 
         _tags, _routes, _links = self.handle_hide(_tags, _routes, _links)
-        return renderer.render_dot(_tags, _routes, _nodes, _links)
+        return renderer.render_dot_stream(_tags, _routes, _nodes, _links)
 
 
     def render_tag_level_brief_dot(self, module_prefix: str | None = None):
-        _tags, _routes, _nodes, _links = filter_graph(
-            schema=self.schema,
-            schema_field=self.schema_field,
-            tags=self.tags,
-            routes=self.routes,
-            nodes=self.nodes,
-            links=self.links,
-            node_set=self.node_set,
-        )
+        return ''.join(self.render_tag_level_brief_dot_stream(module_prefix))
+
+    def render_tag_level_brief_dot_stream(self, module_prefix: str | None = None) -> Iterator[str]:
+        _tags, _routes, _nodes, _links = self.view.filter(self.schema, self.schema_field)
 
         _tags, _routes, _nodes, _links = filter_subgraph_by_module_prefix(
             module_prefix=module_prefix,
@@ -392,21 +412,17 @@ class Voyager:
             module_color=self.module_color,
             schema=self.schema,
             show_module=self.show_module,
-            theme_color=self.theme_color)
+            theme_color=self.theme_color,
+            cache=self.render_cache)
 
         _tags, _routes, _links = self.handle_hide(_tags, _routes, _links)
-        return renderer.render_dot(_tags, _routes, _nodes, _links, True)
+        return renderer.render_dot_stream(_tags, _routes, _nodes, _links, True)
 
     def render_overall_brief_dot(self, module_prefix: str | None = None):
-        _tags, _routes, _nodes, _links = filter_graph(
-            schema=self.schema,
-            schema_field=self.schema_field,
-            tags=self.tags,
-            routes=self.routes,
-            nodes=self.nodes,
-            links=self.links,
-            node_set=self.node_set,
-        )
+        return ''.join(self.render_overall_brief_dot_stream(module_prefix))
+
+    def render_overall_brief_dot_stream(self, module_prefix: str | None = None) -> Iterator[str]:
+        _tags, _routes, _nodes, _links = self.view.filter(self.schema, self.schema_field)
 
         _tags, _routes, _nodes, _links = filter_subgraph_from_tag_to_schema_by_module_prefix(
             module_prefix=module_prefix,
@@ -421,7 +437,8 @@ class Voyager:
             module_color=self.module_color,
             schema=self.schema,
             show_module=self.show_module,
-            theme_color=self.theme_color)
+            theme_color=self.theme_color,
+            cache=self.render_cache)
 
         _tags, _routes, _links = self.handle_hide(_tags, _routes, _links)
-        return renderer.render_dot(_tags, _routes, _nodes, _links, True)
\ No newline at end of file
+        return renderer.render_dot_stream(_tags, _routes, _nodes, _links, True)
\ No newline at end of file
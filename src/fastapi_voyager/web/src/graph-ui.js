@@ -423,6 +423,11 @@ export class GraphUI {
 
   async render(dotSrc, resetZoom = true) {
     const height = this.options.height || "100%"
+    if (!this.graphviz) {
+      // previous graph came from renderSvg, start d3-graphviz afresh
+      d3.select(this.selector).selectAll("*").remove()
+      this.graphviz = d3.select(this.selector).graphviz().zoom(false)
+    }
     // Save current zoom transform before re-render
     let savedTransform = null
     if (!resetZoom) {
@@ -464,4 +469,34 @@ export class GraphUI {
       }
     })
   }
+
+  // Show an SVG already laid out by the server (POST dot-layout), skipping the
+  // in-browser Graphviz layout. Interactions are the same as after render().
+  async renderSvg(svgText, resetZoom = true) {
+    const height = this.options.height || "100%"
+    const previousSvg = document.querySelector(`${this.selector} svg`)
+    const savedTransform = !resetZoom && previousSvg ? d3.zoomTransform(previousSvg) : null
+
+    // d3-graphviz state refers to the replaced DOM, render() recreates it
+    const container = d3.select(this.selector)
+    delete container.node().__graphviz__
+    this.graphviz = null
+
+    container.html(svgText)
+    const svg = container.select("svg").attr("width", "100%").attr("height", height)
+    const graph = svg.select("g.graph")
+    const baseTransform = graph.attr("transform") || ""
+    const zoom = d3
+      .zoom()
+      .scaleExtent([0, Infinity])
+      .on("zoom", (event) => graph.attr("transform", `${event.transform} ${baseTransform}`))
+    svg.call(zoom)
+    if (savedTransform) {
+      svg.call(zoom.transform, savedTransform)
+    }
+
+    $(this.selector).data("graphviz.svg").setup()
+    this._restoreHighlight()
+    this._initMagnifyingGlass()
+  }
 }
@@ -7,6 +7,7 @@ const state = reactive({
     initial_page_policy: "first",
     has_er_diagram: false,
     enable_pydantic_resolve_meta: false,
+    server_layout: false,
   },
 
   mode: "voyager", // voyager / er-diagram
@@ -67,6 +68,8 @@ const state = reactive({
     fieldName: null,
     schemaOptions: [],
     fieldOptions: [],
+    // sequence number of the latest GET /search, older responses are dropped
+    querySeq: 0,
   },
 
   allSchemaOptions: [],
@@ -185,7 +188,33 @@ const actions = {
     state.leftPanel.tags = state.leftPanel.fullTagsCache
   },
 
-  populateFieldOptions(schemaId) {
+  // GET /dot lists schemas without fields, fetch them for the given ids on first use
+  async loadSchemaDetails(schemaIds) {
+    const dict = state.graph.schemaMap || {}
+    const missing = schemaIds.filter((id) => dict[id] && !Array.isArray(dict[id].fields))
+    if (missing.length === 0) {
+      return
+    }
+    try {
+      const res = await fetch("schemas", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ schema_ids: missing }),
+      })
+      if (res.ok) {
+        const data = await res.json()
+        for (const schema of data.schemas || []) {
+          if (dict[schema.id]) {
+            Object.assign(dict[schema.id], schema)
+          }
+        }
+      }
+    } catch (err) {
+      console.error("schema details failed", err)
+    }
+  },
+
+  async populateFieldOptions(schemaId) {
     if (!schemaId) {
       state.search.fieldOptions = []
       state.search.fieldName = null
@@ -197,6 +226,11 @@ const actions = {
       state.search.fieldName = null
       return
     }
+    await this.loadSchemaDetails([schemaId])
+    if (state.search.schemaName !== schemaId) {
+      // another schema was picked while loading
+      return
+    }
     const fieldNames = Array.isArray(schema.fields) ? schema.fields.map((f) => f.name) : []
     state.search.fieldOptions = fieldNames.map((f) => ({ label: f, value: f }))
     if (!fieldNames.includes(state.search.fieldName)) {
@@ -215,6 +249,33 @@ const actions = {
     this.populateFieldOptions(state.search.schemaName)
   },
 
+  // schema options matching the typed text, ranked by the server side search index
+  async searchSchemas(query) {
+    const seq = ++state.search.querySeq
+    const text = (query || "").trim()
+    if (!text) {
+      state.search.schemaOptions = state.allSchemaOptions.slice()
+      return
+    }
+    try {
+      const params = new URLSearchParams({ q: text, kinds: "schema", limit: "50" })
+      const res = await fetch(`search?${params}`)
+      if (!res.ok || seq !== state.search.querySeq) {
+        return
+      }
+      const data = await res.json()
+      if (seq !== state.search.querySeq) {
+        return
+      }
+      state.search.schemaOptions = (data.hits || []).map((h) => ({
+        label: `${h.label} (${h.id})`,
+        value: h.id,
+      }))
+    } catch (err) {
+      console.error("schema search failed", err)
+    }
+  },
+
   async loadSearchedTags() {
     try {
       const payload = {
@@ -265,6 +326,7 @@ const actions = {
       state.swagger.url = data.swagger_url || null
       state.config.has_er_diagram = data.has_er_diagram || false
       state.config.enable_pydantic_resolve_meta = data.enable_pydantic_resolve_meta || false
+      state.config.server_layout = data.server_layout || false
       state.framework_name = data.framework_name || "API"
 
       this.rebuildSchemaOptions()
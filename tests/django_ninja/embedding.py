@@ -36,12 +36,15 @@ async def application(scope, receive, send):
 
     This is a simple router that:
     - Sends /voyager/* requests to the voyager UI
+    - Sends the lifespan events to voyager, Django's ASGI handler does not take them
     - Sends everything else to Django
 
     For production, you might want to use Django's URL routing instead.
     """
-    # Route /voyager/* to voyager_app
-    if scope["type"] == "http" and scope["path"].startswith("/voyager"):
+    # Route /voyager/* and the lifespan events to voyager_app
+    if scope["type"] == "lifespan" or (
+        scope["type"] == "http" and scope["path"].startswith("/voyager")
+    ):
         return await voyager_asgi_app(scope, receive, send)
     else:
         # Pass everything else to Django's ASGI application
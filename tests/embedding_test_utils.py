@@ -20,6 +20,20 @@ EXPECTED_ROUTES = [
     "get_page_test_3_no_response_model_long_long_long_name",
 ]
 
+# Top-level keys of the GET /dot response, identical across frameworks
+EXPECTED_DOT_KEYS = {
+    "tags",
+    "schemas",
+    "enable_brief_mode",
+    "version",
+    "initial_page_policy",
+    "swagger_url",
+    "has_er_diagram",
+    "enable_pydantic_resolve_meta",
+    "framework_name",
+    "server_layout",
+}
+
 
 async def test_dot_endpoint_returns_success(async_client: httpx.AsyncClient):
     """Test that /voyager/dot endpoint returns 200 OK."""
@@ -27,6 +41,13 @@ async def test_dot_endpoint_returns_success(async_client: httpx.AsyncClient):
     assert response.status_code == 200
 
 
+async def test_dot_endpoint_keys(async_client: httpx.AsyncClient):
+    """Test that /voyager/dot returns exactly the expected top-level keys."""
+    response = await async_client.get("/voyager/dot")
+    assert response.status_code == 200
+    assert set(response.json()) == EXPECTED_DOT_KEYS
+
+
 async def test_dot_endpoint_has_tags(async_client: httpx.AsyncClient):
     """Test that /voyager/dot endpoint returns tags data."""
     response = await async_client.get("/voyager/dot")
@@ -105,9 +126,9 @@ async def test_dot_endpoint_other_fields(async_client: httpx.AsyncClient, expect
     # Check other required fields
     assert "schemas" in data
     assert isinstance(data["schemas"], list)
-
-    assert "dot" in data
-    assert isinstance(data["dot"], str)
+    # schemas are listed without fields, the first graph comes from POST /dot
+    assert all(set(s) == {"id", "name", "module"} for s in data["schemas"])
+    assert "dot" not in data
 
     assert "version" in data
     assert isinstance(data["version"], str)
@@ -145,3 +166,94 @@ async def test_dot_endpoint_expected_routes(
     # Check expected routes
     for expected_route in expected_routes:
         assert expected_route in all_routes, f"Expected route '{expected_route}' not found"
+
+
+async def test_dot_endpoint_etag(async_client: httpx.AsyncClient):
+    """Test that GET /voyager/dot carries an ETag and honors If-None-Match."""
+    response = await async_client.get("/voyager/dot")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('"')
+
+    cached = await async_client.get("/voyager/dot", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    stale = await async_client.get("/voyager/dot", headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.json() == response.json()
+
+
+async def test_filtered_dot_endpoint_etag(async_client: httpx.AsyncClient):
+    """Test that POST /voyager/dot ETags depend on the payload and honor If-None-Match."""
+    payload = {"tags": ["for-ui-page"], "show_fields": "object"}
+    response = await async_client.post("/voyager/dot", json=payload)
+    assert response.is_success  # Litestar answers POST with 201
+    etag = response.headers["etag"]
+
+    cached = await async_client.post("/voyager/dot", json=payload, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    other = await async_client.post(
+        "/voyager/dot", json={**payload, "show_fields": "all"}, headers={"If-None-Match": etag}
+    )
+    assert other.is_success
+    assert other.headers["etag"] != etag
+    assert other.text != response.text
+
+
+async def test_layout_endpoint_without_server_layout(async_client: httpx.AsyncClient):
+    """Test that POST /voyager/dot-layout reports unavailable layout, the UI lays out itself."""
+    response = await async_client.get("/voyager/dot")
+    assert response.json()["server_layout"] is False
+
+    layout = await async_client.post("/voyager/dot-layout", json={"tags": ["for-ui-page"]})
+    assert layout.status_code == 503
+    assert "error" in layout.json()
+
+
+async def test_schema_details_endpoint(async_client: httpx.AsyncClient):
+    """Test that POST /voyager/schemas returns fields of the requested schemas only."""
+    schemas = (await async_client.get("/voyager/dot")).json()["schemas"]
+    ids = [s["id"] for s in schemas[:2]]
+
+    response = await async_client.post(
+        "/voyager/schemas", json={"schema_ids": [*ids, "missing.Schema"]}
+    )
+    assert response.is_success
+    details = response.json()["schemas"]
+    assert [s["id"] for s in details] == ids
+    assert all(isinstance(s["fields"], list) for s in details)
+    assert all({"name", "type_name", "is_object"} <= set(f) for s in details for f in s["fields"])
+
+
+async def test_search_endpoint(async_client: httpx.AsyncClient):
+    """Test that GET /voyager/search returns ranked hits of the requested kinds."""
+    schemas = (await async_client.get("/voyager/dot")).json()["schemas"]
+    name = schemas[0]["name"]
+
+    params = {"q": name, "kinds": "schema", "limit": 5}
+    response = await async_client.get("/voyager/search", params=params)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["query"] == name
+    assert 0 < len(data["hits"]) <= 5
+    assert all(h["kind"] == "schema" for h in data["hits"])
+    assert data["hits"][0]["label"].lower() == name.lower()
+    assert {"kind", "id", "label", "detail"} == set(data["hits"][0])
+
+    response = await async_client.get("/voyager/search", params={"q": ""})
+    assert response.status_code == 200
+    assert response.json()["hits"] == []
+
+
+async def test_stats_endpoint(async_client: httpx.AsyncClient):
+    """Test that GET /voyager/stats reports the offload pool and warm-up duration."""
+    await async_client.get("/voyager/dot")
+    response = await async_client.get("/voyager/stats")
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {"offload", "warmup_seconds"}
+    assert set(data["offload"]) == {"max_workers", "running", "queued", "completed"}
+    assert data["offload"]["max_workers"] == 2
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from fastapi_voyager.batch import MANIFEST_NAME, parse_spec, render_views
+from fastapi_voyager.er_diagram import VoyagerErDiagram
+from fastapi_voyager.voyager import Voyager
+
+SPEC = {
+    'module_color': {'tests.service': 'tomato'},
+    'views': [
+        {'name': 'all'},
+        {'name': 'ui', 'tags': ['for-ui-page'], 'show_fields': 'all'},
+        {'name': 'product', 'schema': 'tests.service.schema.dto.product.Product'},
+        {
+            'name': 'ui-brief',
+            'tags': ['for-ui-page'],
+            'brief': True,
+            'module_prefix': 'tests.service',
+        },
+        {'name': 'er', 'er_diagram': 'tests.service.schema.schema:diagram', 'show_fields': 'all'},
+    ],
+}
+
+
+def _expected(app, **kwargs) -> str:
+    voyager = Voyager(module_color=SPEC['module_color'], **kwargs)
+    voyager.analysis(app)
+    return voyager.render_dot()
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_render_views_matches_single_renders(tmp_path, workers):
+    from tests.fastapi.demo import app
+    from tests.service.schema.schema import diagram
+
+    manifest = render_views(app, parse_spec(SPEC), tmp_path, workers=workers)
+
+    assert [v['name'] for v in manifest['views']] == [v['name'] for v in SPEC['views']]
+    assert json.loads((tmp_path / MANIFEST_NAME).read_text()) == manifest
+
+    def read(name):
+        return (tmp_path / f'{name}.dot').read_text()
+
+    assert read('all') == _expected(app)
+    assert read('ui') == _expected(app, include_tags=['for-ui-page'], show_fields='all')
+    assert read('product') == _expected(app, schema='tests.service.schema.dto.product.Product')
+    brief = Voyager(module_color=SPEC['module_color'], include_tags=['for-ui-page'])
+    brief.analysis(app)
+    assert read('ui-brief') == brief.render_tag_level_brief_dot(module_prefix='tests.service')
+    assert read('er') == VoyagerErDiagram(diagram, show_fields='all').render_dot()
+
+
+def test_parse_spec_rejects_bad_views():
+    with pytest.raises(ValueError, match='duplicated'):
+        parse_spec([{'name': 'a'}, {'name': 'a'}])
+    with pytest.raises(ValueError, match='view name'):
+        parse_spec([{'name': '../a'}])
+    with pytest.raises(ValueError, match='unknown options'):
+        parse_spec([{'name': 'a', 'tag': ['x']}])
+    with pytest.raises(ValueError, match='no views'):
+        parse_spec({'views': []})
@@ -52,6 +52,12 @@ async def test_dot_endpoint_returns_success(async_client: httpx.AsyncClient):
     await embedding_test_utils.test_dot_endpoint_returns_success(async_client)
 
 
+@pytest.mark.asyncio
+async def test_dot_endpoint_keys(async_client: httpx.AsyncClient):
+    """Test that /voyager/dot returns exactly the expected keys."""
+    await embedding_test_utils.test_dot_endpoint_keys(async_client)
+
+
 @pytest.mark.asyncio
 async def test_dot_endpoint_has_tags(async_client: httpx.AsyncClient):
     """Test that /voyager/dot endpoint returns tags data."""
@@ -80,3 +86,39 @@ async def test_dot_endpoint_expected_routes(async_client: httpx.AsyncClient, exp
 async def test_dot_endpoint_other_fields(async_client: httpx.AsyncClient, expected_framework_name: str):
     """Test other required fields in /dot response."""
     await embedding_test_utils.test_dot_endpoint_other_fields(async_client, expected_framework_name)
+
+
+@pytest.mark.asyncio
+async def test_dot_endpoint_etag(async_client: httpx.AsyncClient):
+    """Test GET /dot ETag and conditional request handling."""
+    await embedding_test_utils.test_dot_endpoint_etag(async_client)
+
+
+@pytest.mark.asyncio
+async def test_filtered_dot_endpoint_etag(async_client: httpx.AsyncClient):
+    """Test POST /dot ETag and conditional request handling."""
+    await embedding_test_utils.test_filtered_dot_endpoint_etag(async_client)
+
+
+@pytest.mark.asyncio
+async def test_layout_endpoint_without_server_layout(async_client: httpx.AsyncClient):
+    """Test POST /dot-layout when server-side layout is not enabled."""
+    await embedding_test_utils.test_layout_endpoint_without_server_layout(async_client)
+
+
+@pytest.mark.asyncio
+async def test_schema_details_endpoint(async_client: httpx.AsyncClient):
+    """Test POST /schemas returns schema fields on demand."""
+    await embedding_test_utils.test_schema_details_endpoint(async_client)
+
+
+@pytest.mark.asyncio
+async def test_search_endpoint(async_client: httpx.AsyncClient):
+    """Test GET /search returns ranked schema matches."""
+    await embedding_test_utils.test_search_endpoint(async_client)
+
+
+@pytest.mark.asyncio
+async def test_stats_endpoint(async_client: httpx.AsyncClient):
+    """Test GET /stats reports offload pool usage."""
+    await embedding_test_utils.test_stats_endpoint(async_client)
@@ -134,3 +134,58 @@ def test_filter_subgraph_handles_cycles_and_multiple_matches():
 
     assert all(lk.type in {"tag_route", "route_to_schema"} for lk in filtered_links)
     assert len(filtered_links) == 3  # 1 tag_route + 2 merged links
+
+
+def test_filter_graph_prunes_parent_links_by_schema_field():
+    from fastapi_voyager.filter import filter_graph
+    from fastapi_voyager.graph import GraphIndex, GraphSnapshot
+    from fastapi_voyager.type import FieldInfo
+
+    def _node(name: str, *fields: str) -> SchemaNode:
+        return SchemaNode(
+            id=f"pkg.{name}", name=name, module="pkg",
+            fields=[FieldInfo(name=f, type_name="int") for f in fields],
+        )
+
+    def _link(source: str, target: str, type: str) -> Link:
+        return Link(
+            source=source, source_origin=source, target=target, target_origin=target, type=type
+        )
+
+    tag = Tag(id="tag1", name="Tag 1", routes=[])
+    route_b = Route(id="route_b", name="route_b", module="api")
+    route_c = Route(id="route_c", name="route_c", module="api")
+    tag.routes.extend([route_b, route_c])
+
+    node_a = _node("A", "x")
+    node_b = _node("B", "x", "y")
+    node_c = _node("C", "y")
+    nodes = [node_a, node_b, node_c]
+    links = [
+        _link(tag.id, route_b.id, "tag_route"),
+        _link(tag.id, route_c.id, "tag_route"),
+        _link(route_b.id, node_b.id, "route_to_schema"),
+        _link(route_c.id, node_c.id, "route_to_schema"),
+        _link(node_b.id, node_a.id, "parent"),
+        _link(node_c.id, node_a.id, "subset"),
+    ]
+    graph = dict(tags=[tag], routes=[route_b, route_c], nodes=nodes, links=links,
+                 node_set={n.id: n for n in nodes})
+    index = GraphIndex(GraphSnapshot(**graph))
+
+    for prebuilt in (None, index):
+        _tags, _routes, _nodes, _links = filter_graph(
+            schema=node_a.id, schema_field="x", index=prebuilt, **graph
+        )
+        assert [t.id for t in _tags] == [tag.id]
+        assert [r.id for r in _routes] == [route_b.id]
+        assert [n.id for n in _nodes] == [node_a.id, node_b.id]
+        assert [lk.type for lk in _links] == ["tag_route", "route_to_schema", "parent"]
+
+        _, _routes, _nodes, _ = filter_graph(
+            schema=node_a.id, schema_field=None, index=prebuilt, **graph
+        )
+        assert [r.id for r in _routes] == [route_b.id, route_c.id]
+        assert [n.id for n in _nodes] == [node_a.id, node_b.id, node_c.id]
+
+    assert index.nodes_with_field("y") == {node_b.id, node_c.id}
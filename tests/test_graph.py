@@ -0,0 +1,357 @@
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from fastapi_voyager.adapters.common import VoyagerContext
+from fastapi_voyager.render import Renderer
+from fastapi_voyager.voyager import Voyager
+
+
+class B(BaseModel):
+    id: int
+
+
+class A(BaseModel):
+    id: int
+    b: B
+
+
+class C(BaseModel):
+    id: int
+
+
+def _make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/a", tags=["ta"], response_model=A)
+    def get_a():
+        return None
+
+    @app.get("/c", tags=["tc"], response_model=C)
+    def get_c():
+        return None
+
+    @app.get("/n", tags=["tc"], response_model=int)
+    def get_n():
+        return 1
+
+    return app
+
+
+def test_load_snapshot_matches_filtered_analysis():
+    app = _make_app()
+    snapshot = Voyager().collect_snapshot(app)
+    assert len(snapshot.nodes) == 3
+
+    voyager = Voyager(include_tags=["ta"])
+    voyager.load_snapshot(snapshot)
+    assert [t.name for t in voyager.tags] == ["ta"]
+    assert {n.name for n in voyager.nodes} == {"A", "B"}
+    assert {lk.type for lk in voyager.links} == {"tag_route", "route_to_schema", "schema"}
+
+    voyager = Voyager(include_tags=["tc"], hide_primitive_route=True)
+    voyager.load_snapshot(snapshot)
+    assert [r.name for r in voyager.routes] == ["get_c"]
+    assert [n.name for n in voyager.nodes] == ["C"]
+
+    # projected tags are copies, the snapshot is left untouched
+    voyager.tags[0].routes.clear()
+    assert len(snapshot.tags[1].routes) == 2
+
+
+def test_voyager_without_analysis_renders_empty_graph():
+    voyager = Voyager(schema="missing.Schema", include_tags=["ta"])
+    assert voyager.calculate_filtered_tag_and_route() == []
+    assert voyager.dump_core_data().tags == []
+    dot = voyager.render_dot()
+    assert dot.startswith("digraph world {") and "->" not in dot
+    voyager.render_tag_level_brief_dot()
+    voyager.render_overall_brief_dot()
+
+
+def test_context_caches_snapshot_until_invalidated():
+    app = _make_app()
+    ctx = VoyagerContext(app)
+
+    snapshot = ctx.get_snapshot()
+    ctx.get_filtered_dot({"tags": ["ta"]})
+    ctx.get_search_dot({"schema_name": f"{B.__module__}.{B.__qualname__}"})
+    assert ctx.get_snapshot() is snapshot
+
+    @app.get("/b", tags=["tb"], response_model=B)
+    def get_b():
+        return None
+
+    assert "tb" not in [t.name for t in ctx.get_option_param()["tags"]]
+    ctx.invalidate_snapshot()
+    assert ctx.get_snapshot() is not snapshot
+    assert "tb" in [t.name for t in ctx.get_option_param()["tags"]]
+
+
+def _ids(result):
+    # order sensitive: graphviz lays out nodes and clusters in declaration order
+    tags, routes, nodes, links = result
+    return (
+        [t.id for t in tags],
+        [r.id for r in routes],
+        [n.id for n in nodes],
+        [(lk.source, lk.target, lk.type) for lk in links],
+    )
+
+
+def _app_with_tags(app: FastAPI, tags: list[str]) -> FastAPI:
+    """A new app with only the routes of ``tags``."""
+    filtered = FastAPI()
+    filtered.router.routes = [
+        r for r in app.routes if set(getattr(r, "tags", None) or ()) & set(tags)
+    ]
+    return filtered
+
+
+def test_graph_view_keeps_filtered_analysis_order():
+    from fastapi_voyager.graph import GraphIndex, GraphView
+    from tests.fastapi.demo import app as demo_app
+
+    index = GraphIndex(Voyager().collect_snapshot(demo_app))
+    last, rest = [index.tags[-1].name], [t.name for t in index.tags[1:]]
+    for tags in (["graphql", "for-ui-page"], last, rest):
+        expected = Voyager().collect_snapshot(_app_with_tags(demo_app, tags))
+        expected_graph = (expected.tags, expected.routes, expected.nodes, expected.links)
+        view = GraphView(index, include_tags=tags)
+        view_graph = (view.tags, view.routes, view.nodes, view.links)
+        assert _ids(view_graph) == _ids(expected_graph)
+        # renders byte-identical to an analysis of only these routes
+        assert Renderer().render_dot(*view_graph) == Renderer().render_dot(*expected_graph)
+
+
+def test_graph_view_filter_matches_filter_graph():
+    from fastapi_voyager.filter import filter_graph
+    from fastapi_voyager.graph import GraphIndex, GraphView
+    from tests.fastapi.demo import app as demo_app
+
+    index = GraphIndex(Voyager().collect_snapshot(demo_app))
+
+    for include_tags in (None, [index.tags[0].name]):
+        view = GraphView(index, include_tags=include_tags)
+        for node in index.nodes:
+            for field in (None, "id", "name"):
+                expected = filter_graph(
+                    schema=node.id,
+                    schema_field=field,
+                    tags=view.tags,
+                    routes=view.routes,
+                    nodes=view.nodes,
+                    links=view.links,
+                    node_set=view.node_set,
+                )
+                assert _ids(view.filter(node.id, field)) == _ids(expected)
+
+
+def test_route_reachability_matches_filter():
+    from fastapi_voyager.graph import GraphIndex, GraphView
+    from tests.fastapi.demo import app as demo_app
+
+    index = GraphIndex(Voyager().collect_snapshot(demo_app))
+    assert index.route_reachability is not None
+
+    for options in ({}, {"include_tags": [index.tags[0].name]}, {"hide_primitive_route": True}):
+        view = GraphView(index, **options)
+        for node in view.nodes:
+            _, routes, _, _ = view.filter(node.id)
+            reaching = view.routes_reaching(node.id)
+            assert reaching is not None
+            assert {r.id for r in view.routes} & reaching == {r.id for r in routes}
+
+
+def test_route_reachability_through_cycles_and_memory_bound():
+    from fastapi_voyager.graph import GraphIndex, RouteReachability
+
+    class Tree(BaseModel):
+        id: int
+        children: list["Tree"] = []
+        b: B | None = None
+
+    app = _make_app()
+
+    @app.get("/tree", tags=["tt"], response_model=Tree)
+    def get_tree():
+        return None
+
+    index = GraphIndex(Voyager().collect_snapshot(app))
+    tree_id = f"{Tree.__module__}.{Tree.__qualname__}"
+    b_id = f"{B.__module__}.{B.__qualname__}"
+    reachability = index.route_reachability
+    assert {index.route_map[r].name for r in reachability.route_ids(tree_id)} == {"get_tree"}
+    assert {index.route_map[r].name for r in reachability.route_ids(b_id)} == {"get_a", "get_tree"}
+    assert reachability.nbytes > 0
+
+    assert RouteReachability.build(index, max_bytes=0) is None
+
+    voyager = Voyager(schema=b_id)
+    voyager.load_index(index)
+    tags = voyager.calculate_filtered_tag_and_route()
+    routes_by_tag = [(t.name, [r.name for r in t.routes]) for t in tags]
+    assert routes_by_tag == [("ta", ["get_a"]), ("tt", ["get_tree"])]
+
+
+def test_graph_index_adjacency_by_link_type():
+    from fastapi_voyager.graph import GraphIndex
+
+    index = GraphIndex(Voyager().collect_snapshot(_make_app()))
+    a_id = f"{A.__module__}.{A.__qualname__}"
+    b_id = f"{B.__module__}.{B.__qualname__}"
+
+    [pos] = index.out_links(a_id, ("schema",))
+    assert index.links[pos].target_origin == b_id
+    assert [index.links[p].source_origin for p in index.in_links(b_id)] == [a_id]
+    assert [r.name for r in index.tag_by_name["tc"].routes] == ["get_c", "get_n"]
+
+
+def test_render_cache_is_dropped_with_snapshot():
+    from fastapi_voyager.render import RenderCache
+
+    ctx = VoyagerContext(_make_app())
+    ctx.get_filtered_dot({"show_fields": "all"})
+    cache = ctx.get_index().cached("render_cache", RenderCache)
+    assert len(cache) > 0
+
+    ctx.invalidate_snapshot()
+    assert ctx.get_index().cached("render_cache", RenderCache) is not cache
+
+
+def test_etag_follows_snapshot_content_and_params():
+    from fastapi_voyager.adapters.common import etag_matches
+
+    app = _make_app()
+    ctx = VoyagerContext(app)
+
+    etag = ctx.get_etag("GET /dot")
+    dot = ctx.get_filtered_dot({"tags": ["ta"]})
+    dot_etag = ctx.get_filtered_dot_etag({"tags": ["ta"]})
+    # responses are reused per etag, defaults do not change the etag
+    assert ctx.get_filtered_dot({"tags": ["ta"], "show_fields": "object"}) is dot
+    assert ctx.get_filtered_dot_etag({"tags": ["ta"], "brief": False}) == dot_etag
+    assert ctx.get_filtered_dot_etag({"tags": ["tc"]}) != dot_etag
+
+    # re-analysis of an unchanged app keeps the etag
+    ctx.invalidate_snapshot()
+    assert ctx.get_etag("GET /dot") == etag
+
+    @app.get("/b", tags=["tb"], response_model=B)
+    def get_b():
+        return None
+
+    ctx.invalidate_snapshot()
+    assert ctx.get_etag("GET /dot") != etag
+
+    assert etag_matches(f'"x", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"x"', etag)
+
+
+def test_streamed_dot_matches_and_fills_response_cache():
+    from fastapi_voyager.adapters import common
+
+    ctx = VoyagerContext(_make_app())
+    payload = {"tags": ["ta"], "show_fields": "all"}
+    expected = ctx._render_filtered_dot(ctx.get_filtered_dot_params(payload))
+
+    assert "".join(ctx.stream_filtered_dot(payload)) == expected
+    # fully consumed, so the next request is answered from the response cache
+    assert ctx.get_filtered_dot(payload) == expected
+    assert list(ctx.stream_filtered_dot(payload)) == [ctx.get_filtered_dot(payload)]
+
+    limit, common.STREAM_CACHE_LIMIT = common.STREAM_CACHE_LIMIT, 10
+    try:
+        payload = {"tags": ["tc"]}
+        "".join(ctx.stream_filtered_dot(payload))
+        assert ctx._response_cache().get(ctx.get_filtered_dot_etag(payload)) is None
+    finally:
+        common.STREAM_CACHE_LIMIT = limit
+
+
+def test_warmup_builds_graph_in_background_after_host_startup():
+    from contextlib import asynccontextmanager
+
+    from fastapi.testclient import TestClient
+
+    from fastapi_voyager import create_voyager
+
+    started_before_host = []
+
+    @asynccontextmanager
+    async def lifespan(app):
+        started_before_host.append(ctx._warmup_thread is not None)
+        yield
+
+    app = _make_app()
+    app.router.lifespan_context = lifespan
+    voyager_app = create_voyager(app, warmup=True)
+    ctx = voyager_app.state.voyager_context
+    # nothing runs before the host app starts
+    assert ctx._warmup_thread is None
+
+    with TestClient(app):
+        assert started_before_host == [False]
+        # requests wait for the running warm-up and reuse its result
+        data = ctx.get_option_param()
+        assert ctx.warmup_seconds is not None and ctx.warmup_seconds > 0
+        assert ctx.get_option_param() is data
+        assert [t.name for t in data["tags"]] == ["ta", "tc"]
+
+
+def test_warmup_follows_litestar_and_django_ninja_startup():
+    import asyncio
+
+    from litestar import Litestar, get
+    from litestar.testing import TestClient
+
+    from fastapi_voyager import create_voyager
+    from tests.django_ninja.embedding import api
+
+    @get("/ping", sync_to_thread=False)
+    def ping() -> str:
+        return "pong"
+
+    host = Litestar(route_handlers=[ping])
+    ctx = create_voyager(host, warmup=True).state.voyager_context
+    assert ctx._warmup_thread is None
+    with TestClient(host):
+        ctx.wait_for_warmup()
+        assert ctx.warmup_seconds is not None
+
+    voyager_asgi_app = create_voyager(api, warmup=True)
+    ctx = voyager_asgi_app.voyager_context
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        pass
+
+    assert ctx._warmup_thread is None
+    asyncio.run(voyager_asgi_app({"type": "lifespan"}, receive, send))
+    ctx.wait_for_warmup()
+    assert ctx.warmup_seconds is not None
+
+
+def test_context_without_warmup_builds_on_first_request():
+    ctx = VoyagerContext(_make_app())
+    ctx.wait_for_warmup()
+    assert ctx.warmup_seconds is None
+    assert ctx.get_option_param()["schemas"]
+
+
+def test_warmup_prerenders_initial_view():
+    ctx = VoyagerContext(_make_app())
+    payload = ctx.initial_view_payload()
+    assert payload == {"tags": ["ta"], "show_fields": "object", "show_module": False}
+    ctx.warmup()
+    assert ctx._response_cache().get(ctx.get_filtered_dot_etag(payload)) is not None
+    index = ctx.get_index()
+    assert index.route_reachability is index.build_reachability() is not None
+
+    full = VoyagerContext(_make_app(), initial_page_policy="full")
+    assert full.initial_view_payload()["tags"] is None
+    assert VoyagerContext(_make_app(), initial_page_policy="empty").initial_view_payload() is None
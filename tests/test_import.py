@@ -1,3 +1,75 @@
+import subprocess
+import sys
+
+# framework and rendering dependencies only the code paths using them may import
+HEAVY_MODULES = (
+    'fastapi', 'starlette', 'litestar', 'django', 'ninja', 'jinja2', 'pydantic_resolve'
+)
+
+# prelude of a script running `voyager --help`
+CLI_HELP = 'import sys\nfrom fastapi_voyager.cli import main\nsys.argv = ["voyager", "--help"]\n'
+
+# microseconds of import time, measured by `python -X importtime`, ~10x the current cost
+IMPORT_BUDGET_US = 50_000
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_us(importtime: str, module: str) -> int:
+    """Cumulative import time of ``module`` from `-X importtime` output."""
+    for line in importtime.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f'{module} not imported')
+
+
+def _loaded(code: str) -> set[str]:
+    probe = f'{code}\nimport sys\nprint("modules:", " ".join(sys.modules))'
+    line = _run(probe).stdout.rsplit('modules:', 1)[1]
+    return {m.split('.')[0] for m in line.split()}
+
+
 def test_import():
     import fastapi_voyager as pkg
     assert hasattr(pkg, "__version__")
+
+
+def test_create_voyager_is_lazy():
+    import fastapi_voyager as pkg
+    from fastapi_voyager.server import create_voyager
+    assert pkg.create_voyager is create_voyager
+
+
+def test_import_does_not_load_frameworks():
+    assert not _loaded('import fastapi_voyager') & set(HEAVY_MODULES)
+
+
+def test_cli_help_does_not_load_frameworks():
+    code = CLI_HELP + 'try:\n    main()\nexcept SystemExit:\n    pass'
+    assert not _loaded(code) & set(HEAVY_MODULES)
+
+
+def test_import_time_budget():
+    result = _run('import fastapi_voyager')
+    assert _cumulative_us(result.stderr, 'fastapi_voyager') < IMPORT_BUDGET_US
+
+
+def test_cli_help_import_time_budget():
+    result = _run(CLI_HELP + 'main()')
+    assert 'usage: voyager' in result.stdout
+    # `voyager --help` imports the package and the cli module, argparse is stdlib
+    cost = (
+        _cumulative_us(result.stderr, 'fastapi_voyager')
+        + _cumulative_us(result.stderr, 'fastapi_voyager.cli')
+    )
+    assert cost < IMPORT_BUDGET_US
@@ -0,0 +1,84 @@
+import shutil
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from fastapi_voyager import create_voyager
+from fastapi_voyager.layout import LayoutEngine, LayoutError, ServerLayout
+
+
+class FakeEngine(LayoutEngine):
+    name = 'fake'
+
+    def __init__(self):
+        self.calls = []
+
+    def layout(self, dot: str, fmt: str) -> str:
+        self.calls.append((dot, fmt))
+        return f'<svg>{len(dot)}</svg>'
+
+
+class A(BaseModel):
+    id: int
+
+
+def _make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/a", tags=["ta"], response_model=A)
+    def get_a():
+        return None
+
+    return app
+
+
+def test_layout_is_cached_by_dot_content(tmp_path):
+    engine = FakeEngine()
+    layout = ServerLayout(engine, cache_dir=tmp_path)
+
+    svg = layout.layout('digraph { a -> b }')
+    assert layout.layout('digraph { a -> b }') == svg
+    assert layout.layout('digraph { a -> b }', 'json') == svg
+    layout.layout('digraph { a -> c }')
+    assert len(engine.calls) == 3
+
+    # a new process with the same cache dir reads the layout from disk
+    restarted = ServerLayout(FakeEngine(), cache_dir=tmp_path)
+    assert restarted.layout('digraph { a -> b }') == svg
+    assert restarted.engine.calls == []
+
+    with pytest.raises(ValueError):
+        layout.layout('digraph {}', 'png')
+
+
+def test_layout_without_engine_raises(monkeypatch):
+    monkeypatch.setattr('fastapi_voyager.layout.find_layout_engine', lambda: None)
+    layout = ServerLayout()
+    assert not layout.available
+    with pytest.raises(LayoutError):
+        layout.layout('digraph {}')
+
+
+def test_layout_endpoint_serves_svg():
+    engine = FakeEngine()
+    client = TestClient(create_voyager(_make_app(), server_layout=ServerLayout(engine)))
+
+    assert client.get('/dot').json()['server_layout'] is True
+
+    response = client.post('/dot-layout', json={'tags': ['ta']})
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'image/svg+xml'
+    assert response.text == engine.layout(client.post('/dot', json={'tags': ['ta']}).text, 'svg')
+
+    cached = client.post(
+        '/dot-layout', json={'tags': ['ta']}, headers={'If-None-Match': response.headers['etag']}
+    )
+    assert cached.status_code == 304
+
+
+@pytest.mark.skipif(shutil.which('dot') is None, reason='Graphviz dot is not installed')
+def test_dot_binary_layout():
+    svg = ServerLayout().layout('digraph { a -> b }')
+    assert '<svg' in svg
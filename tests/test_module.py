@@ -1,4 +1,4 @@
-from fastapi_voyager.module import build_module_schema_tree
+from fastapi_voyager.module import ModuleColorTrie, assign_module_colors, build_module_schema_tree
 from fastapi_voyager.type import SchemaNode
 
 
@@ -104,4 +104,52 @@ def test_collapse_single_child_empty_modules():
     # collapsed node under b is named "c.d"
     x = _find_child(a, "x")
     assert x is not None
-    assert [sn.name for sn in x.schema_nodes] == ["Peer"]
\ No newline at end of file
+    assert [sn.name for sn in x.schema_nodes] == ["Peer"]
+
+def test_build_module_tree_flat_and_deep_packages():
+    # thousands of sibling modules under one package keep their insertion order
+    flat = [_sn(f"S{i}", f"pkg.m{i}", f"S{i}") for i in range(3000)]
+    [pkg] = build_module_schema_tree(flat + [_sn("Again", "pkg.m7", "Again")])
+    assert [m.name for m in pkg.modules[:3]] == ["m0", "m1", "m2"]
+    assert [sn.name for sn in _find_child(pkg, "m7").schema_nodes] == ["S7", "Again"]
+
+    # branching at every level, deeper than the recursion limit
+    parts = [f"p{i}" for i in range(2000)]
+    deep = [_sn(f"D{i}", ".".join(parts[: i + 1]), f"D{i}") for i in range(len(parts))]
+    [top] = build_module_schema_tree(deep)
+    depth = 0
+    node = top
+    while node.modules:
+        [node] = node.modules
+        depth += 1
+    assert depth == len(parts) - 1
+    assert node.fullname == ".".join(parts)
+
+
+def test_module_color_trie_longest_prefix():
+    colors = ModuleColorTrie(
+        {"pkg": "red", "pkg.sub": "blue", "pkg.su": "green", "other.x": "gray"}
+    )
+    assert colors.match("pkg") == "red"
+    assert colors.match("pkg.other") == "red"
+    assert colors.match("pkg.sub.deep") == "blue"
+    assert colors.match("pkg.sup") == "green"
+    assert colors.match("other") is None
+    assert colors.match("unknown") is None
+    assert ModuleColorTrie({}).match("pkg") is None
+
+
+def test_assign_module_colors_on_every_module():
+    schema_nodes = [
+        _sn("A", "pkg.a", "A"),
+        _sn("B", "pkg.b.inner", "B"),
+        _sn("C", "pkg.c", "C"),
+        _sn("D", "x", "D"),
+    ]
+    top_modules = assign_module_colors(
+        build_module_schema_tree(schema_nodes), ModuleColorTrie({"pkg.a": "red", "pkg.b": "blue"})
+    )
+    pkg = _find_top(top_modules, "pkg")
+    assert pkg.color is None
+    assert {m.name: m.color for m in pkg.modules} == {"a": "red", "b.inner": "blue", "c": None}
+    assert _find_top(top_modules, "x").color is None
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+
+import pytest
+
+from fastapi_voyager.adapters.common import Offloader
+
+
+@pytest.mark.asyncio
+async def test_offloader_runs_off_loop_with_bounded_concurrency():
+    offloader = Offloader(max_workers=2)
+    loop_thread = threading.current_thread()
+    release = threading.Event()
+    started: list[threading.Thread] = []
+
+    def work(i: int) -> int:
+        started.append(threading.current_thread())
+        release.wait(5)
+        return i * 2
+
+    tasks = [asyncio.create_task(offloader.run(work, i)) for i in range(5)]
+    for _ in range(100):
+        if len(started) == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    # the loop stays responsive, two calls run, the rest queue
+    stats = offloader.stats()
+    assert stats["running"] == 2
+    assert stats["queued"] == offloader.queue_depth == 3
+
+    release.set()
+    assert await asyncio.gather(*tasks) == [0, 2, 4, 6, 8]
+    assert loop_thread not in started
+    assert offloader.stats() == {"max_workers": 2, "running": 0, "queued": 0, "completed": 5}
+    offloader.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_offloader_propagates_errors():
+    offloader = Offloader(max_workers=1)
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await offloader.run(fail)
+    assert offloader.stats()["completed"] == 1
+    offloader.shutdown()
+
+
+def test_litestar_voyager_follows_offload_workers_and_host_shutdown():
+    from litestar import Litestar, get
+    from litestar.testing import TestClient
+
+    from fastapi_voyager import create_voyager
+
+    @get("/ping", sync_to_thread=False)
+    def ping() -> str:
+        return "pong"
+
+    host = Litestar(route_handlers=[ping])
+    ctx = create_voyager(host, offload_workers=3).state.voyager_context
+    assert ctx.offloader.max_workers == 3
+
+    with TestClient(host):
+        assert asyncio.run(ctx.run_blocking(sum, [1, 2])) == 3
+        assert ctx.offloader._executor is not None
+    # the host's shutdown event stops the offload threads
+    assert ctx.offloader._executor is None
+
+
+@pytest.mark.asyncio
+async def test_django_ninja_voyager_stops_offload_threads_on_lifespan_shutdown():
+    from tests.django_ninja.embedding import voyager_asgi_app
+
+    ctx = voyager_asgi_app.voyager_context
+    await ctx.run_blocking(sum, [1, 2])
+    assert ctx.offloader._executor is not None
+
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    await voyager_asgi_app({"type": "lifespan"}, receive, send)
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert ctx.offloader._executor is None
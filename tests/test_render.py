@@ -0,0 +1,228 @@
+import pytest
+
+from fastapi_voyager.render import FAST_TEMPLATES, Renderer, TemplateRenderer
+from fastapi_voyager.voyager import Voyager
+
+TEMPLATE_CONTEXTS = {
+    'dot/cluster.j2': [
+        dict(cluster_id='c', tooltip='t', border_color='#666', label='l', content='x',
+             pen_color=pen_color, pen_width=pen_width)
+        for pen_color, pen_width in (('red', 3), (None, None), ('red', None))
+    ],
+    'dot/cluster_container.j2': [
+        dict(name='n', label='l', content='x', border_color='#666', margin='18', fontsize='20'),
+    ],
+    'dot/digraph.j2': [
+        dict(pad='0.5', nodesep='0.8', spline=spline, font='f', node_fontsize='16',
+             tags_cluster='t', routes_cluster='r', schemas_cluster='s', links='l')
+        for spline in ('', 'line')
+    ],
+    'dot/er_diagram.j2': [
+        dict(pad='0.5', nodesep='0.8', spline=spline, font='f', node_fontsize='16',
+             er_cluster='e', links='l')
+        for spline in (None, 'line')
+    ],
+    'dot/link.j2': [dict(source='"a":f', target='"b"', attributes='style="solid"')],
+    'dot/route_node.j2': [dict(id='r', name='n', response_schema='A', margin='0.5,0.1')],
+    'dot/schema_node.j2': [dict(id='s', label='<x>', margin='0.5,0.1')],
+    'dot/tag_node.j2': [dict(id='t', name='n', margin='0.5,0.1')],
+    'html/colored_text.j2': [
+        dict(text='a: int', color='#000'),
+        dict(text='a: int', color='#000', strikethrough=True),
+    ],
+    'html/pydantic_meta.j2': [dict(meta_parts=[]), dict(meta_parts=['a', 'b'])],
+    'html/schema_field_row.j2': [
+        dict(port='id', align='left', content='x'),
+        dict(port=None, align='left', content='x'),
+        dict(align='left', content='x'),
+    ],
+    'html/schema_header.j2': [
+        dict(text='A', bg_color='#009485', port='PK', is_entity=is_entity)
+        for is_entity in (True, False)
+    ],
+    'html/schema_table.j2': [dict(header='h', rows='r')],
+}
+
+
+def test_every_template_has_fast_builder():
+    assert set(FAST_TEMPLATES) == set(TEMPLATE_CONTEXTS)
+
+
+@pytest.mark.parametrize('template_name', sorted(TEMPLATE_CONTEXTS))
+def test_fast_builder_matches_template(template_name):
+    jinja = TemplateRenderer()
+    for context in TEMPLATE_CONTEXTS[template_name]:
+        expected = jinja.render_template(template_name, **context)
+        assert FAST_TEMPLATES[template_name](**context) == expected
+
+
+@pytest.mark.parametrize('show_fields', ['single', 'object', 'all'])
+@pytest.mark.parametrize('show_pydantic_resolve_meta', [False, True])
+def test_fast_render_dot_is_byte_identical(show_fields, show_pydantic_resolve_meta):
+    from tests.fastapi.demo import app
+
+    voyager = Voyager()
+    voyager.analysis(app)
+
+    outputs = []
+    for fast_render in (False, True):
+        renderer = Renderer(
+            show_fields=show_fields,
+            module_color={'tests.service': 'tomato'},
+            schema=voyager.nodes[0].id,
+            show_pydantic_resolve_meta=show_pydantic_resolve_meta,
+            fast_render=fast_render,
+        )
+        graph = (voyager.tags, voyager.routes, voyager.nodes, voyager.links)
+        outputs.append(renderer.render_dot(*graph))
+    assert outputs[0] == outputs[1]
+
+
+def test_render_cache_is_bounded_lru():
+    from fastapi_voyager.render import RenderCache
+
+    cache = RenderCache(maxsize=2)
+    calls = []
+
+    def render(value):
+        calls.append(value)
+        return value
+
+    assert cache.get_or_render(('a',), lambda: render('a')) == 'a'
+    assert cache.get_or_render(('b',), lambda: render('b')) == 'b'
+    assert cache.get_or_render(('a',), lambda: render('a2')) == 'a'
+    cache.get_or_render(('c',), lambda: render('c'))  # evicts least recently used 'b'
+    assert cache.get_or_render(('b',), lambda: render('b2')) == 'b2'
+    assert calls == ['a', 'b', 'c', 'b2']
+    assert len(cache) == 2
+
+
+def test_cached_renderers_match_uncached_output():
+    from fastapi_voyager.render import RenderCache
+    from tests.fastapi.demo import app
+
+    voyager = Voyager()
+    voyager.analysis(app)
+    graph = (voyager.tags, voyager.routes, voyager.nodes, voyager.links)
+    cache = RenderCache()
+
+    for schema in (None, voyager.nodes[0].id, voyager.nodes[1].id):
+        for show_fields in ('object', 'all'):
+            options = dict(
+                show_fields=show_fields, schema=schema, module_color={'tests.service': 'tomato'}
+            )
+            expected = Renderer(**options).render_dot(*graph)
+            assert Renderer(cache=cache, **options).render_dot(*graph) == expected
+            assert Renderer(cache=cache, **options).render_dot(*graph) == expected
+
+
+def test_module_trees_are_shared_through_render_cache(monkeypatch):
+    from fastapi_voyager import render as render_module
+    from fastapi_voyager.render import RenderCache
+    from tests.fastapi.demo import app
+
+    voyager = Voyager()
+    voyager.analysis(app)
+    graph = (voyager.tags, voyager.routes, voyager.nodes, voyager.links)
+    cache = RenderCache()
+    expected = Renderer().render_dot(*graph)
+
+    built = []
+    original = render_module.build_module_schema_tree
+
+    def counting(nodes):
+        built.append(len(nodes))
+        return original(nodes)
+
+    monkeypatch.setattr(render_module, 'build_module_schema_tree', counting)
+    assert Renderer(cache=cache).render_dot(*graph) == expected
+    assert Renderer(cache=cache).render_dot(*graph) == expected
+    # another node set gets its own tree
+    Renderer(cache=cache).render_dot(*graph[:2], graph[2][:1], [])
+    assert built == [len(graph[2]), 1]
+
+
+def test_render_cache_keeps_module_trees_apart_from_fragments():
+    from fastapi_voyager.render import RENDER_CACHE_SIZE, RenderCache
+    from tests.fastapi.demo import app
+
+    voyager = Voyager()
+    voyager.analysis(app)
+    graph = (voyager.tags, voyager.routes, voyager.nodes, voyager.links)
+
+    # a fragment LRU far smaller than the graph still keeps its module trees and trie
+    cache = RenderCache(maxsize=1, module_tree_size=8)
+    options = dict(module_color={'tests.service': 'tomato'})
+    expected = Renderer(**options).render_dot(*graph)
+    assert Renderer(cache=cache, **options).render_dot(*graph) == expected
+    assert len(cache) == 1
+    trees = len(cache.module_trees)
+    assert trees >= 2
+    assert Renderer(cache=cache, **options).render_dot(*graph) == expected
+    assert len(cache.module_trees) == trees
+
+    assert RenderCache.sized_for(10).maxsize == RENDER_CACHE_SIZE
+    assert RenderCache.sized_for(10 * RENDER_CACHE_SIZE).maxsize > 10 * RENDER_CACHE_SIZE
+
+
+def test_module_color_uses_longest_prefix_for_every_module():
+    from fastapi_voyager.type import SchemaNode
+
+    nodes = [
+        SchemaNode(id=f"pkg.{m}.S{i}", name=f"S{i}", module=f"pkg.{m}")
+        for i, m in enumerate(["a", "b", "a.deep"])
+    ]
+    module_color = {"pkg": "red", "pkg.a": "blue", "pkg.a.deep": "green"}
+    dot = Renderer(module_color=module_color).render_module_schema_content(nodes)
+
+    # every key colors its own cluster, whatever the order of the dict
+    for cluster, color in (("pkg", "red"), ("pkg_a", "blue"), ("pkg_a_deep", "green")):
+        assert f'subgraph cluster_module_{cluster} {{' in dot
+        head = dot.split(f'subgraph cluster_module_{cluster} {{', 1)[1].split('subgraph', 1)[0]
+        assert f'pencolor = "{color}"' in head
+    # pkg.b inherits red from pkg
+    head = dot.split('subgraph cluster_module_pkg_b {', 1)[1].split('subgraph', 1)[0]
+    assert 'pencolor' not in head and 'penwidth = 3' in head
+
+    reordered = dict(reversed(module_color.items()))
+    assert Renderer(module_color=reordered).render_module_schema_content(nodes) == dot
+
+
+def test_module_color_overlapping_keys_pick_the_longest():
+    from tests.fastapi.demo import app
+
+    voyager = Voyager()
+    voyager.analysis(app)
+    nodes = [n for n in voyager.nodes if n.module.startswith('tests.service.schema.dto')]
+
+    # 'tests' also prefixes the dto modules, 'tests.service' is the closer key
+    module_color = {'tests.service': 'red', 'tests': 'blue'}
+    dot = Renderer(module_color=module_color).render_module_schema_content(nodes)
+    dto_cluster = 'subgraph cluster_module_tests_service_schema_dto {'
+    head = dot.split(dto_cluster, 1)[1].split('subgraph', 1)[0]
+    assert 'pencolor = "red"' in head
+    assert 'pencolor = "blue"' not in dot
+
+
+def test_render_dot_stream_matches_render_dot():
+    from tests.fastapi.demo import app
+
+    voyager = Voyager()
+    voyager.analysis(app)
+    graph = (voyager.tags, voyager.routes, voyager.nodes, voyager.links)
+
+    for fast_render in (False, True):
+        for show_module in (False, True):
+            renderer = Renderer(
+                show_fields='all',
+                show_module=show_module,
+                module_color={'tests.service': 'tomato'},
+                fast_render=fast_render,
+            )
+            expected = renderer.render_dot(*graph)
+            chunks = list(renderer.render_dot_stream(*graph, chunk_size=1024))
+            assert ''.join(chunks) == expected
+            assert len(chunks) > 1
+            assert all(len(c) >= 1024 for c in chunks[:-1])
+
+    assert ''.join(voyager.render_dot_stream()) == voyager.render_dot()
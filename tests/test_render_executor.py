@@ -0,0 +1,45 @@
+import pytest
+
+from fastapi_voyager.adapters.common import VoyagerContext
+from fastapi_voyager.render_executor import ProcessPoolRenderExecutor, RenderExecutor
+from tests.fastapi.demo import app
+
+PAYLOADS = [
+    {},
+    {"tags": ["for-ui-page"], "show_fields": "all"},
+    {"tags": ["for-restapi"], "brief": True},
+    {"brief": True},
+]
+
+
+@pytest.fixture(scope="module")
+def process_executor():
+    executor = ProcessPoolRenderExecutor(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+def test_process_pool_executor_matches_inline(process_executor):
+    inline = VoyagerContext(app, module_prefix="tests.service", render_executor=RenderExecutor())
+    pooled = VoyagerContext(app, module_prefix="tests.service", render_executor=process_executor)
+    for payload in PAYLOADS:
+        assert pooled.get_filtered_dot(payload) == inline.get_filtered_dot(payload)
+
+    core_data = inline.get_core_data({"tags": ["for-ui-page"]})
+    expected = inline.render_dot_from_core_data(core_data)
+    assert pooled.render_dot_from_core_data(core_data) == expected
+
+
+def test_process_pool_executor_ships_snapshot_once():
+    executor = ProcessPoolRenderExecutor(max_workers=1)
+    ctx = VoyagerContext(app, render_executor=executor)
+    index = ctx.get_index()
+    ctx.get_filtered_dot({"tags": ["for-ui-page"]})
+    assert "pickled_snapshot" in index._derived
+
+    # a new snapshot with the same content is already loaded in the worker
+    ctx.invalidate_snapshot()
+    index = ctx.get_index()
+    ctx.get_filtered_dot({"tags": ["for-restapi"]})
+    assert "pickled_snapshot" not in index._derived
+    executor.shutdown()
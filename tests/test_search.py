@@ -0,0 +1,88 @@
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from fastapi_voyager.adapters.common import VoyagerContext
+from fastapi_voyager.search import SearchIndex
+from fastapi_voyager.voyager import Voyager
+
+
+class UserProfile(BaseModel):
+    bio: str
+
+
+class User(BaseModel):
+    id: int
+    user_name: str
+    profile: UserProfile
+
+
+class SuperUser(BaseModel):
+    id: int
+    level: int
+
+
+def _make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/users/{user_id}", tags=["user"], response_model=User)
+    def get_user():
+        return None
+
+    @app.get("/admins", tags=["admin"], response_model=list[SuperUser])
+    def list_admins():
+        return None
+
+    return app
+
+
+def _index() -> SearchIndex:
+    return SearchIndex(Voyager().collect_snapshot(_make_app()))
+
+
+def _found(hits) -> list[tuple[str, str]]:
+    return [(h.kind, h.label) for h in hits]
+
+
+def test_ranks_exact_prefix_word_then_substring():
+    hits = _index().search("user", kinds=["schema"])
+    # exact, prefix, then substring of the name
+    assert _found(hits) == [("schema", "User"), ("schema", "UserProfile"), ("schema", "SuperUser")]
+
+
+def test_matches_fields_and_routes():
+    index = _index()
+    hits = index.search("user_name")
+    assert _found(hits) == [("field", "user_name")]
+    assert hits[0].id.endswith(".User")
+    assert hits[0].detail == "User"
+
+    # routes match by path too
+    hits = index.search("/admins")
+    assert _found(hits) == [("route", "list_admins")]
+    assert hits[0].detail == "/admins"
+
+
+def test_short_queries_match_word_starts():
+    index = _index()
+    assert ("route", "list_admins") in _found(index.search("ad"))
+    # "ro" only occurs inside words
+    assert index.search("ro", kinds=["schema"]) == []
+
+
+def test_case_insensitive_limit_and_kinds():
+    index = _index()
+    assert _found(index.search("USERPROFILE", kinds=["schema"])) == [("schema", "UserProfile")]
+    assert len(index.search("user", limit=2)) == 2
+    assert {h.kind for h in index.search("user", kinds=["route", "field"])} <= {"route", "field"}
+    assert index.search("") == []
+    assert index.search("missing") == []
+
+
+def test_context_search_is_cached_per_graph():
+    ctx = VoyagerContext(target_app=_make_app())
+    index = ctx.get_search_index()
+    assert ctx.get_search_index() is index
+    assert _found(ctx.search("super", kinds="schema,unknown")) == [("schema", "SuperUser")]
+    ctx.invalidate_snapshot()
+    assert ctx.get_search_index() is not index
+    assert _found(ctx.search("super", kinds="schema")) == [("schema", "SuperUser")]
@@ -0,0 +1,61 @@
+import os
+
+from fastapi_voyager.cli import generate_visualization
+from fastapi_voyager.snapshot_cache import SnapshotCache, app_fingerprint, load_or_collect_snapshot
+from fastapi_voyager.voyager import Voyager
+
+
+def test_cached_snapshot_renders_like_fresh_analysis(tmp_path):
+    from tests.fastapi.demo import app
+
+    for options in (
+        {},
+        {'include_tags': ['for-ui-page']},
+        {'schema': 'tests.service.schema.dto.product.Product'},
+    ):
+        fresh = Voyager(**options)
+        fresh.analysis(app)
+
+        cached = Voyager(**options)
+        cached.load_snapshot(load_or_collect_snapshot(cached, app, tmp_path))
+        assert cached.render_dot() == fresh.render_dot()
+
+    assert len(list(tmp_path.glob('*.pickle'))) == 1
+
+
+def test_snapshot_cache_skips_analysis_until_sources_change(tmp_path, monkeypatch):
+    from tests.fastapi.demo import app
+
+    voyager = Voyager()
+    snapshot = load_or_collect_snapshot(voyager, app, tmp_path)
+    key = app_fingerprint(voyager, app)
+
+    def fail(self, app):
+        raise AssertionError('analysis should be skipped')
+
+    monkeypatch.setattr(Voyager, 'collect_snapshot', fail)
+    assert load_or_collect_snapshot(Voyager(schema='x'), app, tmp_path).nodes == snapshot.nodes
+
+    # touching a schema module invalidates the entry
+    import tests.service.schema.extra as schema_module
+
+    path = schema_module.__file__
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    try:
+        assert SnapshotCache(tmp_path).load(key) is None
+    finally:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def test_generate_visualization_with_cache_dir(tmp_path):
+    from tests.fastapi.demo import app
+
+    outputs = []
+    for cache_dir in (None, tmp_path / 'cache', tmp_path / 'cache'):
+        output = tmp_path / 'out.dot'
+        generate_visualization(
+            app, str(output), tags=['for-ui-page'], cache_dir=cache_dir and str(cache_dir)
+        )
+        outputs.append(output.read_text())
+    assert outputs[0] == outputs[1] == outputs[2]
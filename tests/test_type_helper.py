@@ -105,3 +105,114 @@ def test_annotated():
     core = get_core_types(Annotated[A, 'hello'])
     assert set(core) == {A}
 
+
+
+def test_field_extraction_is_memoized_per_class():
+    from pydantic import BaseModel
+
+    from fastapi_voyager.er_diagram import get_fields
+    from fastapi_voyager.type_helper import get_field_records, get_pydantic_fields
+
+    class Child(BaseModel):
+        id: int
+
+    class Parent(BaseModel):
+        name: str
+        child: Child | None = None
+
+    records = get_field_records(Parent)
+    assert get_field_records(Parent) is records
+    assert [(r.name, r.is_object) for r in records] == [('name', False), ('child', True)]
+
+    first = get_pydantic_fields(Parent, {'name'})
+    second = get_pydantic_fields(Parent, {'name'})
+    assert first == second and first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    assert [f.from_base for f in first] == [True, False]
+    assert [f.from_base for f in get_pydantic_fields(Parent, set())] == [False, False]
+
+    # ER diagram fields reuse the records, is_object comes from the fk set
+    assert [f.is_object for f in get_fields(Parent, {'name'})] == [True, False]
+    assert [f.is_object for f in get_fields(Parent)] == [False, False]
+
+
+def test_field_memo_invalidated_when_model_fields_replaced():
+    from pydantic import BaseModel
+
+    from fastapi_voyager.type_helper import get_field_records
+
+    class Node(BaseModel):
+        value: 'Later'
+
+    assert get_field_records(Node)[0].is_object is False
+
+    class Later(BaseModel):
+        id: int
+
+    Node.model_rebuild(_types_namespace={'Later': Later})
+    assert get_field_records(Node)[0].type_name == 'Later'
+    assert get_field_records(Node)[0].is_object is True
+
+
+def test_update_forward_refs_rebuilds_each_model_once(monkeypatch):
+    from pydantic import BaseModel
+
+    from fastapi_voyager import type_helper
+
+    class Leaf(BaseModel):
+        id: int
+
+    class Base(BaseModel):
+        leaf: Leaf
+
+    class Root(Base):
+        leaves: list[Leaf] | None = None
+
+    calls: list[str] = []
+    original = BaseModel.model_rebuild.__func__
+
+    def counting_rebuild(cls, *args, **kwargs):
+        calls.append(cls.__name__)
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(BaseModel, 'model_rebuild', classmethod(counting_rebuild))
+
+    type_helper.update_forward_refs(Root | None)
+    assert sorted(calls) == ['Base', 'Leaf', 'Root']
+
+    type_helper.update_forward_refs(Root, Leaf, list[Base])
+    assert len(calls) == 3
+
+
+def test_type_memo_keys_by_identity_not_equality():
+    from typing import Optional
+
+    from fastapi_voyager.type_helper import get_type_name
+
+    class M: ...
+
+    pep604 = M | None
+    typing_optional = Optional[M]  # noqa: UP045
+    assert pep604 == typing_optional
+    assert get_type_name(typing_optional) == 'Optional[M]'
+    assert get_type_name(pep604) == 'UnionType[M, None]'
+    assert get_type_name(typing_optional) == 'Optional[M]'
+
+
+def test_type_memo_handles_unhashable_annotations():
+    class M: ...
+
+    anno = Annotated[list[M], []]
+    with pytest.raises(TypeError):
+        hash(anno)
+    assert get_core_types(anno) == (M,)
+    assert get_core_types(anno) == (M,)
+
+
+def test_identity_memo_is_bounded():
+    from fastapi_voyager.type_helper import _IdentityMemo
+
+    memo = _IdentityMemo(len, maxsize=3)
+    values = [[i] for i in range(5)]  # unhashable, equal lengths
+    assert [memo(v) for v in values] == [1] * 5
+    assert len(memo) == 3